@@ -0,0 +1,6 @@
+"""
+Benchmark Suite for Recruiter-Pro-AI
+Reproducible performance measurements of the matching hot path
+
+Run with `python -m benchmarks.run_benchmarks` (see benchmarks/README.md).
+"""
@@ -0,0 +1,377 @@
+"""
+Matching Hot-Path Benchmarks
+Parse, extract, score, ML inference, DB write, response encoding, /jobs
+filtering, LLM explanation calls and end-to-end /match
+
+Every benchmark shares one `BenchContext` (synthetic catalog, CV files,
+pipeline) so the expensive setup happens once per run.
+"""
+import copy
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+from src.agents.agent1_parser import RawParser
+from src.agents.parse_pool import ParseWorkerPool
+from src.core.job_index import JobFilter, JobIndex
+from src.core.orchestrator import MatchingPipeline, MatchContext
+from src.storage.artifacts import ArtifactSink
+from src.storage.database import Database
+from src.storage.models import CVProfile, JobPosting, MatchResult
+
+from .harness import Case, SkipBenchmark, allocations, benchmark
+from .synthetic import SyntheticData
+
+
+@dataclass
+class BenchContext:
+    """Shared state for one benchmark run"""
+    jobs: List[JobPosting]
+    cv_paths: List[str]
+    cv_texts: List[str]
+    pipeline: MatchingPipeline
+    workdir: Path
+    top_k: int = 10
+    seed: int = 42
+    cvs: List[CVProfile] = field(default_factory=list)
+    
+    @classmethod
+    def create(cls, num_jobs: int, num_cvs: int, seed: int = 42, top_k: int = 10) -> "BenchContext":
+        """Generate data and warm a pipeline (no DB writes)"""
+        data = SyntheticData(seed=seed)
+        workdir = Path(tempfile.mkdtemp(prefix="recruiter_bench_"))
+        ctx = cls(
+            jobs=data.jobs(num_jobs),
+            cv_paths=data.write_cvs(workdir / "cvs", num_cvs),
+            cv_texts=data.cv_texts(num_cvs),
+            pipeline=MatchingPipeline(save_to_db=False),
+            workdir=workdir,
+            top_k=top_k,
+            seed=seed,
+        )
+        ctx.cvs = [ctx.profile_cv(path) for path in ctx.cv_paths]
+        return ctx
+    
+    def match_results(self, count: int) -> List[MatchResult]:
+        """Scored and decided results for the first CV and `count` jobs"""
+        pipeline = self.pipeline
+        cv = self.cvs[0]
+        results = []
+        for job in self.jobs[:count]:
+            score = pipeline.agent3.score_match(cv, job)
+            decision = pipeline._make_decision(score)
+            results.append(pipeline._build_match_result(cv, job, score, decision, None, 0.0))
+        return results
+    
+    def profile_cv(self, path: str) -> CVProfile:
+        """Run the parse and extract stages only"""
+        match_ctx = MatchContext(cv_file_path=path, jobs=[])
+        for name in ("parse", "extract"):
+            self.pipeline.stages[name].run(self.pipeline, match_ctx)
+        return match_ctx.cv
+
+
+@benchmark("parse")
+def bench_parse(ctx: BenchContext) -> Case:
+    """Agent 1: read and clean every CV file"""
+    agent1 = ctx.pipeline.agent1
+    
+    def run():
+        for path in ctx.cv_paths:
+            agent1.parse_file(path)
+    return Case(run, items=len(ctx.cv_paths))
+
+
+@benchmark("parse_pdf")
+def bench_parse_pdf(ctx: BenchContext) -> Case:
+    """Agent 1: in-memory PDF extraction (1-page CV + 40 portfolio pages)"""
+    try:
+        documents = SyntheticData(seed=ctx.seed).pdf_documents(min(len(ctx.cv_paths), 10), filler_pages=40)
+    except ImportError:
+        raise SkipBenchmark("PyMuPDF not installed")
+    agent1 = ctx.pipeline.agent1
+    
+    def run():
+        for data in documents:
+            agent1.extract_text_from_pdf(data)
+    return Case(run, items=len(documents))
+
+
+@benchmark("parse_bulk")
+def bench_parse_bulk(ctx: BenchContext) -> Case:
+    """Agent 1: bulk upload parsed across one worker process per core"""
+    pool = ParseWorkerPool(ctx.pipeline.config.parsing, processes=os.cpu_count() or 1)
+    parser = RawParser(artifact_sink=ArtifactSink(), worker_pool=pool)
+    files = [(Path(path).read_bytes(), Path(path).name) for path in ctx.cv_paths]
+    
+    def run():
+        parser.parse_many(files)
+    return Case(run, items=len(files))
+
+
+@benchmark("extract")
+def bench_extract(ctx: BenchContext) -> Case:
+    """Agent 2: structured extraction from raw CV text"""
+    agent2 = ctx.pipeline.agent2
+    
+    def run():
+        for text in ctx.cv_texts:
+            agent2.extract(text)
+    return Case(run, items=len(ctx.cv_texts))
+
+
+@benchmark("score_one")
+def bench_score_one(ctx: BenchContext) -> Case:
+    """Agent 3: one CV against one job, repeated for a stable per-pair figure"""
+    agent3 = ctx.pipeline.agent3
+    cv, job = ctx.cvs[0], ctx.jobs[0]
+    repeats = 200
+    
+    def run():
+        for _ in range(repeats):
+            agent3.score_match(cv, job)
+    return Case(run, items=repeats)
+
+
+@benchmark("score_all")
+def bench_score_all(ctx: BenchContext) -> Case:
+    """Score stage: one CV against the whole catalog, ranked (+ allocations per job)"""
+    pipeline = ctx.pipeline
+    stage = pipeline.stages["score"]
+    
+    def run():
+        match_ctx = MatchContext(cv_file_path=ctx.cv_paths[0], jobs=ctx.jobs, top_k=ctx.top_k)
+        match_ctx.cv = ctx.cvs[0]
+        match_ctx.candidates = ctx.jobs
+        stage.run(pipeline, match_ctx)
+        return match_ctx
+    return Case(run, items=len(ctx.jobs), extra=lambda: allocations(run, items=len(ctx.jobs)))
+
+
+@benchmark("ml_inference")
+def bench_ml_inference(ctx: BenchContext) -> Case:
+    """ATS model prediction per CV-job pair"""
+    agent3 = ctx.pipeline.agent3
+    if agent3.ml_predictor is None:
+        raise SkipBenchmark("ML model not loaded (models/production)")
+    
+    cv = ctx.cvs[0]
+    jobs = ctx.jobs[:50]
+    
+    def run():
+        for job in jobs:
+            agent3._get_ml_score(cv, job)
+    return Case(run, items=len(jobs))
+
+
+@benchmark("db_write")
+def bench_db_write(ctx: BenchContext) -> Case:
+    """Persist one CV's full result set in a single transaction"""
+    db = Database(db_path=str(ctx.workdir / "bench_history.db"))
+    db.initialize_schema()
+    matches = ctx.match_results(len(ctx.jobs))
+    
+    def reset():
+        db.clear_all_matches()
+    
+    def run():
+        db.save_matches(matches)
+    return Case(run, items=len(matches), setup=reset)
+
+
+@benchmark("match_response")
+def bench_match_response(ctx: BenchContext) -> Case:
+    """Format and serialize a top-50 /match response (+ body size, full and compact)"""
+    try:
+        from src.core.payloads import JobCatalog, json_response
+    except ImportError as e:
+        raise SkipBenchmark(f"API dependencies missing: {e}")
+    
+    pipeline = ctx.pipeline
+    catalog = JobCatalog(ctx.jobs)
+    cv = ctx.cvs[0]
+    matches = []
+    for job in ctx.jobs[:50]:
+        score = pipeline.agent3.score_match(cv, job)
+        decision = pipeline._make_decision(score)
+        matches.append(pipeline._build_match_result(cv, job, score, decision, None, 0.0))
+    
+    def render(compact: bool) -> bytes:
+        rows = catalog.match_rows(matches, "cv.txt", compact=compact)
+        return json_response({"matches": rows, "cv_text": None, "processing_time": None}).body
+    
+    def sizes():
+        return {"bytes": len(render(False)), "compact_bytes": len(render(True))}
+    return Case(lambda: render(False), items=len(matches), extra=sizes)
+
+
+@benchmark("jobs_filter")
+def bench_jobs_filter(ctx: BenchContext) -> Case:
+    """/jobs filters answered from the catalog search index (first 100 of each)"""
+    index = JobIndex(ctx.jobs)
+    queries = [
+        JobFilter(q="senior"),
+        JobFilter(q="data sci", remote_type="remote"),
+        JobFilter(skills="python,java,react"),
+        JobFilter(skills="python,docker", skills_match="all", seniority_level="mid,senior"),
+        JobFilter(location="ban", remote_type="hybrid", min_experience=2, max_experience=5),
+    ]
+    
+    def run():
+        for query in queries:
+            index.search(query, skip=0, limit=100)
+    return Case(run, items=len(queries))
+
+
+@benchmark("llm_explain")
+def bench_llm_explain(ctx: BenchContext) -> Case:
+    """Agent 4 explanations over a pooled session against a local stub Ollama"""
+    try:
+        import requests
+        from src.agents.agent4_llm_explainer import LLMExplainerAgent
+    except ImportError as e:
+        raise SkipBenchmark(f"requests not installed: {e}")
+    from .stub_ollama import StubOllama
+    
+    stub = StubOllama(model=ctx.pipeline.config.llm.model).start()
+    config = copy.deepcopy(ctx.pipeline.config)
+    config.llm.base_url = stub.base_url
+    config.llm.cache_enabled = False  # Every round must reach the stub
+    
+    def explainer(session=None) -> LLMExplainerAgent:
+        agent = LLMExplainerAgent(config)
+        agent.llm_available = True
+        if session is not None:
+            agent.session = session
+        return agent
+    
+    pooled = explainer()
+    matches = ctx.match_results(20)
+    
+    def explain_all(agent: LLMExplainerAgent) -> None:
+        for match in matches:
+            agent.generate_explanation(match)
+    
+    def extra():
+        # Same calls without keep-alive (module-level requests.post: one
+        # connection per call, as before pooling)
+        rounds = 5
+        figures = {}
+        for name, agent in (("pooled", pooled), ("unpooled", explainer(session=requests))):
+            stub.reset_counts()
+            start = time.perf_counter()
+            for _ in range(rounds):
+                explain_all(agent)
+            calls = rounds * len(matches)
+            figures[f"{name}_ms_per_call"] = round((time.perf_counter() - start) * 1000 / calls, 3)
+            figures[f"{name}_connections_per_call"] = round(stub.connections / calls, 3)
+        return figures
+    return Case(lambda: explain_all(pooled), items=len(matches), extra=extra)
+
+
+@benchmark("llm_explain_batch")
+def bench_llm_explain_batch(ctx: BenchContext) -> Case:
+    """Batched Agent 4 explanations (llm.batch_size per prompt) against a stub Ollama"""
+    try:
+        from src.agents.agent4_llm_explainer import LLMExplainerAgent
+    except ImportError as e:
+        raise SkipBenchmark(f"requests not installed: {e}")
+    from .stub_ollama import StubOllama
+    
+    # Scaled-down CPU generation costs: output tokens ~10x prompt tokens
+    stub = StubOllama(
+        model=ctx.pipeline.config.llm.model,
+        prompt_token_latency=0.00002,
+        output_token_latency=0.0002
+    ).start()
+    config = copy.deepcopy(ctx.pipeline.config)
+    config.llm.base_url = stub.base_url
+    config.llm.cache_enabled = False  # Every round must reach the stub
+    config.llm.batch_size = max(2, config.llm.batch_size)
+    agent = LLMExplainerAgent(config)
+    agent.llm_available = True
+    matches = ctx.match_results(8)
+    
+    def explain_single():
+        for match in matches:
+            agent.generate_explanation(match)
+    
+    def explain_batched():
+        agent.generate_explanations(matches)
+    
+    def extra():
+        # Per explanation: LLM calls, approximate tokens and wall time
+        figures = {"batch_size": config.llm.batch_size}
+        for name, fn in (("single", explain_single), ("batched", explain_batched)):
+            stub.reset_counts()
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            figures[f"{name}_calls"] = round(stub.requests / len(matches), 3)
+            figures[f"{name}_prompt_tokens"] = round(stub.prompt_tokens / len(matches), 1)
+            figures[f"{name}_output_tokens"] = round(stub.output_tokens / len(matches), 1)
+            figures[f"{name}_ms"] = round(elapsed * 1000 / len(matches), 3)
+        return figures
+    return Case(explain_batched, items=len(matches), extra=extra)
+
+
+@benchmark("llm_fallback")
+def bench_llm_fallback(ctx: BenchContext) -> Case:
+    """Agent 4 with Ollama down: rule-based explanations and structured insights"""
+    try:
+        from src.agents.agent4_llm_explainer import LLMExplainerAgent
+    except ImportError as e:
+        raise SkipBenchmark(f"requests not installed: {e}")
+    
+    agent = LLMExplainerAgent(ctx.pipeline.config)
+    agent.llm_available = False
+    matches = ctx.match_results(50)
+    
+    def run():
+        agent.generate_explanations(matches)
+        for match in matches:
+            agent.generate_structured_insights(match)
+    
+    def extra():
+        # Per match, template rendering alone (no cache lookup or metrics)
+        rounds = 20
+        figures = {}
+        for name, fn in (
+            ("explanation", agent._generate_rule_based_explanation),
+            ("insights", agent.generate_structured_insights),
+        ):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for match in matches:
+                    fn(match)
+            figures[f"{name}_us"] = round((time.perf_counter() - start) * 1e6 / (rounds * len(matches)), 2)
+        return figures
+    return Case(run, items=len(matches), extra=extra)
+
+
+@benchmark("match_e2e")
+def bench_match_e2e(ctx: BenchContext) -> Case:
+    """POST /match through the FastAPI app (upload → ranked JSON)"""
+    try:
+        from fastapi.testclient import TestClient
+        import src.api as api
+    except ImportError as e:
+        raise SkipBenchmark(f"API dependencies missing: {e}")
+    
+    # Serve the synthetic catalog and keep writes out of the real database
+    api.set_catalog(ctx.jobs)
+    api.pipeline.db = Database(db_path=str(ctx.workdir / "bench_api.db"))
+    client = TestClient(api.app)
+    content = Path(ctx.cv_paths[0]).read_bytes()
+    
+    def run():
+        response = client.post(
+            "/match",
+            params={"top_k": ctx.top_k},
+            files={"file": ("cv.txt", content, "text/plain")},
+        )
+        response.raise_for_status()
+    return Case(run, items=1, rounds=max(3, min(10, 2000 // max(1, len(ctx.jobs)))))
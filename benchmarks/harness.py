@@ -0,0 +1,225 @@
+"""
+Benchmark Harness
+Timing, result records, JSON output and cross-commit comparison
+
+A benchmark is a function registered with `@benchmark(name)` that receives a
+shared context and returns a `Case`: the callable to time plus how many items
+one call processes (used for throughput).
+"""
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from src.core.config import PROJECT_ROOT
+
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark setup when it cannot run in this environment"""
+
+
+@dataclass
+class Case:
+    """A prepared benchmark: the call to time and items processed per call"""
+    fn: Callable[[], object]
+    items: int = 1
+    rounds: Optional[int] = None  # Override the suite-wide repeat count
+    setup: Optional[Callable[[], None]] = None  # Untimed, before every call
+    extra: Optional[Callable[[], Dict]] = None  # Untimed, after timing: extra report figures
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing statistics for one benchmark (milliseconds per call)"""
+    name: str
+    rounds: int
+    items_per_call: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+    stdev_ms: float
+    throughput_per_s: float
+    skipped: Optional[str] = None
+    extra: Dict = field(default_factory=dict)
+    
+    @classmethod
+    def skip(cls, name: str, reason: str) -> "BenchmarkResult":
+        return cls(name, 0, 0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, skipped=reason)
+
+
+# name -> setup function(context) -> Case
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark setup function under `name`"""
+    def decorator(setup: Callable) -> Callable:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark already registered: {name}")
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def measure(name: str, case: Case, rounds: int = 5, warmup: int = 1) -> BenchmarkResult:
+    """
+    Time `case.fn` over several rounds
+    
+    Args:
+        name: Benchmark name
+        case: Prepared benchmark
+        rounds: Timed calls (ignored if the case sets its own)
+        warmup: Untimed calls first (caches, lazy imports)
+    
+    Returns:
+        BenchmarkResult with per-call latency stats and items/second
+    """
+    rounds = case.rounds or rounds
+    for _ in range(warmup):
+        if case.setup:
+            case.setup()
+        case.fn()
+    
+    samples: List[float] = []
+    for _ in range(rounds):
+        if case.setup:
+            case.setup()
+        start = time.perf_counter()
+        case.fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    
+    extra = case.extra() if case.extra else {}
+    
+    ordered = sorted(samples)
+    mean_ms = statistics.fmean(samples)
+    p95_index = min(len(ordered) - 1, max(0, round(0.95 * len(ordered)) - 1))
+    return BenchmarkResult(
+        name=name,
+        rounds=rounds,
+        items_per_call=case.items,
+        mean_ms=mean_ms,
+        median_ms=statistics.median(samples),
+        p95_ms=ordered[p95_index],
+        min_ms=ordered[0],
+        max_ms=ordered[-1],
+        stdev_ms=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        throughput_per_s=(case.items * 1000 / mean_ms) if mean_ms > 0 else 0.0,
+        extra=extra,
+    )
+
+
+def allocations(fn: Callable[[], object], items: int = 1) -> Dict[str, float]:
+    """
+    Memory allocated by one call of fn, per item (tracemalloc)
+    
+    `blocks_per_item`/`kib_per_item` count allocations still alive when fn
+    returns (including its result); `peak_kib` is the high-water mark.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_size = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        peak = tracemalloc.get_traced_memory()[1] - start_size
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    
+    diff = after.compare_to(before, "filename")
+    items = max(1, items)
+    return {
+        "blocks_per_item": round(sum(stat.count_diff for stat in diff) / items, 2),
+        "kib_per_item": round(sum(stat.size_diff for stat in diff) / 1024 / items, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def git_revision() -> Dict[str, Optional[str]]:
+    """Current commit and whether the tree has local changes"""
+    def git(*args) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *args], cwd=PROJECT_ROOT, capture_output=True,
+                text=True, timeout=10, check=True
+            ).stdout.strip()
+        except Exception:
+            return None
+    
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+    }
+
+
+def build_report(results: List[BenchmarkResult], params: Dict) -> Dict:
+    """Assemble the JSON document written for one run"""
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            **git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "params": params,
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+def write_report(report: Dict, output: Path) -> Path:
+    """Write a report; a directory gets a `<timestamp>_<commit>.json` file"""
+    output = Path(output)
+    if output.suffix != ".json":
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        commit = report["meta"].get("commit") or "nogit"
+        output = output / f"{stamp}_{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return output
+
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Compare per-item latency for each benchmark against a baseline report
+    
+    Per-item figures keep runs with different catalog sizes roughly
+    comparable; identical parameters are still recommended.
+    
+    Args:
+        baseline: Earlier report (e.g. from the main branch)
+        current: This run's report
+        threshold: Relative slowdown flagged as a regression (0.10 = 10%)
+    
+    Returns:
+        One row per benchmark present and not skipped in both reports
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base or base.get("skipped") or result.get("skipped") or not base["mean_ms"]:
+            continue
+        base_ms = base["mean_ms"] / max(1, base["items_per_call"])
+        current_ms = result["mean_ms"] / max(1, result["items_per_call"])
+        ratio = current_ms / base_ms
+        rows.append({
+            "name": name,
+            "baseline_ms": base_ms,
+            "current_ms": current_ms,
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
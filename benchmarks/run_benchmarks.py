@@ -0,0 +1,98 @@
+"""
+Benchmark Runner
+Run the matching benchmarks and write a JSON report
+
+Usage:
+    python -m benchmarks.run_benchmarks                      # defaults
+    python -m benchmarks.run_benchmarks --jobs 2000 --cvs 50
+    python -m benchmarks.run_benchmarks --only score_all score_one
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<baseline>.json
+"""
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from src.core.config import PROJECT_ROOT
+
+from .harness import (
+    BENCHMARKS, BenchmarkResult, SkipBenchmark,
+    build_report, compare_reports, measure, write_report
+)
+from .bench_matching import BenchContext
+
+DEFAULT_OUTPUT = PROJECT_ROOT / "benchmarks" / "results"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Recruiter-Pro-AI benchmark suite")
+    parser.add_argument("--jobs", type=int, default=500, help="Synthetic catalog size")
+    parser.add_argument("--cvs", type=int, default=20, help="Synthetic CVs to generate")
+    parser.add_argument("--top-k", type=int, default=10, help="top_k for score/match benchmarks")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warm-up rounds")
+    parser.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run a subset")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help="Report file (.json) or directory")
+    parser.add_argument("--compare", type=Path, help="Baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative slowdown counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit 1 if any benchmark regressed")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    # Agent logging at INFO would dominate the timings
+    logging.basicConfig(level=logging.WARNING)
+    
+    print(f"Preparing synthetic data: {args.jobs} jobs, {args.cvs} CVs (seed={args.seed})")
+    ctx = BenchContext.create(args.jobs, args.cvs, seed=args.seed, top_k=args.top_k)
+    
+    results = []
+    for name in args.only or list(BENCHMARKS):
+        try:
+            case = BENCHMARKS[name](ctx)
+            result = measure(name, case, rounds=args.rounds, warmup=args.warmup)
+        except SkipBenchmark as e:
+            result = BenchmarkResult.skip(name, str(e))
+        results.append(result)
+        
+        if result.skipped:
+            print(f"  {name:<14} skipped: {result.skipped}")
+        else:
+            print(
+                f"  {name:<14} mean={result.mean_ms:9.2f}ms  p95={result.p95_ms:9.2f}ms  "
+                f"{result.throughput_per_s:10.1f} items/s"
+            )
+            if result.extra:
+                print(" " * 16 + "  ".join(f"{k}={v}" for k, v in result.extra.items()))
+    
+    params = {k: v for k, v in vars(args).items() if k in ("jobs", "cvs", "top_k", "rounds", "warmup", "seed")}
+    report = build_report(results, params)
+    path = write_report(report, args.output)
+    print(f"Report written to {path}")
+    
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        rows = compare_reports(baseline, report, threshold=args.threshold)
+        print(f"\nPer-item latency vs {args.compare.name} (commit {baseline['meta'].get('commit')}):")
+        if baseline["meta"].get("params") != params:
+            print(f"  note: parameters differ from baseline {baseline['meta'].get('params')}")
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(
+                f"  {row['name']:<14} {row['baseline_ms']:9.3f}ms -> {row['current_ms']:9.3f}ms "
+                f"(x{row['ratio']:.2f}){flag}"
+            )
+        if args.fail_on_regression and any(row["regression"] for row in rows):
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Stub Ollama Server
+A local stand-in for the Ollama HTTP API, for benchmarking Agent 4 calls
+
+Serves `GET /api/tags` (listing one model) and `POST /api/generate` over
+HTTP/1.1 keep-alive. Generation latency can be simulated per call and per
+prompt/output token. Counts connections, requests and approximate
+prompt/output tokens so benchmarks can report connection reuse and token
+volume. Batched explanation prompts ("### Match N" blocks) are answered
+with one JSON entry per match.
+"""
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+DEFAULT_RESPONSE = (
+    "The candidate is a strong match for this role: their core skills cover the "
+    "required stack and their experience fits the seniority level."
+)
+
+
+_MATCH_RE = re.compile(r"^### Match (\d+)$", re.MULTILINE)
+
+
+def approx_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+
+def default_respond(prompt: str) -> str:
+    """Fixed explanation, or a JSON explanation per match for batched prompts"""
+    ids = [int(i) for i in _MATCH_RE.findall(prompt)]
+    if not ids:
+        return DEFAULT_RESPONSE
+    return json.dumps({"explanations": [{"id": i, "explanation": DEFAULT_RESPONSE} for i in ids]})
+
+
+class StubOllama:
+    """
+    Ollama stand-in on 127.0.0.1 (random port)
+    
+    Example:
+        with StubOllama(model="llama3.2:3b") as stub:
+            config.llm.base_url = stub.base_url
+    """
+    
+    def __init__(
+        self,
+        model: str = "llama3.2:3b",
+        respond: Optional[Callable[[str], str]] = None,
+        latency: float = 0.0,
+        prompt_token_latency: float = 0.0,
+        output_token_latency: float = 0.0
+    ):
+        """
+        Args:
+            model: Model name listed by /api/tags
+            respond: Prompt → response text (default: `default_respond`)
+            latency: Seconds to sleep per /api/generate call
+            prompt_token_latency: Extra seconds per prompt token
+            output_token_latency: Extra seconds per output token
+        """
+        self.model = model
+        self.respond = respond or default_respond
+        self.latency = latency
+        self.prompt_token_latency = prompt_token_latency
+        self.output_token_latency = output_token_latency
+        self.connections = 0
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.output_tokens = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "StubOllama":
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+            disable_nagle_algorithm = True  # Headers and body are separate writes
+            
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+            
+            def do_GET(self):
+                if self.path != "/api/tags":
+                    self._send(404, {"error": "not found"})
+                    return
+                self._send(200, {"models": [{"name": stub.model}]})
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if self.path != "/api/generate":
+                    self._send(404, {"error": "not found"})
+                    return
+                prompt = body.get("prompt", "")
+                text = stub.respond(prompt)
+                delay = (
+                    stub.latency
+                    + stub.prompt_token_latency * approx_tokens(prompt)
+                    + stub.output_token_latency * approx_tokens(text)
+                )
+                if delay:
+                    threading.Event().wait(delay)
+                with stub._lock:
+                    stub.requests += 1
+                    stub.prompt_tokens += approx_tokens(prompt)
+                    stub.output_tokens += approx_tokens(text)
+                self._send(200, {
+                    "model": stub.model,
+                    "response": text,
+                    "done": True,
+                    "prompt_eval_count": approx_tokens(prompt),
+                    "eval_count": approx_tokens(text),
+                })
+            
+            def _send(self, status, payload):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="stub-ollama", daemon=True).start()
+        return self
+    
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.connections = self.requests = self.prompt_tokens = self.output_tokens = 0
+    
+    def __enter__(self) -> "StubOllama":
+        return self.start()
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
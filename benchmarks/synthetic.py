@@ -0,0 +1,191 @@
+"""
+Synthetic Data for Benchmarks
+Deterministic CVs and job catalogs of any size
+
+CVs are rendered from rows of `data/AI_Resume_Screening.csv`; jobs draw their
+required skills from `data/dictionaries/skills_canonical.json`. The same seed
+always yields the same data, so results are comparable across commits.
+"""
+import csv
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+from src.core.config import PROJECT_ROOT
+from src.storage.models import JobPosting
+
+RESUME_CSV = PROJECT_ROOT / "data" / "AI_Resume_Screening.csv"
+SKILLS_JSON = PROJECT_ROOT / "data" / "dictionaries" / "skills_canonical.json"
+
+SENIORITY_YEARS = {
+    "entry": (0, 2),
+    "mid": (2, 5),
+    "senior": (5, 10),
+    "lead": (8, 15),
+}
+SENIORITY_PREFIX = {
+    "entry": "Junior",
+    "mid": "",
+    "senior": "Senior",
+    "lead": "Lead",
+}
+CITIES = ["Cairo", "Berlin", "Bangalore", "London", "Austin", "Toronto"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+EDUCATION_TEXT = {
+    "B.Sc": "Bachelor of Science in Computer Science",
+    "B.Tech": "Bachelor of Technology in Information Technology",
+    "M.Tech": "Master of Technology in Computer Engineering",
+    "MBA": "Master of Business Administration",
+    "PhD": "PhD in Machine Learning",
+}
+
+CV_TEMPLATE = """{name}
+Email: {email}
+Phone: +1-555-{phone:04d}
+
+SUMMARY
+{role} with {years} years of experience delivering {project_count} production projects.
+
+EXPERIENCE
+{role} at {company} ({start}-2025) - {years} years of experience
+Built and maintained systems using {skills_sentence}
+
+SKILLS
+{skills}
+
+EDUCATION
+{education}
+
+CERTIFICATIONS
+{certifications}
+"""
+
+
+class SyntheticData:
+    """Generates reproducible CVs and jobs for benchmarking"""
+    
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+        self.resumes = self._load_resumes()
+        self.skills_by_category = self._load_skills()
+        self.all_skills = sorted(
+            skill for skills in self.skills_by_category.values() for skill in skills
+        )
+    
+    @staticmethod
+    def _load_resumes() -> List[Dict]:
+        with open(RESUME_CSV, newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    
+    @staticmethod
+    def _load_skills() -> Dict[str, List[str]]:
+        with open(SKILLS_JSON, encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            category: sorted(skills)
+            for category, skills in data.items()
+            if isinstance(skills, dict)
+        }
+    
+    def cv_texts(self, count: int) -> List[str]:
+        """Render `count` CV texts (cycling through the resume dataset)"""
+        rng = random.Random(self.seed)
+        texts = []
+        for i in range(count):
+            row = self.resumes[i % len(self.resumes)]
+            skills = [s.strip() for s in row["Skills"].split(",") if s.strip()]
+            # Pad with dictionary skills so CVs look like real ones (6-12 skills)
+            extra = rng.sample(self.all_skills, rng.randint(3, 8))
+            skills = list(dict.fromkeys(skills + extra))
+            years = int(row["Experience (Years)"])
+            
+            texts.append(CV_TEMPLATE.format(
+                name=row["Name"],
+                email=f"{row['Name'].lower().replace(' ', '.')}.{i}@example.com",
+                phone=i % 10000,
+                role=row["Job Role"],
+                years=years,
+                project_count=row["Projects Count"],
+                company=rng.choice(COMPANIES),
+                start=2025 - years,
+                skills_sentence=", ".join(skills[:4]),
+                skills=", ".join(skills),
+                education=EDUCATION_TEXT.get(row["Education"], row["Education"]),
+                certifications=row["Certifications"] or "None",
+            ))
+        return texts
+    
+    def write_cvs(self, directory: Path, count: int) -> List[str]:
+        """Write `count` CVs as TXT files and return their paths"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for i, text in enumerate(self.cv_texts(count)):
+            path = directory / f"synthetic_cv_{i:04d}.txt"
+            path.write_text(text, encoding="utf-8")
+            paths.append(str(path))
+        return paths
+    
+    def pdf_documents(self, count: int, filler_pages: int = 0) -> List[bytes]:
+        """
+        Render `count` CVs as PDFs (requires PyMuPDF)
+        
+        Args:
+            count: Number of documents
+            filler_pages: Extra portfolio pages appended after the CV, to
+                exercise page budgets and early stop
+        
+        Returns:
+            PDF file contents
+        """
+        import fitz  # PyMuPDF
+        
+        documents = []
+        for text in self.cv_texts(count):
+            doc = fitz.open()
+            doc.new_page().insert_text((50, 60), text, fontsize=10)
+            for number in range(filler_pages):
+                filler = "\n".join(
+                    f"Project {number}.{line}: case study notes, screenshots and results"
+                    for line in range(40)
+                )
+                doc.new_page().insert_text((50, 60), f"PORTFOLIO\n{filler}", fontsize=9)
+            documents.append(doc.tobytes())
+            doc.close()
+        return documents
+    
+    def jobs(self, count: int) -> List[JobPosting]:
+        """Build a catalog of `count` valid job postings"""
+        rng = random.Random(self.seed + 1)
+        roles = sorted({row["Job Role"] for row in self.resumes})
+        categories = sorted(self.skills_by_category)
+        jobs = []
+        for i in range(count):
+            seniority = rng.choice(sorted(SENIORITY_YEARS))
+            min_years, max_years = SENIORITY_YEARS[seniority]
+            title = f"{SENIORITY_PREFIX[seniority]} {rng.choice(roles)}".strip()
+            
+            # Anchor each job in one category, then mix in a few others
+            anchor = self.skills_by_category[rng.choice(categories)]
+            required = rng.sample(anchor, min(len(anchor), rng.randint(3, 6)))
+            required += rng.sample(self.all_skills, rng.randint(1, 3))
+            required = list(dict.fromkeys(required))
+            preferred = rng.sample(self.all_skills, rng.randint(2, 4))
+            
+            jobs.append(JobPosting(
+                job_id=f"bench_job_{i:05d}",
+                title=title,
+                company_name=rng.choice(COMPANIES),
+                location_city=rng.choice(CITIES),
+                remote_type=rng.choice(["on-site", "hybrid", "remote"]),
+                employment_type="full-time",
+                seniority_level=seniority,
+                min_experience_years=min_years,
+                max_experience_years=max_years,
+                description=f"{title} working with {', '.join(required)}.",
+                required_skills=required,
+                preferred_skills=preferred,
+                posted_date="2025-01-01",
+            ))
+        return jobs
@@ -8,11 +8,15 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Now import and run
-from src.api import app
-import uvicorn
-
 if __name__ == "__main__":
+    # Imported here, not at module level: spawned parse workers re-import
+    # this file as __mp_main__ and must not load the app
+    from src.core.config import setup_logging
+    setup_logging()  # Before the app (and its agents) load
+    
+    from src.api import app
+    import uvicorn
+    
     print("=" * 60)
     print("🚀 Starting Recruiter Pro AI API Server...")
     print("=" * 60)
@@ -6,11 +6,15 @@ from .agent2_extractor import CandidateExtractor
 from .agent3_scorer import HybridScoringAgent
 from .agent4_llm_explainer import LLMExplainerAgent, get_explainer_agent
 
-# Pipeline (temporary alias to core.orchestrator)
-try:
-    from .pipeline import MatchingPipeline, get_pipeline
-except ImportError:
-    from ..core.orchestrator import MatchingPipeline, get_pipeline
+
+def __getattr__(name):
+    # Pipeline lives in core.orchestrator, which imports the agents above;
+    # resolve it lazily so either package can be imported first.
+    if name in ('MatchingPipeline', 'get_pipeline'):
+        from . import pipeline
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'RawParser',
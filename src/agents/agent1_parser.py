@@ -4,138 +4,301 @@ Type: Deterministic, Rule-based
 Purpose: Extract raw content from CV/Resume and Job Descriptions without NLP/AI.
 Output: Raw unstructured text blocks.
 """
+import io
 import sys
 import json
 import re
+import logging
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
 # File processing imports
-try:
-    from pdfminer.high_level import extract_text as pdf_extract_text
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    print("Warning: pdfminer.six not available. PDF parsing disabled.")
+logger = logging.getLogger(__name__)
 
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    print("Warning: python-docx not available. DOCX parsing disabled.")
+# PDF/DOCX libraries are imported on first use (PyMuPDF alone adds ~0.1 s
+# to startup); availability is checked without importing them
+PDF_AVAILABLE = find_spec("pdfminer") is not None
+if not PDF_AVAILABLE:
+    logger.warning("pdfminer.six not available. PDF parsing disabled.")
 
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
+DOCX_AVAILABLE = find_spec("docx") is not None
+if not DOCX_AVAILABLE:
+    logger.warning("python-docx not available. DOCX parsing disabled.")
+
+PYMUPDF_AVAILABLE = find_spec("fitz") is not None
+
+from ..core.config import get_config, ParsingConfig
+from ..storage.artifacts import ArtifactSink, get_artifact_sink
+from .parse_pool import ParseWorkerPool, get_parse_pool
+from ..core.metrics import PDF_EXTRACTION_LATENCY, FALLBACKS
 
 # Import parent directories for utility imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# File content already in memory (e.g. an upload), or a path on disk
+InMemoryFile = Union[bytes, bytearray, memoryview, BinaryIO]
+FileSource = Union[str, Path, InMemoryFile]
+
+# Section headers (matched against a whole, lower-cased line)
+SECTION_HEADERS = {
+    "experience": r"(work experience|employment history|experience|professional background)",
+    "education": r"(education|academic background|qualifications)",
+    "skills": r"(skills|technical skills|competencies|expertise)",
+    "summary": r"(summary|objective|profile|about me)"
+}
+# Formats extracted by native libraries, sent to the worker pool when one is
+# configured (plain text is decoded in-process: nothing there can hang)
+ISOLATED_SUFFIXES = frozenset({'.pdf', '.docx', '.doc'})
+
+# Text before the first header belongs to the contact section
+SECTION_NAMES = ("contact",) + tuple(SECTION_HEADERS)
+
+# One alternation over every header, matched per line; the named group
+# that matched is the section (first pattern wins, as in SECTION_HEADERS)
+_SECTION_HEADER_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    + "|".join(f"(?P<{name}>{pattern})" for name, pattern in SECTION_HEADERS.items())
+    + r")[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+SectionSpans = Dict[str, List[Tuple[int, int]]]
+
+
+def segment_spans(text: str) -> SectionSpans:
+    """
+    Locate sections in one pass over the text.
+    
+    Returns:
+        {section: [(start, end), ...]} offsets into text, header lines
+        excluded; a section that appears twice has two spans
+    """
+    spans: SectionSpans = {name: [] for name in SECTION_NAMES}
+    current, start = "contact", 0
+    for match in _SECTION_HEADER_RE.finditer(text):
+        if match.start() > start:
+            spans[current].append((start, match.start()))
+        current = match.lastgroup
+        start = match.end() + 1  # Skip the header's newline
+    if start < len(text):
+        spans[current].append((start, len(text)))
+    return spans
+
+
+def section_text(text: str, spans: List[Tuple[int, int]]) -> str:
+    """Text covered by a section's spans."""
+    return "".join(text[start:end] for start, end in spans).strip()
+
+
+def _in_memory_bytes(source: FileSource) -> Optional[bytes]:
+    """Content of an in-memory source, or None if source is a path."""
+    if isinstance(source, bytes):
+        return source
+    if isinstance(source, (bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, io.BytesIO):
+        return source.getvalue()
+    if hasattr(source, "read"):
+        return source.read()
+    return None
+
+
 class RawParser:
     """
     Agent 1: Extracts raw text from files and segments them into raw blocks.
     Strictly NO NLP/AI (No SpaCy, No NLTK).
     """
     
-    def __init__(self, output_dir: str = "data/processed/raw_profiles"):
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        parsing_config: Optional[ParsingConfig] = None,
+        artifact_sink: Optional[ArtifactSink] = None,
+        worker_pool: Optional[ParseWorkerPool] = None
+    ):
         """
         Initialize the parser.
         
         Args:
-            output_dir: Directory to save parsed raw profiles
+            output_dir: Directory for raw profile artifacts (default: ArtifactsConfig)
+            parsing_config: Extraction budgets (default: from app config)
+            artifact_sink: Where raw profiles go (default: shared configured sink)
+            worker_pool: Extract PDF/DOCX in worker processes (default: shared pool
+                if parsing.worker_processes > 0, else in-process)
         """
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        print(f"[OK] Agent 1 (RawParser) initialized. Output dir: {self.output_dir}")
+        self.parsing_config = parsing_config or get_config().parsing
+        self.artifact_sink = artifact_sink or get_artifact_sink(output_dir=output_dir)
+        if worker_pool is None and self.parsing_config.worker_processes > 0:
+            worker_pool = get_parse_pool(self.parsing_config)
+        self.worker_pool = worker_pool
+        logger.info("[OK] Agent 1 (RawParser) initialized. Artifacts: %s", self.artifact_sink.describe())
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    def extract_text_from_pdf(self, pdf_source: FileSource) -> str:
         """
-        Extract text from PDF file using available library.
+        Extract text from a PDF page by page, within the parsing budget.
+        
+        Pages are streamed into a list buffer and reading stops at the
+        page/character budget, or shortly after the experience and skills
+        sections have been seen.
         
         Args:
-            pdf_path: Path to PDF file
-            
+            pdf_source: Path to PDF file, or its content (bytes/BytesIO/memoryview)
+        
         Returns:
             Extracted text content
         """
-        pdf_file = Path(pdf_path)
-        if not pdf_file.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        data = _in_memory_bytes(pdf_source)
+        if data is not None:
+            label = "<in-memory>"
+        else:
+            pdf_file = Path(pdf_source)
+            if not pdf_file.exists():
+                raise FileNotFoundError(f"PDF file not found: {pdf_source}")
+            label = str(pdf_file)
         
         # Try PyMuPDF first (faster and more accurate)
         if PYMUPDF_AVAILABLE:
             try:
-                doc = fitz.open(pdf_path)
-                text = ""
-                for page in doc:
-                    text += page.get_text()
-                doc.close()
-                return text
+                import fitz  # PyMuPDF
+                doc = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(label)
             except Exception as e:
-                print(f"PyMuPDF extraction failed: {e}")
+                logger.warning("PyMuPDF could not open %s: %s", label, e)
+                FALLBACKS.inc(component="pdf", reason="pymupdf_error")
+            else:
+                with PDF_EXTRACTION_LATENCY.time(backend="pymupdf"):
+                    try:
+                        return self._collect_pages(self._iter_pymupdf_pages(doc))
+                    finally:
+                        doc.close()
         
-        # Fallback to pdfminer.six
+        # Fallback to pdfminer.six (only when PyMuPDF is missing or can't open the file)
         if PDF_AVAILABLE:
             try:
-                return pdf_extract_text(pdf_path)
+                with PDF_EXTRACTION_LATENCY.time(backend="pdfminer"):
+                    source = io.BytesIO(data) if data is not None else label
+                    return self._collect_pages(self._iter_pdfminer_pages(source))
             except Exception as e:
                 raise RuntimeError(f"PDF extraction failed: {e}")
         
         raise RuntimeError("No PDF parsing library available. Install pdfminer.six or PyMuPDF.")
     
-    def extract_text_from_docx(self, docx_path: str) -> str:
+    def _iter_pymupdf_pages(self, doc) -> Iterator[str]:
+        """Yield page texts; a broken page is skipped, not fatal."""
+        for number, page in enumerate(doc):
+            try:
+                yield page.get_text()
+            except Exception as e:
+                logger.debug("Skipping unreadable PDF page %d: %s", number, e)
+                FALLBACKS.inc(component="pdf", reason="page_error")
+                yield ""
+    
+    def _iter_pdfminer_pages(self, source) -> Iterator[str]:
+        """Yield page texts lazily with pdfminer's layout analysis."""
+        from pdfminer.high_level import extract_pages as pdf_extract_pages
+        from pdfminer.layout import LTTextContainer
+        
+        max_pages = self.parsing_config.pdf_max_pages or 0
+        for page in pdf_extract_pages(source, maxpages=max_pages):
+            yield "".join(
+                element.get_text() for element in page if isinstance(element, LTTextContainer)
+            )
+    
+    def _collect_pages(self, pages: Iterable[str]) -> str:
         """
-        Extract text from DOCX file.
+        Join page texts, enforcing the page/char budget and early stop.
         
         Args:
-            docx_path: Path to DOCX file
+            pages: Page texts in document order (consumed lazily)
+        
+        Returns:
+            Concatenated text of the pages read
+        """
+        budget = self.parsing_config
+        targets = set(budget.pdf_early_stop_sections) if budget.pdf_early_stop else set()
+        seen: Set[str] = set()
+        stop_after = None
+        
+        parts: List[str] = []
+        chars = 0
+        for index, page_text in enumerate(pages):
+            if budget.pdf_max_pages and index >= budget.pdf_max_pages:
+                logger.debug("PDF page budget reached (%d pages)", budget.pdf_max_pages)
+                break
+            
+            if budget.pdf_max_chars and chars + len(page_text) >= budget.pdf_max_chars:
+                parts.append(page_text[:budget.pdf_max_chars - chars])
+                logger.debug("PDF character budget reached (%d chars)", budget.pdf_max_chars)
+                break
+            parts.append(page_text)
+            chars += len(page_text)
             
+            if targets and stop_after is None:
+                seen.update(self._section_headers_in(page_text, targets))
+                if targets <= seen:
+                    stop_after = index + budget.pdf_early_stop_grace_pages
+            if stop_after is not None and index >= stop_after:
+                logger.debug("PDF early stop after page %d (sections seen: %s)", index + 1, sorted(seen))
+                break
+        
+        return "".join(parts)
+    
+    @staticmethod
+    def _section_headers_in(text: str, names: Set[str]) -> Set[str]:
+        """Names of the given sections whose header line appears in text."""
+        return {match.lastgroup for match in _SECTION_HEADER_RE.finditer(text)} & names
+    
+    def extract_text_from_docx(self, docx_source: FileSource) -> str:
+        """
+        Extract text from DOCX file.
+        
+        Args:
+            docx_source: Path to DOCX file, or its content (bytes/BytesIO/memoryview)
+        
         Returns:
             Extracted text content
         """
         if not DOCX_AVAILABLE:
             raise RuntimeError("python-docx not available. Install python-docx to parse DOCX files.")
         
-        docx_file = Path(docx_path)
-        if not docx_file.exists():
-            raise FileNotFoundError(f"DOCX file not found: {docx_path}")
+        data = _in_memory_bytes(docx_source)
+        if data is not None:
+            docx_source = io.BytesIO(data)
+        elif not Path(docx_source).exists():
+            raise FileNotFoundError(f"DOCX file not found: {docx_source}")
         
         try:
-            doc = Document(docx_path)
+            from docx import Document
+            doc = Document(docx_source)
             text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
             return text
         except Exception as e:
             raise RuntimeError(f"DOCX extraction failed: {e}")
     
-    def extract_text_from_txt(self, txt_path: str) -> str:
+    def extract_text_from_txt(self, txt_source: FileSource) -> str:
         """
         Extract text from TXT file.
         
         Args:
-            txt_path: Path to TXT file
-            
+            txt_source: Path to TXT file, or its content (bytes/BytesIO/memoryview)
+        
         Returns:
             Text content
         """
-        txt_file = Path(txt_path)
-        if not txt_file.exists():
-            raise FileNotFoundError(f"TXT file not found: {txt_path}")
+        data = _in_memory_bytes(txt_source)
+        if data is None:
+            txt_file = Path(txt_source)
+            if not txt_file.exists():
+                raise FileNotFoundError(f"TXT file not found: {txt_source}")
+            data = txt_file.read_bytes()
         
         try:
-            with open(txt_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            try:
-                # Try with different encoding
-                with open(txt_path, 'r', encoding='latin-1') as f:
-                    return f.read()
-            except Exception as e2:
-                raise RuntimeError(f"TXT extraction failed: {e2}")
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            # latin-1 maps every byte, so this cannot fail
+            return data.decode('latin-1')
     
     def parse_file(self, file_path: str, profile_id: Optional[str] = None) -> Dict:
         """
@@ -144,22 +307,14 @@ class RawParser:
         Args:
             file_path: Path to file
             profile_id: Optional profile identifier
-            
+        
         Returns:
             Dictionary with raw text blocks
         """
         file_path = Path(file_path)
         suffix = file_path.suffix.lower()
         
-        # Extract text based on file type
-        if suffix == '.pdf':
-            text = self.extract_text_from_pdf(str(file_path))
-        elif suffix in ['.docx', '.doc']:
-            text = self.extract_text_from_docx(str(file_path))
-        elif suffix == '.txt':
-            text = self.extract_text_from_txt(str(file_path))
-        else:
-            raise ValueError(f"Unsupported file format: {suffix}. Supported: .pdf, .docx, .txt")
+        text = self._extract_text(str(file_path), suffix)
         
         # Use filename as profile_id if not provided
         if not profile_id:
@@ -167,6 +322,88 @@ class RawParser:
         
         return self.parse_profile(text, profile_id)
     
+    def parse_bytes(self, data: InMemoryFile, filename: str, profile_id: Optional[str] = None) -> Dict:
+        """
+        Parse an in-memory file (e.g. an upload) without touching disk.
+        
+        Args:
+            data: File content (bytes, bytearray, memoryview or BytesIO)
+            filename: Original file name (selects the format by extension)
+            profile_id: Optional profile identifier
+        
+        Returns:
+            Dictionary with raw text blocks
+        """
+        file_name = Path(filename)
+        text = self._extract_text(data, file_name.suffix.lower())
+        
+        if not profile_id:
+            profile_id = f"profile_{file_name.stem}"
+        
+        return self.parse_profile(text, profile_id)
+    
+    def parse_many(self, files: List[Tuple[InMemoryFile, str]]) -> List[Dict]:
+        """
+        Parse several in-memory files (e.g. a bulk upload).
+        
+        With a worker pool the PDF/DOCX documents are extracted in parallel
+        across worker processes. A document that fails (timeout, bad file) yields
+        a profile with empty raw_text and an "error" message.
+        
+        Args:
+            files: (content, filename) pairs
+        
+        Returns:
+            One raw profile per file, in input order
+        """
+        names = [Path(filename) for _, filename in files]
+        documents = [(_in_memory_bytes(data), name.suffix.lower()) for (data, _), name in zip(files, names)]
+        
+        pooled = [i for i, (_, suffix) in enumerate(documents) if self._isolated(suffix)]
+        texts: List = [None] * len(documents)
+        if pooled:
+            for i, text in zip(pooled, self.worker_pool.extract_many([documents[i] for i in pooled])):
+                texts[i] = text
+        for i, (source, suffix) in enumerate(documents):
+            if texts[i] is not None:
+                continue
+            try:
+                texts[i] = self._extract_text_in_process(source, suffix)
+            except Exception as e:
+                texts[i] = e
+        
+        results = []
+        for name, text in zip(names, texts):
+            profile_id = f"profile_{name.stem}"
+            if isinstance(text, Exception):
+                logger.warning("Failed to parse %s: %s", name.name, text)
+                results.append({"profile_id": profile_id, "raw_text": "", "sections": {}, "error": str(text)})
+            else:
+                results.append(self.parse_profile(text, profile_id))
+        return results
+    
+    def _isolated(self, suffix: str) -> bool:
+        """Whether a format is extracted in the worker pool"""
+        return self.worker_pool is not None and suffix in ISOLATED_SUFFIXES
+    
+    def _extract_text(self, source: FileSource, suffix: str) -> str:
+        """Extract text, PDF/DOCX in a worker process when a pool is configured."""
+        if not self._isolated(suffix):
+            return self._extract_text_in_process(source, suffix)
+        
+        data = _in_memory_bytes(source)
+        return self.worker_pool.extract_text(data if data is not None else str(source), suffix)
+    
+    def _extract_text_in_process(self, source: FileSource, suffix: str) -> str:
+        """Dispatch text extraction on file extension."""
+        if suffix == '.pdf':
+            return self.extract_text_from_pdf(source)
+        elif suffix in ['.docx', '.doc']:
+            return self.extract_text_from_docx(source)
+        elif suffix == '.txt':
+            return self.extract_text_from_txt(source)
+        raise ValueError(f"Unsupported file format: {suffix}. Supported: .pdf, .docx, .txt")
+    
     def parse_profile(self, profile_text: str, profile_id: Optional[str] = None) -> Dict:
         """
         Parse a profile text into raw sections using Regex/Rule-based logic.
@@ -174,40 +411,42 @@ class RawParser:
         Args:
             profile_text: Raw resume text
             profile_id: Optional profile identifier
-            
+        
         Returns:
             Dictionary with raw text blocks
         """
         if not profile_id:
             profile_id = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            
+        
         # 1. Clean basic whitespace
         cleaned_text = self._basic_clean(profile_text)
         
         # 2. Segment into raw sections using Regex keywords
-        sections = self._segment_text(cleaned_text)
+        spans = segment_spans(cleaned_text)
+        sections = self._segment_text(cleaned_text, spans)
         
         # 3. Construct RAW output (No structured fields yet)
         profile_data = {
             "profile_id": profile_id,
             "raw_text": cleaned_text,
             "sections": sections,
+            "section_spans": spans,  # Offsets into raw_text, for Agent 2
             "parsed_at": datetime.now().isoformat(),
             "parser_version": "v2.0_raw_only"
         }
         
-        # 4. Save to file
-        self._save_output(profile_data, profile_id)
+        # 4. Hand off to the artifact sink (async/off by config)
+        self.artifact_sink.write("raw_profile", profile_id, profile_data)
         
         return profile_data
-
+    
     def parse_job(self, job_data: Dict) -> Dict:
         """
         Pass-through for job data to ensure consistent raw output format.
         
         Args:
             job_data: Dictionary containing job information (usually already structured from dataset)
-            
+        
         Returns:
             Dictionary with raw job data
         """
@@ -221,52 +460,15 @@ class RawParser:
             "parsed_at": datetime.now().isoformat(),
             "parser_version": "v2.0_raw_only"
         }
-
+    
     def _basic_clean(self, text: str) -> str:
         """Basic whitespace cleanup only."""
         return "\n".join([line.strip() for line in text.split("\n") if line.strip()])
-
-    def _segment_text(self, text: str) -> Dict[str, str]:
+    
+    def _segment_text(self, text: str, spans: Optional[SectionSpans] = None) -> Dict[str, str]:
         """
         Segment text into broad sections (Experience, Education, Skills) using Regex.
         This is a heuristic approach, not NLP.
         """
-        sections = {
-            "contact_block": "",
-            "experience_block": "",
-            "education_block": "",
-            "skills_block": "",
-            "summary_block": ""
-        }
-        
-        # Define simplistic section headers (case insensitive)
-        headers = {
-            "experience": r"(work experience|employment history|experience|professional background)",
-            "education": r"(education|academic background|qualifications)",
-            "skills": r"(skills|technical skills|competencies|expertise)",
-            "summary": r"(summary|objective|profile|about me)"
-        }
-        
-        lines = text.split('\n')
-        current_section = "contact_block" # Default top section
-        
-        for line in lines:
-            # Check if line is a header
-            is_header = False
-            for section_name, pattern in headers.items():
-                if re.match(f"^{pattern}$", line.lower().strip()):
-                    current_section = f"{section_name}_block"
-                    is_header = True
-                    break
-            
-            if not is_header:
-                sections[current_section] += line + "\n"
-                
-        return {k: v.strip() for k, v in sections.items()}
-
-    def _save_output(self, data: Dict, profile_id: str):
-        """Save raw parsed data to JSON."""
-        output_path = self.output_dir / f"{profile_id}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
+        spans = spans if spans is not None else segment_spans(text)
+        return {f"{name}_block": section_text(text, spans[name]) for name in SECTION_NAMES}
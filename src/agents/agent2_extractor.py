@@ -5,9 +5,48 @@ Maximized efficiency with comprehensive skill database and intelligent parsing
 """
 import re
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
+from ..core.skill_registry import SKILL_SYNONYMS, SKILL_VOCABULARY, get_skill_registry
+from ..utils.skill_matcher import SkillMatcher
+
+# Patterns compiled once at import (tried in order where several are listed)
+_NAME_HEADER_RES = [
+    re.compile(r"^(?:Candidate|Name|Full\s*Name|Applicant)\s*[:\-]\s*(.+)", re.IGNORECASE),
+    re.compile(r"^(?:Resume\s*of|CV\s*of)\s*[:\-]?\s*(.+)", re.IGNORECASE)
+]
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+_PHONE_RES = [
+    re.compile(r"(?:\+|00)\d{1,3}[\s\-]?\d{1,4}[\s\-]?\d{1,4}[\s\-]?\d{1,9}"),  # International
+    re.compile(r"\d{3}[\s\-]?\d{3}[\s\-]?\d{4}"),  # US format
+    re.compile(r"\d{4}[\s\-]?\d{3}[\s\-]?\d{3}"),  # Some EU formats
+    re.compile(r"\(\d{3}\)\s*\d{3}[\s\-]?\d{4}")  # (xxx) xxx-xxxx
+]
+_ADDRESS_HEADER_RE = re.compile(r"^(?:Address|Location|Residence)\s*[:\-]", re.IGNORECASE)
+_EXPERIENCE_RES = [
+    # Standard patterns
+    re.compile(r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)"),
+    re.compile(r"experience\s*[:\-]\s*(\d+)\s*(?:years?|yrs?)"),
+    re.compile(r"(\d+)\s*(?:years?|yrs?)\s*in\s*\w+"),
+    re.compile(r"total\s*[:\-]?\s*(\d+)\s*(?:years?|yrs?)"),
+    # Additional patterns for broken formatting
+    re.compile(r"(?:experience|exp)\D*(\d+)\D*(?:year|yr)"),
+    re.compile(r"(\d+)\D*(?:year|yr)\D*(?:experience|exp)"),
+]
+# Date range patterns (2019-2024 = 5 years)
+_DATE_RANGE_RE = re.compile(r"(20\d{2})\s*[-–—]\s*(20\d{2}|present|current)")
+_DEGREE_RES = [
+    (re.compile(r"\b(?:B\.?S\.?|Bachelor'?s?|B\.?A\.?|B\.?Sc\.?)\b", re.IGNORECASE), "Bachelor's"),
+    (re.compile(r"\b(?:M\.?S\.?|Master'?s?|M\.?A\.?|M\.?Sc\.?|MBA)\b", re.IGNORECASE), "Master's"),
+    (re.compile(r"\b(?:Ph\.?D\.?|Doctorate|Doctoral)\b", re.IGNORECASE), "PhD"),
+    (re.compile(r"\b(?:Associate'?s?|A\.?S\.?|A\.?A\.?)\b", re.IGNORECASE), "Associate's"),
+]
+
+# Agent 1 section spans: {section: [(start, end), ...]} offsets into the text
+SectionSpans = Dict[str, List[Tuple[int, int]]]
+
+
 class CandidateExtractor:
     """
     Deterministic Candidate Extractor - Agent 2
@@ -30,87 +69,26 @@ class CandidateExtractor:
         'information', 'details', 'personal', 'data', 'document'
     }
     
-    # Comprehensive technical skills database (100+ skills)
-    SKILLS_DATABASE = {
-        # Programming Languages
-        'python', 'java', 'javascript', 'js', 'typescript', 'ts', 'c++', 'cpp',
-        'c#', 'csharp', 'ruby', 'php', 'swift', 'kotlin', 'go', 'golang', 'rust',
-        'scala', 'r', 'perl', 'shell', 'bash', 'powershell', 'vba',
-        
-        # Web Frontend
-        'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'react', 'reactjs',
-        'angular', 'angularjs', 'vue', 'vuejs', 'svelte', 'jquery', 'bootstrap',
-        'tailwind', 'webpack', 'vite', 'nextjs', 'gatsby', 'redux', 'mobx',
-        
-        # Web Backend
-        'nodejs', 'node.js', 'node', 'express', 'expressjs', 'django', 'flask',
-        'fastapi', 'spring', 'springboot', 'asp.net', 'laravel', 'rails', 'nestjs',
-        
-        # Databases
-        'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'mongo', 'redis',
-        'oracle', 'sqlite', 'dynamodb', 'cassandra', 'couchdb', 'elasticsearch',
-        'neo4j', 'mariadb', 'mssql', 'sqlserver', 'firebase',
-        
-        # Cloud & DevOps
-        'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'k8s',
-        'jenkins', 'terraform', 'ansible', 'git', 'github', 'gitlab', 'bitbucket',
-        'linux', 'unix', 'ubuntu', 'centos', 'debian', 'ci/cd', 'cicd',
-        
-        # Data Science & ML
-        'pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'tensorflow',
-        'pytorch', 'keras', 'scikit-learn', 'sklearn', 'machine learning', 'ml',
-        'deep learning', 'ai', 'artificial intelligence', 'data science',
-        'big data', 'hadoop', 'spark', 'pyspark', 'airflow', 'kafka',
-        
-        # Mobile
-        'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic',
-        
-        # Testing & Quality
-        'selenium', 'pytest', 'junit', 'jest', 'mocha', 'chai', 'cypress',
-        'testing', 'unit testing', 'integration testing', 'tdd', 'bdd',
-        
-        # Design & Tools
-        'photoshop', 'illustrator', 'figma', 'sketch', 'adobe xd', 'indesign',
-        'ui/ux', 'ui', 'ux', 'design', 'graphic design', 'web design',
-        
-        # Soft Skills
-        'communication', 'leadership', 'management', 'teamwork', 'collaboration',
-        'problem solving', 'analytical', 'critical thinking', 'agile', 'scrum',
-        'project management', 'time management', 'presentation',
-        
-        # Other Technical
-        'rest', 'restful', 'api', 'graphql', 'soap', 'microservices',
-        'websocket', 'json', 'xml', 'yaml', 'oauth', 'jwt', 'saml'
-    }
-    
-    # Skill synonyms for normalization
-    SKILL_SYNONYMS = {
-        'js': 'javascript',
-        'ts': 'typescript',
-        'nodejs': 'node.js',
-        'node': 'node.js',
-        'reactjs': 'react',
-        'vuejs': 'vue',
-        'angularjs': 'angular',
-        'mongo': 'mongodb',
-        'postgres': 'postgresql',
-        'k8s': 'kubernetes',
-        'sklearn': 'scikit-learn',
-        'cpp': 'c++',
-        'csharp': 'c#',
-        'golang': 'go'
-    }
+    # Skill vocabulary (100+ skills) and synonyms, owned by the shared SkillRegistry
+    SKILLS_DATABASE = {term for terms in SKILL_VOCABULARY.values() for term in terms}
+    SKILL_SYNONYMS = SKILL_SYNONYMS
     
     def __init__(self):
         self.logger = logging.getLogger("Agent2_Extractor")
-        logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
     
-    def extract(self, text: str) -> Dict:
+    @staticmethod
+    def skill_matcher() -> SkillMatcher:
+        """Compiled skill automaton over every registry alias (built once, shared)"""
+        return get_skill_registry().matcher()
+    
+    def extract(self, text: str, sections: Optional[SectionSpans] = None) -> Dict:
         """
         Main extraction pipeline - fully deterministic
         
         Args:
             text: Raw CV text from Agent 1
+            sections: Agent 1 `section_spans` for text; contact fields and
+                education are then read from their section first
             
         Returns:
             Structured candidate profile
@@ -120,15 +98,17 @@ class CandidateExtractor:
             return self._empty_profile()
         
         lines = [l.strip() for l in text.split('\n') if l.strip()]
+        contact = self._section(text, sections, "contact")
+        education_text = self._section(text, sections, "education")
         
-        # Extract all fields
+        # Extract all fields (section first, whole text as fallback)
         name = self._extract_name(lines, text)
-        email = self._extract_email(text)
-        phone = self._extract_phone(text)
+        email = (contact and self._extract_email(contact)) or self._extract_email(text)
+        phone = (contact and self._extract_phone(contact)) or self._extract_phone(text)
         address = self._extract_address(lines)
         skills = self._extract_skills(text)
         experience_years = self._extract_experience(text)
-        education = self._extract_education(text)
+        education = (education_text and self._extract_education(education_text)) or self._extract_education(text)
         
         profile = {
             "name": name,
@@ -141,9 +121,16 @@ class CandidateExtractor:
             "extraction_confidence": self._calculate_confidence(name, email, skills)
         }
         
-        self.logger.info(f"Extracted: {name} | {len(skills)} skills | {experience_years}yr exp")
+        self.logger.debug("Extracted: %s | %d skills | %syr exp", name, len(skills), experience_years)
         return profile
     
+    @staticmethod
+    def _section(text: str, sections: Optional[SectionSpans], name: str) -> str:
+        """Text of one section ("" when spans are missing or the section is empty)"""
+        if not sections or not sections.get(name):
+            return ""
+        return "".join(text[start:end] for start, end in sections[name])
+    
     def _extract_name(self, lines: List[str], full_text: str) -> str:
         """
         Rule 1: Explicit headers (Candidate:, Name:, Full Name:)
@@ -151,14 +138,9 @@ class CandidateExtractor:
         Rule 3: Fallback to Unknown
         """
         # Rule 1: Header patterns
-        header_patterns = [
-            r"^(?:Candidate|Name|Full\s*Name|Applicant)\s*[:\-]\s*(.+)",
-            r"^(?:Resume\s*of|CV\s*of)\s*[:\-]?\s*(.+)"
-        ]
-        
         for line in lines[:20]:  # Check first 20 lines
-            for pattern in header_patterns:
-                if match := re.match(pattern, line, re.IGNORECASE):
+            for pattern in _NAME_HEADER_RES:
+                if match := pattern.match(line):
                     name = match.group(1).strip()
                     if self._is_valid_name(name):
                         return name
@@ -205,21 +187,13 @@ class CandidateExtractor:
     
     def _extract_email(self, text: str) -> str:
         """Extract email with comprehensive regex"""
-        pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-        match = re.search(pattern, text)
+        match = _EMAIL_RE.search(text)
         return match.group(0) if match else ""
     
     def _extract_phone(self, text: str) -> str:
         """Extract phone - international and local formats"""
-        patterns = [
-            r"(?:\+|00)\d{1,3}[\s\-]?\d{1,4}[\s\-]?\d{1,4}[\s\-]?\d{1,9}",  # International
-            r"\d{3}[\s\-]?\d{3}[\s\-]?\d{4}",  # US format
-            r"\d{4}[\s\-]?\d{3}[\s\-]?\d{3}",  # Some EU formats
-            r"\(\d{3}\)\s*\d{3}[\s\-]?\d{4}"  # (xxx) xxx-xxxx
-        ]
-        
-        for pattern in patterns:
-            if match := re.search(pattern, text):
+        for pattern in _PHONE_RES:
+            if match := pattern.search(text):
                 return match.group(0)
         
         return ""
@@ -228,7 +202,7 @@ class CandidateExtractor:
         """Extract address using multi-strategy approach"""
         # Strategy 1: Explicit header
         for i, line in enumerate(lines[:25]):
-            if re.match(r"^(?:Address|Location|Residence)\s*[:\-]", line, re.IGNORECASE):
+            if _ADDRESS_HEADER_RE.match(line):
                 if ':' in line:
                     addr = line.split(':', 1)[1].strip()
                     if addr:
@@ -249,68 +223,28 @@ class CandidateExtractor:
     
     def _extract_skills(self, text: str) -> List[str]:
         """
-        Multi-strategy skill extraction:
-        1. Dictionary matching (exact)
-        2. Fuzzy matching for common variations
-        3. Multi-word skill detection
-        """
-        text_lower = text.lower()
-        found_skills: Set[str] = set()
-        
-        # Tokenize
-        tokens = re.findall(r"\b[\w\+\#\./-]+\b", text_lower)
+        Dictionary skill extraction in one pass over the text.
         
-        # Exact single-word matches
-        for token in tokens:
-            if token in self.SKILLS_DATABASE:
-                # Normalize via synonyms
-                normalized = self.SKILL_SYNONYMS.get(token, token)
-                found_skills.add(normalized)
-        
-        # Multi-word skills (scan full text)
-        for skill in self.SKILLS_DATABASE:
-            if ' ' in skill or '/' in skill:
-                if skill in text_lower:
-                    found_skills.add(skill)
-        
-        # Handle compound skills (e.g., "node.js", "c++", "c#")
-        special_patterns = [
-            (r'\bnode\.?js\b', 'node.js'),
-            (r'\bc\+\+\b', 'c++'),
-            (r'\bc#\b', 'c#'),
-            (r'\b\.net\b', 'asp.net'),
-        ]
-        
-        for pattern, skill_name in special_patterns:
-            if re.search(pattern, text_lower):
-                found_skills.add(skill_name)
-        
-        return sorted(list(found_skills))
+        Single- and multi-word skills, synonyms ("js" → "javascript") and
+        compound names ("node.js", "c++", "c#", ".net") are all matched by
+        one compiled automaton with word-boundary semantics, and reported
+        by their SkillRegistry canonical names.
+        """
+        return sorted(self.skill_matcher().find(text))
     
     def _extract_experience(self, text: str) -> int:
         """Extract years of experience using multiple patterns"""
-        patterns = [
-            # Standard patterns
-            r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)",
-            r"experience\s*[:\-]\s*(\d+)\s*(?:years?|yrs?)",
-            r"(\d+)\s*(?:years?|yrs?)\s*in\s*\w+",
-            r"total\s*[:\-]?\s*(\d+)\s*(?:years?|yrs?)",
-            # Additional patterns for broken formatting
-            r"(?:experience|exp)\D*(\d+)\D*(?:year|yr)",
-            r"(\d+)\D*(?:year|yr)\D*(?:experience|exp)",
-            # Date range patterns (2019-2024 = 5 years)
-            r"(20\d{2})\s*[-–—]\s*(20\d{2}|present|current)",
-        ]
+        text_lower = text.lower()
         
         # Try explicit patterns first
-        for pattern in patterns[:-1]:  # All except date range
-            if match := re.search(pattern, text.lower()):
+        for pattern in _EXPERIENCE_RES:
+            if match := pattern.search(text_lower):
                 years = int(match.group(1))
                 if 0 < years <= 50:  # Sanity check
                     return years
         
         # Try extracting from date ranges
-        date_matches = re.findall(patterns[-1], text.lower())
+        date_matches = _DATE_RANGE_RE.findall(text_lower)
         if date_matches:
             total_years = 0
             for start_year, end_year in date_matches:
@@ -328,15 +262,8 @@ class CandidateExtractor:
     def _extract_education(self, text: str) -> List[str]:
         """Extract education degrees"""
         degrees = []
-        degree_patterns = [
-            (r"\b(?:B\.?S\.?|Bachelor'?s?|B\.?A\.?|B\.?Sc\.?)\b", "Bachelor's"),
-            (r"\b(?:M\.?S\.?|Master'?s?|M\.?A\.?|M\.?Sc\.?|MBA)\b", "Master's"),
-            (r"\b(?:Ph\.?D\.?|Doctorate|Doctoral)\b", "PhD"),
-            (r"\b(?:Associate'?s?|A\.?S\.?|A\.?A\.?)\b", "Associate's"),
-        ]
-        
-        for pattern, degree_name in degree_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern, degree_name in _DEGREE_RES:
+            if pattern.search(text):
                 if degree_name not in degrees:
                     degrees.append(degree_name)
         
@@ -7,27 +7,192 @@ Architecture:
 - ML scoring: ATS engine predictions (40% weight)
 - Hybrid score: Weighted combination of both approaches
 """
-import json
 import logging
-from typing import Dict, List, Optional, Tuple
-from pathlib import Path
+import re
+import threading
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from ..storage.models import ScoreBreakdown, CVProfile, JobPosting
 from ..core.config import get_config
+from ..core.skill_registry import get_skill_registry
 from ..ml_engine.ats_predictor import ATSPredictor
+from ..core.metrics import ML_INFERENCE_LATENCY, FALLBACKS
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keyword scoring: words of 3+ letters, minus a few stopwords
+_KEYWORD_RE = re.compile(r'\b[a-z]{3,}\b')
+_STOPWORDS = frozenset({'the', 'and', 'or', 'with', 'for', 'in', 'on', 'at', 'to', 'of', 'a', 'an'})
+MAX_JOB_KEYWORDS = 20
+
+# Shared empty result, so non-matching jobs keep no set of their own
+_NO_SKILLS: FrozenSet[int] = frozenset()
+
+
+def _cached(model, name: str, compute: Callable):
+    """
+    Memoize a derived value in one of a model's private attributes
+    
+    Reads `__pydantic_private__` directly: `model._name` goes through
+    pydantic's `__getattr__`, which costs more than the lookup it saves.
+    """
+    private = model.__pydantic_private__
+    value = private.get(name)
+    if value is None:
+        value = private[name] = compute()
+    return value
+
+
+# Title similarity: role patterns tried on CV text, role synonym groups,
+# seniority levels and broad domains (all matched as substrings of titles)
+_ROLE_PATTERNS = [
+    re.compile(r'(software|web|mobile|backend|frontend|full[ -]?stack|data|ml|ai|devops|security|cloud)\s+(engineer|developer|architect|analyst)'),
+    re.compile(r'(junior|senior|lead|principal)\s+(engineer|developer|programmer)'),
+    re.compile(r'(intern|trainee|student).*?(engineer|developer|programmer)'),
+]
+ROLE_KEYWORDS = {
+    'developer': ['engineer', 'programmer', 'coder', 'dev', 'software'],
+    'engineer': ['developer', 'architect', 'programmer', 'software'],
+    'analyst': ['researcher', 'data scientist', 'scientist', 'specialist'],
+    'manager': ['lead', 'director', 'head', 'supervisor', 'coordinator'],
+    'intern': ['trainee', 'junior', 'graduate', 'student', 'entry'],
+    'senior': ['sr', 'lead', 'principal', 'expert'],
+    'junior': ['jr', 'entry', 'associate', 'trainee'],
+    'full stack': ['fullstack', 'full-stack', 'full stack developer'],
+    'backend': ['back-end', 'back end', 'server side'],
+    'frontend': ['front-end', 'front end', 'client side', 'ui'],
+    'data': ['data science', 'analytics', 'business intelligence'],
+    'ai': ['artificial intelligence', 'machine learning', 'ml', 'deep learning'],
+    'devops': ['devsecops', 'sre', 'site reliability', 'infrastructure'],
+    'security': ['cyber', 'infosec', 'penetration', 'ethical hacker'],
+    'marketing': ['digital marketing', 'growth', 'brand', 'content'],
+}
+SENIORITY_LEVELS = ['intern', 'junior', 'mid', 'senior', 'lead', 'principal', 'staff', 'manager', 'director']
+TITLE_DOMAINS = ['engineering', 'developer', 'data', 'marketing', 'sales', 'design', 'product']
+_ROLE_GROUPS = [(key, *synonyms) for key, synonyms in ROLE_KEYWORDS.items()]
+_SENIORITY_GROUPS = [(level,) for level in SENIORITY_LEVELS]
+_DOMAIN_GROUPS = [(domain,) for domain in TITLE_DOMAINS]
+
+
+def _bitmask(text: str, groups) -> int:
+    """Bit i is set when any term of groups[i] occurs in text"""
+    mask = 0
+    for bit, terms in enumerate(groups):
+        if any(term in text for term in terms):
+            mask |= 1 << bit
+    return mask
+
+
+@dataclass(frozen=True)
+class TitleFeatures:
+    """Precomputed title-similarity features of one lower-case role/title"""
+    text: str
+    terms: FrozenSet[str]
+    roles: int      # ROLE_KEYWORDS groups present (bitmask)
+    seniority: int  # SENIORITY_LEVELS present (bitmask)
+    domains: int    # TITLE_DOMAINS present (bitmask)
+    
+    @classmethod
+    def of(cls, title: str) -> "TitleFeatures":
+        return cls(
+            text=title,
+            terms=frozenset(title.split()),
+            roles=_bitmask(title, _ROLE_GROUPS),
+            seniority=_bitmask(title, _SENIORITY_GROUPS),
+            domains=_bitmask(title, _DOMAIN_GROUPS)
+        )
+
 
-@dataclass
 class SkillMatch:
-    """Skill matching results"""
-    matched_skills: List[str]
-    missing_skills: List[str]
-    extra_skills: List[str]
-    match_ratio: float
+    """
+    Skill matching results
+    
+    Holds skill ID sets (mostly shared with the cached CV/job sets); gaps,
+    extras and names are derived on access.
+    """
+    __slots__ = ("cv", "required", "preferred", "matched_required", "matched_preferred", "match_ratio", "registry")
+    
+    def __init__(self, cv, required, preferred, matched_required, matched_preferred, match_ratio, registry):
+        self.cv = cv
+        self.required = required
+        self.preferred = preferred
+        self.matched_required = matched_required
+        self.matched_preferred = matched_preferred
+        self.match_ratio = match_ratio
+        self.registry = registry
+    
+    @property
+    def matched_skills(self) -> List[str]:
+        return self.registry.names(self.matched_required | self.matched_preferred)
+    
+    @property
+    def missing_skills(self) -> List[str]:
+        return (
+            self.registry.names(self.required - self.matched_required) +
+            self.registry.names(self.preferred - self.matched_preferred)
+        )
+    
+    @property
+    def extra_skills(self) -> List[str]:
+        return self.registry.names(self.cv - self.required - self.preferred)[:10]  # Limit to top 10
+
+
+class ScoreRecord:
+    """
+    Internal per-job score used inside the scoring loop
+    
+    Plain slots and no validation; the ScoreBreakdown model (with skill
+    names) is only built by `breakdown()` for matches that are returned or
+    persisted.
+    """
+    __slots__ = (
+        "skills", "experience_score", "education_score", "keyword_score",
+        "rule_based_score", "ml_score", "hybrid_score", "overqualified", "underqualified"
+    )
+    
+    def __init__(
+        self,
+        skills: SkillMatch,
+        experience_score: float,
+        education_score: float,
+        keyword_score: float,
+        rule_based_score: float,
+        ml_score: Optional[float],
+        hybrid_score: float,
+        overqualified: bool,
+        underqualified: bool
+    ):
+        self.skills = skills
+        self.experience_score = experience_score
+        self.education_score = education_score
+        self.keyword_score = keyword_score
+        self.rule_based_score = rule_based_score
+        self.ml_score = ml_score
+        self.hybrid_score = max(0.0, min(1.0, hybrid_score))  # As ScoreBreakdown clamps it
+        self.overqualified = overqualified
+        self.underqualified = underqualified
+    
+    @property
+    def skill_score(self) -> float:
+        return self.skills.match_ratio
+    
+    def breakdown(self) -> ScoreBreakdown:
+        """Materialize the validated ScoreBreakdown"""
+        return ScoreBreakdown(
+            skill_score=self.skills.match_ratio,
+            experience_score=self.experience_score,
+            education_score=self.education_score,
+            keyword_score=self.keyword_score,
+            rule_based_score=self.rule_based_score,
+            ml_score=self.ml_score,
+            hybrid_score=self.hybrid_score,
+            matched_skills=self.skills.matched_skills,
+            missing_skills=self.skills.missing_skills,
+            extra_skills=self.skills.extra_skills,
+            overqualified=self.overqualified,
+            underqualified=self.underqualified
+        )
 
 
 class HybridScoringAgent:
@@ -44,40 +209,55 @@ class HybridScoringAgent:
         self.config = config or get_config()
         self.scoring_config = self.config.scoring
         
-        # Initialize ML predictor if enabled
-        self.ml_predictor = None
-        if self.scoring_config.ml_enabled:
+        # ML predictor is loaded by load_ml_model() (pipeline warm-up) or on first use
+        self._ml_predictor: Optional[ATSPredictor] = None
+        self._ml_pending = self.scoring_config.ml_enabled
+        self._ml_lock = threading.Lock()
+        
+        # Shared skill IDs, aliases and families for canonical matching
+        self.skill_registry = get_skill_registry()
+    
+    @property
+    def ml_predictor(self) -> Optional[ATSPredictor]:
+        """Loaded ML predictor, or None (disabled or failed to load)"""
+        if self._ml_pending:
+            self.load_ml_model()
+        return self._ml_predictor
+    
+    @ml_predictor.setter
+    def ml_predictor(self, predictor: Optional[ATSPredictor]) -> None:
+        self._ml_pending = False
+        self._ml_predictor = predictor
+    
+    @property
+    def ml_loaded(self) -> bool:
+        """Whether the ML model is loaded (without triggering the load)"""
+        return self._ml_predictor is not None
+    
+    def load_ml_model(self) -> bool:
+        """
+        Load the ATS model if enabled and not yet attempted
+        
+        Returns:
+            True if a model is loaded
+        """
+        with self._ml_lock:
+            if not self._ml_pending:
+                return self._ml_predictor is not None
             try:
-                self.ml_predictor = ATSPredictor(model_dir="models/production")
-                if self.ml_predictor.load_model():
+                predictor = ATSPredictor(model_dir="models/production")
+                if predictor.load_model():
                     logger.info("[OK] ML Predictor initialized for hybrid scoring")
-                    model_info = self.ml_predictor.get_model_info()
+                    model_info = predictor.get_model_info()
                     logger.info(f"   Model: {model_info.get('model_name', 'Unknown')}")
                     logger.info(f"   Test Recall: {model_info.get('test_metrics', {}).get('recall', 'N/A')}")
+                    self._ml_predictor = predictor
                 else:
                     logger.warning("[WARN] Failed to load ML model. Using rule-based only.")
-                    self.ml_predictor = None
             except Exception as e:
                 logger.warning(f"[WARN] ML Predictor unavailable: {e}. Using rule-based only.")
-                self.ml_predictor = None
-        
-        # Load skills database for canonical matching
-        self.skills_database = self._load_skills_database()
-    
-    def _load_skills_database(self) -> Dict[str, List[str]]:
-        """Load canonical skills database for fuzzy matching"""
-        skills_path = Path(self.config.skills_database_path)
-        
-        if not skills_path.exists():
-            logger.warning(f"Skills database not found: {skills_path}")
-            return {}
-        
-        try:
-            with open(skills_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load skills database: {e}")
-            return {}
+            self._ml_pending = False
+            return self._ml_predictor is not None
     
     def score_match(
         self, 
@@ -96,6 +276,19 @@ class HybridScoringAgent:
         Returns:
             ScoreBreakdown with all scoring components
         """
+        return self.score_record(cv, job, include_ml).breakdown()
+    
+    def score_record(
+        self,
+        cv: CVProfile,
+        job: JobPosting,
+        include_ml: bool = True
+    ) -> ScoreRecord:
+        """
+        Score CV-Job match into a lightweight ScoreRecord (no pydantic models)
+        
+        Used by the pipeline's scoring loop; see score_match() for arguments.
+        """
         # 1. Rule-based scoring
         skill_match = self._score_skills(cv, job)
         experience_score = self._score_experience(cv, job)
@@ -136,18 +329,15 @@ class HybridScoringAgent:
         overqualified = self._is_overqualified(cv, job, experience_score)
         underqualified = self._is_underqualified(cv, job, skill_match.match_ratio)
         
-        # 5. Build score breakdown
-        return ScoreBreakdown(
-            skill_score=skill_match.match_ratio,
+        # 5. Build score record
+        return ScoreRecord(
+            skills=skill_match,
             experience_score=experience_score,
             education_score=education_score,
             keyword_score=keyword_score,
             rule_based_score=rule_based_score,
             ml_score=ml_score,
             hybrid_score=hybrid_score,
-            matched_skills=skill_match.matched_skills,
-            missing_skills=skill_match.missing_skills,
-            extra_skills=skill_match.extra_skills,
             overqualified=overqualified,
             underqualified=underqualified
         )
@@ -156,23 +346,18 @@ class HybridScoringAgent:
         """
         Score skill matching between CV and job with enhanced precision
         
-        Uses fuzzy matching, synonym detection, and weighted scoring
+        Skills are compared as SkillRegistry IDs: aliases share an ID and
+        related skills share a family, with a substring fallback for the rest
         """
-        cv_skills = set(self._normalize_skills(cv.skills))
-        required_skills = set(self._normalize_skills(job.required_skills))
-        preferred_skills = set(self._normalize_skills(job.preferred_skills))
+        cv_skills = self.cv_skill_ids(cv)
+        required_skills, preferred_skills = self.job_skill_ids(job)
         
-        # Enhanced matching with fuzzy logic and synonyms
+        # Enhanced matching with families and fuzzy fallback
         matched_required = self._find_skill_matches(cv_skills, required_skills)
         matched_preferred = self._find_skill_matches(cv_skills, preferred_skills)
-        matched_skills = list(set(matched_required + matched_preferred))
         
-        # Find gaps
-        missing_required = [s for s in required_skills if not self._has_skill_match(s, cv_skills)]
-        missing_preferred = [s for s in preferred_skills if not self._has_skill_match(s, cv_skills)]
-        
-        # Extra skills candidate has
-        extra_skills = list(cv_skills - required_skills - preferred_skills)
+        # Gaps (matches are a subset of the job's skills)
+        missing_required = len(required_skills) - len(matched_required)
         
         # Calculate match ratio with enhanced precision
         total_required = len(required_skills) or 1
@@ -185,94 +370,73 @@ class HybridScoringAgent:
         match_ratio = (required_match_ratio * 0.85) + (preferred_match_ratio * 0.15)
         
         # Penalty for missing critical required skills
-        if len(missing_required) > len(required_skills) * 0.5:  # Missing more than 50%
+        if missing_required > len(required_skills) * 0.5:  # Missing more than 50%
             match_ratio *= 0.7  # 30% penalty
         
         return SkillMatch(
-            matched_skills=matched_skills,
-            missing_skills=missing_required + missing_preferred,
-            extra_skills=extra_skills[:10],  # Limit to top 10
-            match_ratio=min(1.0, match_ratio)
+            cv=cv_skills,
+            required=required_skills,
+            preferred=preferred_skills,
+            matched_required=matched_required,
+            matched_preferred=matched_preferred,
+            match_ratio=min(1.0, match_ratio),
+            registry=self.skill_registry
         )
     
-    def _find_skill_matches(self, cv_skills: set, job_skills: set) -> List[str]:
-        """Find skill matches with fuzzy matching and synonyms"""
-        matches = []
-        
-        # Skill synonyms for better matching
-        synonyms = {
-            'javascript': ['js', 'es6', 'es2015', 'ecmascript'],
-            'python': ['py', 'python3', 'python2'],
-            'java': ['jdk', 'jre', 'java8', 'java11', 'java17'],
-            'csharp': ['c#', 'cs', 'dotnet', '.net', 'net', 'asp.net', 'aspnet'],
-            'cpp': ['c++', 'cplusplus'],
-            'sql': ['mysql', 'postgresql', 'mssql', 'tsql', 'plsql', 'ms sql', 'microsoft sql'],
-            'react': ['reactjs', 'react.js'],
-            'angular': ['angularjs', 'angular.js'],
-            'vue': ['vuejs', 'vue.js'],
-            'node': ['nodejs', 'node.js'],
-            'docker': ['containerization', 'containers'],
-            'kubernetes': ['k8s'],
-            'aws': ['amazon web services', 'amazon cloud'],
-            'gcp': ['google cloud', 'google cloud platform'],
-            'azure': ['microsoft azure', 'azure cloud'],
-            'machine learning': ['ml', 'machinelearning'],
-            'deep learning': ['dl', 'deeplearning', 'neural networks'],
-            'artificial intelligence': ['ai'],
-            'devops': ['dev ops', 'devsecops'],
-            'cicd': ['ci/cd', 'ci-cd', 'continuous integration', 'continuous deployment'],
-            'api': ['rest api', 'restful', 'rest', 'graphql'],
-            'html': ['html5'],
-            'css': ['css3', 'scss', 'sass'],
-            'typescript': ['ts'],
-            'mongodb': ['mongo'],
-            'postgresql': ['postgres'],
-            'jenkins': ['ci'],
-            'git': ['github', 'gitlab', 'version control'],
-            'agile': ['scrum', 'kanban'],
-            'flask': ['python flask'],
-            'fastapi': ['fast api'],
-            'django': ['python django'],
-            'spring': ['spring boot', 'springboot'],
-            'llm': ['large language model', 'gpt', 'generative ai', 'genai'],
-            'nlp': ['natural language processing', 'text processing'],
-            'rag': ['retrieval augmented generation'],
-            'langchain': ['lang chain'],
-            'tensorflow': ['tf'],
-            'pytorch': ['torch'],
-            'scikit': ['sklearn', 'scikit-learn'],
-        }
+    def cv_skill_ids(self, cv: CVProfile) -> FrozenSet[int]:
+        """CV skill IDs, normalized once per CV and cached on the profile"""
+        return _cached(cv, '_skill_ids', lambda: frozenset(self.skill_registry.intern_all(cv.skills)))
+    
+    def job_skill_ids(self, job: JobPosting) -> Tuple[FrozenSet[int], FrozenSet[int]]:
+        """(required, preferred) skill IDs, normalized once per job and cached on the posting"""
+        return _cached(job, '_skill_ids', lambda: (
+            frozenset(self.skill_registry.intern_all(job.required_skills)),
+            frozenset(self.skill_registry.intern_all(job.preferred_skills))
+        ))
+    
+    def job_keywords(self, job: JobPosting) -> FrozenSet[str]:
+        """Description keywords, extracted once per job and cached on the posting"""
+        return _cached(job, '_keywords', lambda: frozenset(self._extract_keywords(job.description or "")))
+    
+    def cv_tokens(self, cv: CVProfile) -> FrozenSet[str]:
+        """Words of the CV text, tokenized once per CV and cached on the profile"""
+        return _cached(cv, '_tokens', lambda: frozenset(_KEYWORD_RE.findall((cv.raw_text or "").lower())))
+    
+    def prepare_jobs(self, jobs: List[JobPosting]) -> None:
+        """Precompute a job catalog's skills, keywords and title features (call after loading jobs)"""
+        for job in jobs:
+            self.job_skill_ids(job)
+            self.job_keywords(job)
+            self.job_title_features(job)
+    
+    def prepare_cv(self, cv: CVProfile) -> None:
+        """Precompute a CV's skills, text tokens and role features (once per request)"""
+        self.cv_skill_ids(cv)
+        self.cv_tokens(cv)
+        self.cv_role_features(cv)
+    
+    def _find_skill_matches(self, cv_skills: FrozenSet[int], job_skills: FrozenSet[int]) -> Set[int]:
+        """Job skill IDs satisfied by the CV (same skill, same family, or fuzzy name match)"""
+        registry = self.skill_registry
+        cv_families = {registry.family(skill_id) for skill_id in cv_skills}
+        cv_names = None  # Built on the first fuzzy comparison
+        matches = set()
         
         for job_skill in job_skills:
-            # Direct match
-            if job_skill in cv_skills:
-                matches.append(job_skill)
-                continue
-            
-            # Check synonyms
-            matched = False
-            for canonical, aliases in synonyms.items():
-                if job_skill in aliases or job_skill == canonical:
-                    # Check if CV has canonical or any alias
-                    if canonical in cv_skills or any(alias in cv_skills for alias in aliases):
-                        matches.append(job_skill)
-                        matched = True
-                        break
-            
-            if matched:
+            # Direct match, alias or related skill (e.g. "mysql" for "sql")
+            if job_skill in cv_skills or registry.family(job_skill) in cv_families:
+                matches.add(job_skill)
                 continue
             
             # Fuzzy partial match (e.g., "python" matches "python3")
-            for cv_skill in cv_skills:
-                if len(job_skill) >= 4 and (job_skill in cv_skill or cv_skill in job_skill):
-                    matches.append(job_skill)
-                    break
-        
-        return matches
-    
-    def _has_skill_match(self, skill: str, cv_skills: set) -> bool:
-        """Check if a skill has a match in CV skills"""
-        return len(self._find_skill_matches(cv_skills, {skill})) > 0
+            name = registry.name(job_skill)
+            if len(name) >= 4:
+                if cv_names is None:
+                    cv_names = [registry.name(cv_skill) for cv_skill in cv_skills]
+                if any(name in cv_name or cv_name in name for cv_name in cv_names):
+                    matches.add(job_skill)
+        
+        return matches or _NO_SKILLS
     
     def _score_experience(self, cv: CVProfile, job: JobPosting) -> float:
         """Score experience match with tighter ranges and precision (0-1)"""
@@ -309,12 +473,20 @@ class HybridScoringAgent:
         
         return 0.6
     
-    def _score_title_similarity(self, cv: CVProfile, job: JobPosting) -> float:
-        """Score similarity between CV experience/title and job title for better role matching"""
+    def job_title_features(self, job: JobPosting) -> TitleFeatures:
+        """Title features, computed once per job and cached on the posting"""
+        return _cached(job, '_title', lambda: TitleFeatures.of(job.title.lower()))
+    
+    def cv_role_features(self, cv: CVProfile) -> Tuple[TitleFeatures, ...]:
+        """Features of the candidate's roles, computed once per CV (empty if none found)"""
+        return _cached(cv, '_roles', lambda: tuple(TitleFeatures.of(role) for role in self._cv_roles(cv)))
+    
+    @staticmethod
+    def _cv_roles(cv: CVProfile) -> List[str]:
+        """Candidate's role/title from extracted data, else from common CV text patterns"""
         if not cv.extracted_data:
-            return 0.4  # Low score if no data
+            return []
         
-        # Extract candidate's role/title from CV
         cv_roles = []
         if 'title' in cv.extracted_data:
             cv_roles.append(cv.extracted_data['title'].lower())
@@ -323,81 +495,44 @@ class HybridScoringAgent:
         
         # Use CV text as fallback
         if not cv_roles and cv.raw_text:
-            # Try to extract role from common patterns
-            import re
-            role_patterns = [
-                r'(software|web|mobile|backend|frontend|full[ -]?stack|data|ml|ai|devops|security|cloud)\s+(engineer|developer|architect|analyst)',
-                r'(junior|senior|lead|principal)\s+(engineer|developer|programmer)',
-                r'(intern|trainee|student).*?(engineer|developer|programmer)',
-            ]
-            for pattern in role_patterns:
-                match = re.search(pattern, cv.raw_text.lower())
+            text = cv.raw_text.lower()
+            for pattern in _ROLE_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     cv_roles.append(match.group(0))
                     break
         
+        return cv_roles
+    
+    def _score_title_similarity(self, cv: CVProfile, job: JobPosting) -> float:
+        """Score similarity between CV experience/title and job title for better role matching"""
+        cv_roles = self.cv_role_features(cv)
         if not cv_roles:
-            return 0.4  # No role information found
-        
-        job_title = job.title.lower()
-        
-        # Role synonyms and related terms
-        role_keywords = {
-            'developer': ['engineer', 'programmer', 'coder', 'dev', 'software'],
-            'engineer': ['developer', 'architect', 'programmer', 'software'],
-            'analyst': ['researcher', 'data scientist', 'scientist', 'specialist'],
-            'manager': ['lead', 'director', 'head', 'supervisor', 'coordinator'],
-            'intern': ['trainee', 'junior', 'graduate', 'student', 'entry'],
-            'senior': ['sr', 'lead', 'principal', 'expert'],
-            'junior': ['jr', 'entry', 'associate', 'trainee'],
-            'full stack': ['fullstack', 'full-stack', 'full stack developer'],
-            'backend': ['back-end', 'back end', 'server side'],
-            'frontend': ['front-end', 'front end', 'client side', 'ui'],
-            'data': ['data science', 'analytics', 'business intelligence'],
-            'ai': ['artificial intelligence', 'machine learning', 'ml', 'deep learning'],
-            'devops': ['devsecops', 'sre', 'site reliability', 'infrastructure'],
-            'security': ['cyber', 'infosec', 'penetration', 'ethical hacker'],
-            'marketing': ['digital marketing', 'growth', 'brand', 'content'],
-        }
+            return 0.4  # No data / no role information found
+        
+        job_title = self.job_title_features(job)
         
         # Check for direct matches
         for cv_role in cv_roles:
             # Exact match
-            if cv_role in job_title or job_title in cv_role:
+            if cv_role.text in job_title.text or job_title.text in cv_role.text:
                 return 1.0
             
-            # Check if key terms match
-            job_terms = set(job_title.split())
-            cv_terms = set(cv_role.split())
-            
-            # Strong overlap
-            overlap = job_terms.intersection(cv_terms)
-            if len(overlap) >= 2:
+            # Strong overlap of key terms
+            if len(job_title.terms & cv_role.terms) >= 2:
                 return 0.95
             
-            # Check synonyms
-            for key, synonyms in role_keywords.items():
-                key_in_job = key in job_title or any(syn in job_title for syn in synonyms)
-                key_in_cv = key in cv_role or any(syn in cv_role for syn in synonyms)
-                
-                if key_in_job and key_in_cv:
-                    return 0.85
-        
-        # Check if seniority level matches
-        seniority_levels = ['intern', 'junior', 'mid', 'senior', 'lead', 'principal', 'staff', 'manager', 'director']
-        for level in seniority_levels:
-            if level in job_title:
-                for cv_role in cv_roles:
-                    if level in cv_role:
-                        return 0.7  # Seniority match even if role differs
-        
-        # Check if general domain matches (engineering, data, marketing, etc.)
-        domains = ['engineering', 'developer', 'data', 'marketing', 'sales', 'design', 'product']
-        for domain in domains:
-            domain_in_job = domain in job_title
-            domain_in_cv = any(domain in cv_role for cv_role in cv_roles)
-            if domain_in_job and domain_in_cv:
-                return 0.5  # Same domain, different specific role
+            # Same role group (synonyms)
+            if job_title.roles & cv_role.roles:
+                return 0.85
+        
+        # Seniority level matches even if role differs
+        if any(job_title.seniority & cv_role.seniority for cv_role in cv_roles):
+            return 0.7
+        
+        # General domain matches (engineering, data, marketing, etc.)
+        if any(job_title.domains & cv_role.domains for cv_role in cv_roles):
+            return 0.5  # Same domain, different specific role
         
         return 0.3  # Low score if no title match
     
@@ -434,35 +569,26 @@ class HybridScoringAgent:
         if not cv.raw_text or not job.description:
             return 0.5  # Neutral if data missing
         
-        cv_text = cv.raw_text.lower()
-        job_desc = job.description.lower()
-        
-        # Extract key terms from job description
-        keywords = self._extract_keywords(job_desc)
+        # Key terms from the job description (computed once per job)
+        keywords = self.job_keywords(job)
         
         if not keywords:
             return 0.5
         
-        # Count matches
-        matches = sum(1 for kw in keywords if kw in cv_text)
+        # Count matches against the CV's word set
+        matches = len(keywords & self.cv_tokens(cv))
         
         return min(1.0, matches / len(keywords))
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract important keywords from job description"""
-        # Simple approach: extract common technical terms
-        import re
+    @staticmethod
+    def _extract_keywords(text: str) -> List[str]:
+        """Extract important keywords from job description (first occurrences, in text order)"""
+        words = _KEYWORD_RE.findall(text.lower())
         
-        # Remove common words
-        stopwords = {'the', 'and', 'or', 'with', 'for', 'in', 'on', 'at', 'to', 'of', 'a', 'an'}
+        # Filter and deduplicate, keeping text order so the choice is reproducible
+        keywords = [w for w in dict.fromkeys(words) if w not in _STOPWORDS]
         
-        # Extract words (3+ characters)
-        words = re.findall(r'\b[a-z]{3,}\b', text.lower())
-        
-        # Filter and deduplicate
-        keywords = [w for w in set(words) if w not in stopwords]
-        
-        return keywords[:20]  # Top 20 keywords
+        return keywords[:MAX_JOB_KEYWORDS]
     
     def _get_ml_score(self, cv: CVProfile, job: JobPosting) -> Optional[Dict]:
         """Get ML model prediction score"""
@@ -482,49 +608,16 @@ class HybridScoringAgent:
             }
             
             # Get prediction from ML predictor
-            result = self.ml_predictor.predict(cv_data, use_optimal_threshold=True)
+            with ML_INFERENCE_LATENCY.time():
+                result = self.ml_predictor.predict(cv_data, use_optimal_threshold=True)
             
             return result
-            
+        
         except Exception as e:
             logger.error(f"ML scoring failed: {e}")
+            FALLBACKS.inc(component="ml", reason="inference_error")
             return None
     
-    def _normalize_skills(self, skills: List[str]) -> List[str]:
-        """Normalize skill names for matching"""
-        normalized = []
-        
-        for skill in skills:
-            # Lowercase and strip
-            skill = skill.lower().strip()
-            
-            # Remove common variations
-            skill = skill.replace('.', '').replace('-', ' ')
-            
-            # Check canonical database for standardization
-            canonical = self._get_canonical_skill(skill)
-            normalized.append(canonical or skill)
-        
-        return normalized
-    
-    def _get_canonical_skill(self, skill: str) -> Optional[str]:
-        """Get canonical skill name from database"""
-        if not self.skills_database:
-            return None
-        
-        skill_lower = skill.lower()
-        
-        # Direct match
-        if skill_lower in self.skills_database:
-            return skill_lower
-        
-        # Fuzzy match (simplified)
-        for canonical, aliases in self.skills_database.items():
-            if skill_lower in [a.lower() for a in aliases]:
-                return canonical
-        
-        return None
-    
     def _is_overqualified(self, cv: CVProfile, job: JobPosting, exp_score: float) -> bool:
         """Check if candidate is overqualified"""
         if job.min_experience_years is None or cv.experience_years is None:
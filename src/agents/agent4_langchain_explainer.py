@@ -12,10 +12,33 @@ from langchain_core.runnables import RunnablePassthrough
 
 from ..storage.models import MatchResult, DecisionType
 from ..core.config import get_config
+from ..core.metrics import LLM_CALL_LATENCY, FALLBACKS
+from .explanation_templates import Bands
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rule-based wording, declared once (the fallback path when Ollama is down)
+_OPENINGS = Bands([
+    (0.90, "{candidate} demonstrates outstanding qualifications for the {job_title} position with a {score:.0%} match score."),
+    (0.80, "{candidate} presents strong credentials for the {job_title} position with a {score:.0%} match score."),
+    (0.70, "{candidate} shows good potential for the {job_title} position with a {score:.0%} match score."),
+], below="{candidate} presents a moderate fit for the {job_title} position with a {score:.0%} match score.")
+_STRENGTHS = "Strong capabilities in {skills} ({count} matched skills)."
+_GAPS = "Gaps in {skills}."
+_INTERVIEW_FOCUS = "Recommend technical interview focusing on {skills}."
+_RECOMMENDATIONS = {
+    DecisionType.REVIEW: "Recommend detailed manual review of experience and portfolio.",
+    DecisionType.REJECT: "Current profile does not meet minimum requirements.",
+}
+
+_INSIGHT_SKILLS = "Strong skill alignment ({count} matched)"
+_INSIGHT_GAPS = "Missing {count} required skills"
+_INSIGHT_RECOMMENDATIONS = {
+    DecisionType.SHORTLIST: ("Proceed with technical screening", "Validate key skills in interview"),
+    DecisionType.REVIEW: ("Conduct detailed experience review", "Consider training for missing skills"),
+    DecisionType.REJECT: ("Consider for alternative roles",),
+}
+
 
 class LangChainExplainerAgent:
     """
@@ -69,7 +92,7 @@ class LangChainExplainerAgent:
             
             self.llm_available = True
             logger.info(f"✅ LangChain Explainer initialized: {self.llm_config.model}")
-            
+        
         except Exception as e:
             self.llm_available = False
             logger.error(f"❌ LangChain initialization failed: {e}")
@@ -103,7 +126,7 @@ Based on the score category "{score_category}", provide a professional explanati
 
 Keep it under 150 words, professional, and fact-based. Use actual skill names provided above.
 """
-    
+
     def _get_score_category(self, score: float) -> str:
         """Get descriptive category for score"""
         if score >= 0.90:
@@ -117,13 +140,14 @@ Keep it under 150 words, professional, and fact-based. Use actual skill names pr
         else:
             return "Below Requirements"
     
-    def generate_explanation(self, match_result: MatchResult) -> str:
+    def generate_explanation(self, match_result: MatchResult, use_llm: bool = True) -> str:
         """
         Generate explanation using LangChain
         
-        Falls back to rule-based if LLM unavailable
+        Falls back to rule-based if LLM unavailable or use_llm is False
         """
-        if not self.llm_available:
+        if not (use_llm and self.llm_available):
+            FALLBACKS.inc(component="llm", reason="llm_unavailable")
             return self._generate_rule_based_explanation(match_result)
         
         try:
@@ -145,62 +169,51 @@ Keep it under 150 words, professional, and fact-based. Use actual skill names pr
             }
             
             # Invoke chain
-            if self.llm_config.streaming:
-                # Streaming mode (for real-time UI updates)
-                response = ""
-                for chunk in self.chain.stream(input_data):
-                    response += chunk
-                return response.strip()
-            else:
-                # Batch mode (faster for bulk processing)
-                response = self.chain.invoke(input_data)
-                return response.strip()
-                
+            with LLM_CALL_LATENCY.time(provider="langchain"):
+                if self.llm_config.streaming:
+                    # Streaming mode (for real-time UI updates)
+                    response = ""
+                    for chunk in self.chain.stream(input_data):
+                        response += chunk
+                else:
+                    # Batch mode (faster for bulk processing)
+                    response = self.chain.invoke(input_data)
+            return response.strip()
+        
         except Exception as e:
             logger.error(f"LangChain explanation failed: {e}")
             logger.warning("Falling back to rule-based explanation")
+            FALLBACKS.inc(component="llm", reason="llm_error")
             return self._generate_rule_based_explanation(match_result)
     
     def _generate_rule_based_explanation(self, match_result: MatchResult) -> str:
         """
         Fallback rule-based explanation (same as original agent4)
-        Used when LLM is unavailable
+        Used when LLM is unavailable; built from the fragments at the top of
+        this module
         """
         score = match_result.score_breakdown
         decision = match_result.decision
         candidate = match_result.candidate_name or "This candidate"
         score_val = match_result.final_score
-        
-        parts = []
+        matched, missing = score.matched_skills, score.missing_skills
         
         # Opening based on score
-        if score_val >= 0.90:
-            parts.append(f"{candidate} demonstrates outstanding qualifications for the {match_result.job_title} position with a {score_val:.0%} match score.")
-        elif score_val >= 0.80:
-            parts.append(f"{candidate} presents strong credentials for the {match_result.job_title} position with a {score_val:.0%} match score.")
-        elif score_val >= 0.70:
-            parts.append(f"{candidate} shows good potential for the {match_result.job_title} position with a {score_val:.0%} match score.")
-        else:
-            parts.append(f"{candidate} presents a moderate fit for the {match_result.job_title} position with a {score_val:.0%} match score.")
+        parts = [_OPENINGS[score_val].format(candidate=candidate, job_title=match_result.job_title, score=score_val)]
         
         # Strengths
-        if score.matched_skills:
-            top_skills = ', '.join(score.matched_skills[:6])
-            parts.append(f"Strong capabilities in {top_skills} ({len(score.matched_skills)} matched skills).")
+        if matched:
+            parts.append(_STRENGTHS.format(skills=', '.join(matched[:6]), count=len(matched)))
         
         # Gaps
-        if score.missing_skills:
-            missing_sample = ', '.join(score.missing_skills[:4])
-            parts.append(f"Gaps in {missing_sample}.")
+        if missing:
+            parts.append(_GAPS.format(skills=', '.join(missing[:4])))
         
         # Recommendation
         if decision.decision == DecisionType.SHORTLIST:
-            focus_skills = ', '.join(score.matched_skills[:3]) if score.matched_skills else "core competencies"
-            parts.append(f"Recommend technical interview focusing on {focus_skills}.")
-        elif decision.decision == DecisionType.REVIEW:
-            parts.append("Recommend detailed manual review of experience and portfolio.")
+            parts.append(_INTERVIEW_FOCUS.format(skills=', '.join(matched[:3]) if matched else "core competencies"))
         else:
-            parts.append("Current profile does not meet minimum requirements.")
+            parts.append(_RECOMMENDATIONS[decision.decision])
         
         return " ".join(parts)
     
@@ -214,7 +227,7 @@ Keep it under 150 words, professional, and fact-based. Use actual skill names pr
         # Strengths
         strengths = []
         if score.skill_score >= 0.7:
-            strengths.append(f"Strong skill alignment ({len(score.matched_skills)} matched)")
+            strengths.append(_INSIGHT_SKILLS.format(count=len(score.matched_skills)))
         if score.experience_score >= 0.8:
             strengths.append("Relevant experience level")
         if score.education_score >= 0.8:
@@ -223,22 +236,14 @@ Keep it under 150 words, professional, and fact-based. Use actual skill names pr
         # Weaknesses
         weaknesses = []
         if len(score.missing_skills) >= 3:
-            weaknesses.append(f"Missing {len(score.missing_skills)} required skills")
+            weaknesses.append(_INSIGHT_GAPS.format(count=len(score.missing_skills)))
         if score.underqualified:
             weaknesses.append("Insufficient skill coverage")
         if score.overqualified:
             weaknesses.append("May be overqualified")
         
         # Recommendations
-        recommendations = []
-        if decision.decision == DecisionType.SHORTLIST:
-            recommendations.append("Proceed with technical screening")
-            recommendations.append("Validate key skills in interview")
-        elif decision.decision == DecisionType.REVIEW:
-            recommendations.append("Conduct detailed experience review")
-            recommendations.append("Consider training for missing skills")
-        else:
-            recommendations.append("Consider for alternative roles")
+        recommendations = list(_INSIGHT_RECOMMENDATIONS[decision.decision])
         
         return {
             "strengths": strengths,
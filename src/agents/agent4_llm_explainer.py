@@ -6,24 +6,105 @@ Integrated with new storage models and configuration system
 """
 import json
 import logging
+import threading
 from typing import Dict, List, Optional
 from pathlib import Path
 
 from ..storage.models import MatchResult, ScoreBreakdown, MatchDecision, DecisionType
 from ..core.config import get_config
+from ..core.metrics import LLM_CALL_LATENCY, LLM_TOKENS, FALLBACKS
+from ..core.circuit_breaker import CircuitBreaker
+from ..core.explanation_cache import ExplanationCache
+from .explanation_templates import Bands, pick_variant
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Try to import LLM dependencies
 try:
-    import requests
+    from ..core.http_client import pooled_session
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     logger.warning("requests not available. Agent 4 will use mock mode.")
 
 
+# Rule-based wording, declared once (the fallback path when Ollama is down)
+_OPENINGS = Bands([
+    (0.90, (
+        "{candidate} demonstrates outstanding qualifications for the {job_title} position with a {score:.0%} match score.",
+        "Exceptional match: {candidate} achieves a {score:.0%} alignment score for the {job_title} role.",
+        "{candidate} presents an excellent profile scoring {score:.0%} for this {job_title} opportunity."
+    )),
+    (0.80, (
+        "{candidate} presents strong credentials for the {job_title} position with a {score:.0%} match score.",
+        "Strong candidate: {candidate} scores {score:.0%} for the {job_title} role.",
+        "{candidate} demonstrates solid qualifications with a {score:.0%} match for this {job_title} position."
+    )),
+    (0.70, (
+        "{candidate} shows good potential for the {job_title} position with a {score:.0%} match score.",
+        "Promising candidate: {candidate} achieves a {score:.0%} alignment for the {job_title} role.",
+        "{candidate} presents a viable profile scoring {score:.0%} for this {job_title} opportunity."
+    )),
+    (0.60, (
+        "{candidate} presents a moderate fit for the {job_title} position with a {score:.0%} match score.",
+        "Borderline candidate: {candidate} scores {score:.0%} for the {job_title} role.",
+        "{candidate} shows potential but has gaps, scoring {score:.0%} for this {job_title} position."
+    )),
+], below=(
+    "{candidate} falls below requirements for the {job_title} position with a {score:.0%} match score.",
+    "Limited alignment: {candidate} achieves only a {score:.0%} match for the {job_title} role.",
+    "{candidate} shows significant gaps with a {score:.0%} score for this {job_title} opportunity."
+))
+
+_SKILL_STRENGTHS = Bands([
+    (0.85, "Excellent technical proficiency demonstrated in {skills} ({count} matched skills)."),
+    (0.70, "Strong capabilities in {skills} with {count} matched skills."),
+], below="Proficient in {skills}, covering {count} required areas.")
+_EXPERIENCE_STRENGTHS = Bands([
+    (0.85, "Experience level aligns perfectly with role requirements."),
+    (0.70, "Relevant experience level for this position."),
+])
+_EDUCATION_STRENGTHS = Bands([
+    (0.90, "Educational background exceeds role requirements."),
+    (0.75, "Appropriate educational qualifications."),
+])
+_KEYWORD_STRENGTHS = Bands([(0.80, "Resume demonstrates relevant domain expertise and terminology.")])
+
+# Banded by number of missing skills
+_SKILL_GAPS = Bands([
+    (5, "Notable gaps in {skills} and {others} other areas."),
+    (3, "Missing key competencies: {skills}."),
+], below="Minor gaps in {skills}.")
+
+_INTERVIEW_FOCUS = "Proceed with technical interview focusing on {skills}."
+_SHORTLIST_NEXT_STEPS = Bands(
+    [(0.85, "Assess cultural fit and discuss role expectations.")],
+    below="Verify proficiency in matched skills and assess learning agility for gaps."
+)
+_TRAINING_POTENTIAL = "Evaluate training potential for {skills}."
+_REJECT_SUMMARIES = Bands(
+    [(0.50, "Current profile does not align with role needs.")],
+    below="Candidate does not meet minimum requirements for this position."
+)
+_DEVELOP_SKILLS = "Suggest developing competencies in {skills} for future consideration."
+
+_INSIGHT_SKILLS = "Proficient in {count} key skills: {skills}"
+_INSIGHT_ATS = "Strong ATS compatibility score ({score:.0%})"
+_INSIGHT_GAPS = "Lacks {count} required skills: {skills}"
+_INSIGHT_LEARNING = "Assess learning potential for missing skills: {skills}"
+_INSIGHT_RECOMMENDATIONS = {
+    DecisionType.SHORTLIST: (
+        "Schedule technical interview to validate key skills",
+        "Assess cultural fit and team dynamics",
+        "Verify depth of experience in matched skills"
+    ),
+    DecisionType.REJECT: (
+        "Keep profile for future positions with different requirements",
+        "Consider for junior roles if experience is the main gap"
+    ),
+}
+
+
 class LLMExplainerAgent:
     """
     Agent 4: LLM-powered explanation generator
@@ -34,17 +115,120 @@ class LLMExplainerAgent:
     - Suggest interview focus areas
     
     Uses local Ollama for privacy and cost control
+    
+    Ollama availability is probed off the request path: `start_probe()`
+    checks in a background thread and re-checks every
+    `llm.probe_interval_seconds`. Without a running probe, the first read of
+    `llm_available` checks once, synchronously.
+    
+    Calls go through a circuit breaker: after `llm.breaker_failure_threshold`
+    consecutive failures (or a failed probe) explanations fall back to rules
+    immediately instead of waiting out `timeout_seconds`. While Ollama is
+    down the probe re-checks with exponential backoff; once it is back up,
+    the next explanation is the trial call that closes the circuit.
+    
+    Probes and explanation calls share one keep-alive session, pooling up to
+    `llm.pool_maxsize` connections to Ollama.
+    
+    `generate_explanations()` packs up to `llm.batch_size` matches for the
+    same CV into one prompt (instructions and candidate context sent once)
+    and parses a JSON explanation per match; entries that fail parsing or
+    validation are retried as single calls.
+    
+    LLM explanations are cached by prompt (`llm.cache_enabled`), so repeat
+    matches and pairs pre-generated while idle skip the LLM entirely.
     """
     
     def __init__(self, config=None):
         self.config = config or get_config()
         self.llm_config = self.config.llm
         
-        # Check if LLM is available
-        self.llm_available = self._check_llm_availability()
+        self._llm_available: Optional[bool] = None  # None = not probed yet
+        self._probe_thread: Optional[threading.Thread] = None
+        self._probe_stop = threading.Event()
+        self.breaker = CircuitBreaker(
+            "ollama",
+            failure_threshold=self.llm_config.breaker_failure_threshold,
+            reset_timeout=self.llm_config.breaker_reset_seconds,
+            max_reset_timeout=self.llm_config.breaker_max_reset_seconds
+        )
+        self.session = pooled_session("ollama", self.llm_config.pool_maxsize) if REQUESTS_AVAILABLE else None
+        self.cache: Optional[ExplanationCache] = None
+        if self.llm_config.cache_enabled:
+            self.cache = ExplanationCache(self.llm_config.cache_max_entries, self.llm_config.cache_ttl_hours * 3600)
+    
+    @property
+    def llm_available(self) -> bool:
+        """Whether explanations go to the LLM (last probe result)"""
+        if self._llm_available is None:
+            if self._probe_thread is not None:
+                return False  # Background probe has not answered yet
+            self.probe()
+        return bool(self._llm_available)
+    
+    @llm_available.setter
+    def llm_available(self, available: bool) -> None:
+        self._llm_available = available
+    
+    def probe(self) -> bool:
+        """Check Ollama now and record the result (logged when it changes)"""
+        available = bool(self._check_llm_availability())
+        if available != self._llm_available:
+            if available:
+                logger.info(f"[OK] LLM available: {self.llm_config.model}")
+                self.breaker.allow_trial()
+            else:
+                logger.warning("[WARN] LLM not available. Using rule-based explanations.")
+        if not available and self.llm_config.enabled:
+            self.breaker.trip("health probe failed")
+        self._llm_available = available
+        return available
+    
+    def health(self) -> Dict:
+        """LLM status for /health (never blocks on Ollama)"""
+        return {
+            "enabled": self.llm_config.enabled,
+            "model": self.llm_config.model,
+            "available": self._llm_available,  # None until first probe
+            "probing": self._probe_thread is not None and self._probe_thread.is_alive(),
+            "circuit": self.breaker.snapshot(),
+        }
+    
+    def start_probe(self) -> None:
+        """Probe Ollama in a background thread, re-probing periodically"""
+        if self._probe_thread is not None and self._probe_thread.is_alive():
+            return
+        if not self.llm_config.enabled or not REQUESTS_AVAILABLE:
+            self._llm_available = False
+            return
         
-        if not self.llm_available:
-            logger.warning("[WARN] LLM not available. Using rule-based explanations.")
+        self._probe_stop.clear()
+        self._probe_thread = threading.Thread(target=self._probe_loop, name="llm-probe", daemon=True)
+        self._probe_thread.start()
+    
+    def stop_probe(self) -> None:
+        """Stop the background probe"""
+        self._probe_stop.set()
+        thread, self._probe_thread = self._probe_thread, None
+        if thread is not None:
+            thread.join(timeout=self.llm_config.probe_timeout_seconds + 1)
+    
+    def close(self) -> None:
+        """Stop the probe and close pooled connections"""
+        self.stop_probe()
+        if self.session is not None:
+            self.session.close()
+    
+    def _probe_loop(self) -> None:
+        interval = self.llm_config.probe_interval_seconds
+        while True:
+            available = self.probe()
+            if interval <= 0:
+                return
+            # While down, re-probe when the breaker's backed-off timeout expires
+            wait = interval if available else min(interval, max(self.breaker.retry_in(), 0.1))
+            if self._probe_stop.wait(wait):
+                return
     
     def _check_llm_availability(self) -> bool:
         """Check if Ollama LLM is available"""
@@ -53,74 +237,220 @@ class LLMExplainerAgent:
         
         try:
             # Ping Ollama
-            response = requests.get(
+            response = self.session.get(
                 f"{self.llm_config.base_url}/api/tags",
-                timeout=2
+                timeout=(self.llm_config.connect_timeout_seconds, self.llm_config.probe_timeout_seconds)
             )
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 model_names = [m['name'] for m in models]
                 
                 if self.llm_config.model in model_names:
-                    logger.info(f"[OK] LLM available: {self.llm_config.model}")
                     return True
                 else:
                     logger.warning(f"Model {self.llm_config.model} not found. Available: {model_names}")
                     return False
+            return False
         except Exception as e:
-            logger.warning(f"LLM unavailable: {e}")
+            logger.debug(f"LLM unavailable: {e}")
             return False
     
-    def generate_explanation(self, match_result: MatchResult) -> str:
+    def generate_explanation(self, match_result: MatchResult, use_llm: bool = True) -> str:
         """
         Generate detailed explanation for a match result
         
         Args:
             match_result: Complete match result with scores and decision
+            use_llm: False for the rule-based explanation only (per call;
+                the agent's availability is not changed)
         
         Returns:
             Human-readable explanation text
         """
-        if self.llm_available:
-            try:
-                return self._generate_llm_explanation(match_result)
-            except Exception as e:
-                logger.error(f"LLM explanation failed: {e}")
-                return self._generate_rule_based_explanation(match_result)
-        else:
+        if not (use_llm and self.llm_available):
+            # Rule-based only (Ollama down or disabled for this request):
+            # no cached LLM text and no prompt build for the cache key
+            FALLBACKS.inc(component="llm", reason="llm_unavailable")
             return self._generate_rule_based_explanation(match_result)
+        
+        cached = self._cached(match_result)
+        if cached is not None:
+            return cached
+        return self._explain_uncached(match_result)
+    
+    def is_cached(self, match_result: MatchResult) -> bool:
+        """Whether an LLM explanation for this match is cached (not counted as a lookup)"""
+        return self.cache is not None and self.cache.get(self._cache_key(match_result), record=False) is not None
+    
+    def _cache_key(self, match_result: MatchResult) -> str:
+        return ExplanationCache.key(self._build_prompt(match_result))
+    
+    def _cached(self, match_result: MatchResult) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self._cache_key(match_result))
+    
+    def _cached_many(self, match_results: List[MatchResult]) -> List[Optional[str]]:
+        if self.cache is None:
+            return [None] * len(match_results)
+        return self.cache.get_many([self._cache_key(match) for match in match_results])
+    
+    def _remember(self, match_result: MatchResult, explanation: str) -> None:
+        if self.cache is not None:
+            self.cache.put(self._cache_key(match_result), explanation)
+    
+    def _explain_uncached(self, match_result: MatchResult) -> str:
+        if not self.llm_available:
+            FALLBACKS.inc(component="llm", reason="llm_unavailable")
+            return self._generate_rule_based_explanation(match_result)
+        
+        if not self.breaker.allow_request():
+            FALLBACKS.inc(component="llm", reason="circuit_open")
+            return self._generate_rule_based_explanation(match_result)
+        
+        try:
+            explanation = self._generate_llm_explanation(match_result)
+        except Exception as e:
+            self.breaker.record_failure(e)
+            logger.error(f"LLM explanation failed: {e}")
+            FALLBACKS.inc(component="llm", reason="llm_error")
+            return self._generate_rule_based_explanation(match_result)
+        self.breaker.record_success()
+        return explanation
+    
+    def generate_explanations(self, match_results: List[MatchResult], use_llm: bool = True) -> List[str]:
+        """
+        Explanations for several matches of the same CV, batched per prompt
+        
+        Args:
+            match_results: Matches sharing one candidate
+            use_llm: False for rule-based explanations only
+        
+        Returns:
+            One explanation per match, in order
+        """
+        if not (use_llm and self.llm_available):
+            # Rule-based for the lot (no cache lookup), counted once
+            if match_results:
+                FALLBACKS.inc(component="llm", reason="llm_unavailable", amount=len(match_results))
+            return [self._generate_rule_based_explanation(match) for match in match_results]
+        
+        explanations = self._cached_many(match_results)
+        pending = [i for i, explanation in enumerate(explanations) if explanation is None]
+        
+        batch_size = max(1, self.llm_config.batch_size)
+        if len(pending) < 2 or batch_size == 1:
+            for i in pending:
+                explanations[i] = self._explain_uncached(match_results[i])
+            return explanations
+        
+        for start in range(0, len(pending), batch_size):
+            positions = pending[start:start + batch_size]
+            batch = [match_results[i] for i in positions]
+            for i, explanation in zip(positions, self._explain_batch(batch)):
+                explanations[i] = explanation
+        return explanations
+    
+    def _explain_batch(self, batch: List[MatchResult]) -> List[str]:
+        """One batched call; unparsed entries retried singly"""
+        if len(batch) == 1:
+            return [self._explain_uncached(batch[0])]
+        
+        if not self.breaker.allow_request():
+            FALLBACKS.inc(component="llm", reason="circuit_open", amount=len(batch))
+            return [self._generate_rule_based_explanation(match) for match in batch]
+        
+        try:
+            parsed = self._generate_llm_batch(batch)
+        except Exception as e:
+            self.breaker.record_failure(e)
+            logger.error(f"Batched LLM explanation failed: {e}")
+            FALLBACKS.inc(component="llm", reason="llm_error", amount=len(batch))
+            return [self._generate_rule_based_explanation(match) for match in batch]
+        self.breaker.record_success()
+        
+        missing = len(batch) - len(parsed)
+        if missing:
+            FALLBACKS.inc(component="llm", reason="batch_parse", amount=missing)
+        for i, explanation in parsed.items():
+            self._remember(batch[i], explanation)
+        return [
+            parsed[i] if i in parsed else self._explain_uncached(match)
+            for i, match in enumerate(batch)
+        ]
     
     def _generate_llm_explanation(self, match_result: MatchResult) -> str:
         """Generate explanation using LLM"""
-        # Build prompt
-        prompt = self._build_prompt(match_result)
-        
-        # Call Ollama API
-        response = requests.post(
-            f"{self.llm_config.base_url}/api/generate",
-            json={
-                "model": self.llm_config.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.llm_config.temperature,
-                    "num_predict": self.llm_config.max_tokens
-                }
-            },
-            timeout=self.llm_config.timeout_seconds
-        )
+        result = self._call_ollama(self._build_prompt(match_result), self.llm_config.max_tokens)
         
-        if response.status_code == 200:
-            result = response.json()
+        if result is not None:
             explanation = result.get('response', '').strip()
             
             # Validate and clean
             if len(explanation) > 50:
+                self._remember(match_result, explanation)
                 return explanation
         
         # Fallback if response invalid
+        FALLBACKS.inc(component="llm", reason="invalid_response")
         return self._generate_rule_based_explanation(match_result)
     
+    def _generate_llm_batch(self, batch: List[MatchResult]) -> Dict[int, str]:
+        """
+        Batched explanations from one LLM call
+        
+        Returns:
+            {position in batch: explanation} for the entries that validated
+        """
+        result = self._call_ollama(
+            self._build_batch_prompt(batch),
+            self.llm_config.max_tokens * len(batch),
+            json_output=True
+        )
+        if result is None:
+            return {}
+        return parse_batch_explanations(result.get('response', ''), len(batch))
+    
+    def _call_ollama(self, prompt: str, num_predict: int, json_output: bool = False) -> Optional[Dict]:
+        """
+        POST /api/generate
+        
+        Returns:
+            Decoded response body, or None for a non-200 client error
+        
+        Raises:
+            requests.HTTPError: On 5xx (counts against the circuit breaker)
+        """
+        payload = {
+            "model": self.llm_config.model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": self.llm_config.temperature,
+                "num_predict": num_predict
+            }
+        }
+        if json_output:
+            payload["format"] = "json"
+        
+        with LLM_CALL_LATENCY.time(provider="ollama"):
+            response = self.session.post(
+                f"{self.llm_config.base_url}/api/generate",
+                json=payload,
+                timeout=(self.llm_config.connect_timeout_seconds, self.llm_config.timeout_seconds)
+            )
+        
+        if response.status_code >= 500:
+            # Server-side failure: counts against the circuit breaker
+            response.raise_for_status()
+        if response.status_code != 200:
+            return None
+        
+        result = response.json()
+        LLM_TOKENS.inc(result.get('prompt_eval_count', 0), kind="prompt")
+        LLM_TOKENS.inc(result.get('eval_count', 0), kind="output")
+        return result
+    
     def _build_prompt(self, match_result: MatchResult) -> str:
         """Build LLM prompt from match result"""
         score = match_result.score_breakdown
@@ -156,169 +486,114 @@ Write a concise 2-3 paragraph explanation that:
 4. Provides 1-2 actionable recommendations for HR
 
 Keep it professional, factual, and under 200 words. Do NOT invent facts not in the data above."""
-        
+
         return prompt
     
+    def _build_batch_prompt(self, batch: List[MatchResult]) -> str:
+        """One prompt for several matches of the same candidate"""
+        blocks = []
+        for i, match_result in enumerate(batch, 1):
+            score = match_result.score_breakdown
+            decision = match_result.decision
+            flags = [
+                flag for flag, on in (("Overqualified", score.overqualified), ("Underqualified", score.underqualified))
+                if on
+            ]
+            blocks.append(
+                f"### Match {i}\n"
+                f"- Position: {match_result.job_title}\n"
+                f"- Final Score: {match_result.final_score:.0%} | Decision: {decision.decision.value.upper()}"
+                f" | Confidence: {decision.confidence:.0%}\n"
+                f"- Skills: {score.skill_score:.0%} ({len(score.matched_skills)} matched, {len(score.missing_skills)} missing)"
+                f" | Experience: {score.experience_score:.0%} | Education: {score.education_score:.0%}"
+                f" | Keywords: {score.keyword_score:.0%}\n"
+                f"- Matched Skills: {', '.join(score.matched_skills[:5]) or 'None'}\n"
+                f"- Missing Skills: {', '.join(score.missing_skills[:5]) or 'None'}\n"
+                f"- Flags: {', '.join(flags) or 'None'}"
+            )
+        
+        candidate = batch[0].candidate_name or 'Candidate'
+        matches = "\n\n".join(blocks)
+        
+        return f"""You are an HR assistant analyzing how one candidate matches several positions. Provide a clear, professional explanation for each match.
+
+**Candidate:** {candidate}
+
+{matches}
+
+**Instructions:**
+For EACH match, write a concise 1-2 paragraph explanation that:
+1. Summarizes why this decision was made
+2. Highlights 2-3 key strengths based on matched skills and scores
+3. Notes 1-2 concerns based on missing skills or gaps
+4. Provides 1-2 actionable recommendations for HR
+
+Keep each explanation professional, factual, and under 200 words. Do NOT invent facts not in the data above.
+
+Respond with JSON only, one entry per match number:
+{{"explanations": [{{"id": 1, "explanation": "..."}}, {{"id": 2, "explanation": "..."}}]}}"""
+
     def _generate_rule_based_explanation(self, match_result: MatchResult) -> str:
-        """Generate detailed, varied rule-based explanation with actual skill names"""
+        """
+        Generate detailed, varied rule-based explanation with actual skill names
+        
+        Built from the fragments at the top of this module; only
+        skill lists and scores are formatted per call, and the sentences are
+        joined once.
+        """
         score = match_result.score_breakdown
         decision = match_result.decision
         candidate = match_result.candidate_name or "This candidate"
         score_val = match_result.final_score
+        matched, missing = score.matched_skills, score.missing_skills
         
+        # Sentences in order; bands without a fragment for a score add None
         parts = []
         
-        # 1. Score-based opening with variety (avoid repetition)
-        if score_val >= 0.90:
-            openings = [
-                f"{candidate} demonstrates outstanding qualifications for the {match_result.job_title} position with a {score_val:.0%} match score.",
-                f"Exceptional match: {candidate} achieves a {score_val:.0%} alignment score for the {match_result.job_title} role.",
-                f"{candidate} presents an excellent profile scoring {score_val:.0%} for this {match_result.job_title} opportunity."
-            ]
-            parts.append(openings[hash(candidate) % 3])
-        elif score_val >= 0.80:
-            openings = [
-                f"{candidate} presents strong credentials for the {match_result.job_title} position with a {score_val:.0%} match score.",
-                f"Strong candidate: {candidate} scores {score_val:.0%} for the {match_result.job_title} role.",
-                f"{candidate} demonstrates solid qualifications with a {score_val:.0%} match for this {match_result.job_title} position."
-            ]
-            parts.append(openings[hash(candidate) % 3])
-        elif score_val >= 0.70:
-            openings = [
-                f"{candidate} shows good potential for the {match_result.job_title} position with a {score_val:.0%} match score.",
-                f"Promising candidate: {candidate} achieves a {score_val:.0%} alignment for the {match_result.job_title} role.",
-                f"{candidate} presents a viable profile scoring {score_val:.0%} for this {match_result.job_title} opportunity."
-            ]
-            parts.append(openings[hash(candidate) % 3])
-        elif score_val >= 0.60:
-            openings = [
-                f"{candidate} presents a moderate fit for the {match_result.job_title} position with a {score_val:.0%} match score.",
-                f"Borderline candidate: {candidate} scores {score_val:.0%} for the {match_result.job_title} role.",
-                f"{candidate} shows potential but has gaps, scoring {score_val:.0%} for this {match_result.job_title} position."
-            ]
-            parts.append(openings[hash(candidate) % 3])
-        else:
-            openings = [
-                f"{candidate} falls below requirements for the {match_result.job_title} position with a {score_val:.0%} match score.",
-                f"Limited alignment: {candidate} achieves only a {score_val:.0%} match for the {match_result.job_title} role.",
-                f"{candidate} shows significant gaps with a {score_val:.0%} score for this {match_result.job_title} opportunity."
-            ]
-            parts.append(openings[hash(candidate) % 3])
+        # 1. Score-based opening with variety (stable per candidate)
+        opening = pick_variant(_OPENINGS[score_val], candidate)
+        parts.append(opening.format(candidate=candidate, job_title=match_result.job_title, score=score_val))
         
-        # 2. Detailed Strengths with actual skill names
-        strength_details = []
+        # 2. Strengths with actual skill names (top 6)
+        if matched:
+            parts.append(_SKILL_STRENGTHS[score.skill_score].format(skills=', '.join(matched[:6]), count=len(matched)))
+        parts.append(_EXPERIENCE_STRENGTHS[score.experience_score])
+        parts.append(_EDUCATION_STRENGTHS[score.education_score])
+        parts.append(_KEYWORD_STRENGTHS[score.keyword_score])
         
-        # Skills - Show actual matched skills (KEY IMPROVEMENT)
-        if score.matched_skills:
-            skill_count = len(score.matched_skills)
-            top_skills = ', '.join(score.matched_skills[:6])  # Show top 6 skills
-            
-            if score.skill_score >= 0.85:
-                strength_details.append(f"Excellent technical proficiency demonstrated in {top_skills} ({skill_count} matched skills).")
-            elif score.skill_score >= 0.70:
-                strength_details.append(f"Strong capabilities in {top_skills} with {skill_count} matched skills.")
-            else:
-                strength_details.append(f"Proficient in {top_skills}, covering {skill_count} required areas.")
-        
-        # Experience
-        if score.experience_score >= 0.85:
-            strength_details.append("Experience level aligns perfectly with role requirements.")
-        elif score.experience_score >= 0.70:
-            strength_details.append("Relevant experience level for this position.")
-        
-        # Education
-        if score.education_score >= 0.90:
-            strength_details.append("Educational background exceeds role requirements.")
-        elif score.education_score >= 0.75:
-            strength_details.append("Appropriate educational qualifications.")
-        
-        # Additional strengths
-        if score.keyword_score >= 0.80:
-            strength_details.append("Resume demonstrates relevant domain expertise and terminology.")
-        
-        if strength_details:
-            parts.append(" ".join(strength_details))
-        
-        # 3. Concerns and Gaps with specific skill names
-        concern_details = []
-        
-        # Missing skills - Show actual missing skills (KEY IMPROVEMENT)
-        if score.missing_skills:
-            missing_count = len(score.missing_skills)
-            missing_sample = ', '.join(score.missing_skills[:5])  # Show up to 5 missing skills
-            
-            if missing_count >= 5:
-                concern_details.append(f"Notable gaps in {missing_sample} and {missing_count - 5} other areas.")
-            elif missing_count >= 3:
-                concern_details.append(f"Missing key competencies: {missing_sample}.")
-            else:
-                concern_details.append(f"Minor gaps in {missing_sample}.")
-        
-        # Experience concerns
+        # 3. Concerns and gaps with specific skill names (up to 5)
+        if missing:
+            parts.append(_SKILL_GAPS[len(missing)].format(skills=', '.join(missing[:5]), others=len(missing) - 5))
         if score.experience_score < 0.50:
-            concern_details.append("Experience level may be insufficient for role demands.")
-        
-        # Qualification flags
+            parts.append("Experience level may be insufficient for role demands.")
         if score.underqualified:
-            concern_details.append("Overall skill coverage falls short of requirements.")
+            parts.append("Overall skill coverage falls short of requirements.")
         if score.overqualified:
-            concern_details.append("Candidate may be overqualified, consider retention risk.")
-        
-        if concern_details:
-            parts.append(" ".join(concern_details))
+            parts.append("Candidate may be overqualified, consider retention risk.")
         
         # 4. Decision-specific recommendations with actionable details
         if decision.decision == DecisionType.SHORTLIST:
-            rec_parts = []
-            
-            # Interview focus areas (show actual skills)
-            if score.matched_skills:
-                focus_skills = ', '.join(score.matched_skills[:3])
-                rec_parts.append(f"Proceed with technical interview focusing on {focus_skills}.")
-            else:
-                rec_parts.append("Proceed with technical screening to validate qualifications.")
-            
-            # Cultural fit
-            if score_val >= 0.85:
-                rec_parts.append("Assess cultural fit and discuss role expectations.")
+            if matched:
+                parts.append(_INTERVIEW_FOCUS.format(skills=', '.join(matched[:3])))
             else:
-                rec_parts.append("Verify proficiency in matched skills and assess learning agility for gaps.")
-            
-            parts.append(" ".join(rec_parts))
-            
+                parts.append("Proceed with technical screening to validate qualifications.")
+            parts.append(_SHORTLIST_NEXT_STEPS[score_val])
+        
         elif decision.decision == DecisionType.REVIEW:
-            rec_parts = []
-            rec_parts.append("Recommend detailed manual review of experience and portfolio.")
-            
-            # Training considerations (show actual missing skills)
-            if score.missing_skills:
-                training_skills = ', '.join(score.missing_skills[:3])
-                rec_parts.append(f"Evaluate training potential for {training_skills}.")
-            
-            # Alternative fit
+            parts.append("Recommend detailed manual review of experience and portfolio.")
+            if missing:
+                parts.append(_TRAINING_POTENTIAL.format(skills=', '.join(missing[:3])))
             if score.skill_score < 0.65:
-                rec_parts.append("Consider alternative roles better matching candidate's skill profile.")
-            
-            parts.append(" ".join(rec_parts))
-            
+                parts.append("Consider alternative roles better matching candidate's skill profile.")
+        
         else:  # REJECT
-            rec_parts = []
-            
-            if score_val < 0.50:
-                rec_parts.append("Candidate does not meet minimum requirements for this position.")
-            else:
-                rec_parts.append("Current profile does not align with role needs.")
-            
-            # Constructive guidance
-            if score.missing_skills:
-                critical_gaps = ', '.join(score.missing_skills[:3])
-                rec_parts.append(f"Suggest developing competencies in {critical_gaps} for future consideration.")
+            parts.append(_REJECT_SUMMARIES[score_val])
+            if missing:
+                parts.append(_DEVELOP_SKILLS.format(skills=', '.join(missing[:3])))
             else:
-                rec_parts.append("Consider for alternative roles or revisit if requirements evolve.")
-            
-            parts.append(" ".join(rec_parts))
+                parts.append("Consider for alternative roles or revisit if requirements evolve.")
         
-        return " ".join(parts)
+        return " ".join(filter(None, parts))
     
     def generate_structured_insights(self, match_result: MatchResult) -> Dict[str, List[str]]:
         """
@@ -333,63 +608,88 @@ Keep it professional, factual, and under 200 words. Do NOT invent facts not in t
         """
         score = match_result.score_breakdown
         decision = match_result.decision
-        
-        insights = {
-            'strengths': [],
-            'weaknesses': [],
-            'recommendations': []
-        }
+        matched, missing = score.matched_skills, score.missing_skills
         
         # Strengths
-        if score.matched_skills:
-            insights['strengths'].append(
-                f"Proficient in {len(score.matched_skills)} key skills: {', '.join(score.matched_skills[:4])}"
-            )
-        
+        strengths = []
+        if matched:
+            strengths.append(_INSIGHT_SKILLS.format(count=len(matched), skills=', '.join(matched[:4])))
         if score.experience_score >= 0.8:
-            insights['strengths'].append("Experience level aligns well with job requirements")
-        
+            strengths.append("Experience level aligns well with job requirements")
         if score.education_score >= 0.9:
-            insights['strengths'].append("Educational qualifications meet or exceed requirements")
-        
+            strengths.append("Educational qualifications meet or exceed requirements")
         if score.ml_score and score.ml_score >= 0.75:
-            insights['strengths'].append(f"Strong ATS compatibility score ({score.ml_score:.0%})")
+            strengths.append(_INSIGHT_ATS.format(score=score.ml_score))
         
         # Weaknesses
-        if score.missing_skills:
-            insights['weaknesses'].append(
-                f"Lacks {len(score.missing_skills)} required skills: {', '.join(score.missing_skills[:4])}"
-            )
-        
+        weaknesses = []
+        if missing:
+            weaknesses.append(_INSIGHT_GAPS.format(count=len(missing), skills=', '.join(missing[:4])))
         if score.experience_score < 0.5:
-            insights['weaknesses'].append("Experience level below job requirements")
-        
+            weaknesses.append("Experience level below job requirements")
         if score.underqualified:
-            insights['weaknesses'].append("Insufficient overall skill coverage for this role")
-        
+            weaknesses.append("Insufficient overall skill coverage for this role")
         if score.overqualified:
-            insights['weaknesses'].append("May be overqualified; risk of low retention")
+            weaknesses.append("May be overqualified; risk of low retention")
         
         # Recommendations
-        if decision.decision == DecisionType.SHORTLIST:
-            insights['recommendations'].extend([
-                "Schedule technical interview to validate key skills",
-                "Assess cultural fit and team dynamics",
-                "Verify depth of experience in matched skills"
-            ])
-        elif decision.decision == DecisionType.REVIEW:
-            insights['recommendations'].extend([
+        if decision.decision == DecisionType.REVIEW:
+            recommendations = [
                 "Deep-dive review of work history and projects",
-                f"Assess learning potential for missing skills: {', '.join(score.missing_skills[:3])}",
+                _INSIGHT_LEARNING.format(skills=', '.join(missing[:3])),
                 "Consider alternative roles that better match skill set"
-            ])
+            ]
         else:
-            insights['recommendations'].extend([
-                "Keep profile for future positions with different requirements",
-                "Consider for junior roles if experience is the main gap"
-            ])
+            recommendations = list(_INSIGHT_RECOMMENDATIONS[decision.decision])
         
-        return insights
+        return {
+            'strengths': strengths,
+            'weaknesses': weaknesses,
+            'recommendations': recommendations
+        }
+
+def parse_batch_explanations(text: str, count: int, min_length: int = 50) -> Dict[int, str]:
+    """
+    Parse a batched LLM response
+    
+    Accepts `{"explanations": [{"id": 1, "explanation": "..."}, ...]}` (or
+    the bare list), optionally wrapped in prose or a code fence. Entries with
+    an unknown or repeated id, or an explanation of `min_length` characters
+    or less, are dropped.
+    
+    Returns:
+        {0-based match position: explanation}
+    """
+    start, end = text.find('{'), text.rfind('}')
+    list_start = text.find('[')
+    if list_start != -1 and (start == -1 or list_start < start):
+        start, end = list_start, text.rfind(']')
+    if start == -1 or end <= start:
+        return {}
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+    
+    entries = data.get('explanations') if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+    
+    parsed: Dict[int, str] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            position = int(entry.get('id')) - 1
+        except (TypeError, ValueError):
+            continue
+        explanation = entry.get('explanation')
+        if not isinstance(explanation, str):
+            continue
+        explanation = explanation.strip()
+        if 0 <= position < count and position not in parsed and len(explanation) > min_length:
+            parsed[position] = explanation
+    return parsed
 
 
 # Singleton instance
@@ -0,0 +1,44 @@
+"""
+Rule-Based Explanation Templates
+Lookup helpers for Agent 4's fallback explanations and insights
+
+When Ollama is down every match takes the rule-based path, so its wording
+is declared once as module-level `str.format` strings instead of being
+rebuilt per call:
+- `Bands` picks a fragment by score (or count) band with one bisect
+- `pick_variant` chooses between phrasings with a stable hash, so the same
+  candidate reads the same in every process (unlike the salted `hash()`)
+
+Callers collect sentences in a list and join it once.
+"""
+import zlib
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Generic, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class Bands(Generic[T]):
+    """
+    Fragments by band of a score or count (lower bounds inclusive)
+    
+    Example:
+        experience = Bands([(0.85, "Perfect fit."), (0.70, "Relevant.")], below=None)
+        experience[0.9]  # "Perfect fit."
+    """
+    __slots__ = ("_bounds", "_items")
+    
+    def __init__(self, bands: Sequence[Tuple[float, T]], below: T = None):
+        ordered = sorted(bands, key=lambda band: band[0])
+        self._bounds = [bound for bound, _ in ordered]
+        self._items = [below] + [item for _, item in ordered]
+    
+    def __getitem__(self, value: float) -> T:
+        return self._items[bisect_right(self._bounds, value)]
+
+
+@lru_cache(maxsize=4096)
+def pick_variant(choices: Tuple[str, ...], key: str) -> str:
+    """One of `choices`, fixed per key across processes"""
+    return choices[zlib.crc32(key.encode("utf-8")) % len(choices)]
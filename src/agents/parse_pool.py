@@ -0,0 +1,371 @@
+"""
+Process-isolated document parsing for Agent 1
+
+PDF/DOCX libraries run in native code and a malformed document can hang or
+balloon a process. `ParseWorkerPool` runs text extraction in separate worker
+processes so the API process is never affected:
+
+- hard per-document timeout (the worker is killed and replaced)
+- per-worker memory limit (RLIMIT_AS headroom, POSIX only)
+- workers recycled after `max_documents` to bound fragmentation
+- documents go in and text comes back over a pipe
+
+Concurrent callers (e.g. bulk uploads via `extract_many`) are spread over up
+to `processes` workers, so throughput scales with cores.
+"""
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ..core.config import ParsingConfig, get_config
+from ..core.metrics import FALLBACKS
+
+logger = logging.getLogger(__name__)
+
+# Path on disk, or the document's bytes
+Document = Union[str, bytes]
+
+# Exceptions raised in a worker that are re-raised as-is in the caller
+_PASSTHROUGH_ERRORS = {
+    "ValueError": ValueError,
+    "FileNotFoundError": FileNotFoundError,
+    "ImportError": ImportError,
+    "MemoryError": MemoryError,
+}
+
+
+class ParseTimeoutError(TimeoutError):
+    """Document extraction exceeded the per-document timeout"""
+
+
+class ParseWorkerError(RuntimeError):
+    """Worker process died or failed to start"""
+
+
+def _extract_document(parser, source: Document, suffix: str) -> str:
+    """Default worker task: in-process Agent 1 extraction"""
+    return parser._extract_text_in_process(source, suffix)
+
+
+def _limit_memory(limit_mb: int) -> None:
+    """Cap the worker's address space at its current size + limit_mb"""
+    if not limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:
+        logger.warning("[WARN] Parse worker memory limit unsupported on this platform")
+        return
+    
+    baseline = 0
+    try:
+        with open("/proc/self/statm") as f:
+            baseline = int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError):
+        pass
+    
+    limit = baseline + limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _worker_main(conn, extract_fn: Callable, parsing_config: ParsingConfig, memory_limit_mb: int) -> None:
+    """Worker loop: receive (source, suffix), reply ("ok", text) or ("error", type, message)"""
+    from .agent1_parser import RawParser
+    from ..storage.artifacts import ArtifactSink
+    
+    parser = RawParser(parsing_config=parsing_config, artifact_sink=ArtifactSink())
+    _limit_memory(memory_limit_mb)
+    conn.send(("ready", os.getpid()))
+    
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        
+        source, suffix = request
+        try:
+            conn.send(("ok", extract_fn(parser, source, suffix)))
+        except MemoryError:
+            conn.send(("error", "MemoryError", "Document exceeded the parse worker memory limit"))
+            return
+        except Exception as e:
+            conn.send(("error", type(e).__name__, str(e)))
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe"""
+    
+    def __init__(self, mp_context, extract_fn, parsing_config, memory_limit_mb, startup_timeout):
+        self.conn, child_conn = mp_context.Pipe()
+        self.process = mp_context.Process(
+            target=_worker_main,
+            args=(child_conn, extract_fn, parsing_config, memory_limit_mb),
+            name="parse-worker",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.documents = 0
+        
+        # Startup (imports) is not charged to the first document's timeout
+        try:
+            if not self.conn.poll(startup_timeout):
+                raise ParseWorkerError(f"Parse worker did not start within {startup_timeout}s")
+            self.conn.recv()
+        except (EOFError, OSError) as e:
+            self.kill()
+            raise ParseWorkerError("Parse worker exited during startup") from e
+        except ParseWorkerError:
+            self.kill()
+            raise
+    
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+    
+    def run(self, source: Document, suffix: str, timeout: float) -> Tuple:
+        self.documents += 1
+        self.conn.send((source, suffix))
+        if not self.conn.poll(timeout):
+            raise ParseTimeoutError(f"Document parsing exceeded {timeout}s")
+        return self.conn.recv()
+    
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not"""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=2)
+        self.kill()
+    
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=2)
+        self.conn.close()
+
+
+class ParseWorkerPool:
+    """
+    Pool of parsing worker processes
+    
+    Workers start lazily (or up front with `start()`) and are reused until
+    they have handled `max_documents` documents, time out, crash or hit the
+    memory limit.
+    """
+    
+    def __init__(
+        self,
+        parsing_config: ParsingConfig,
+        processes: int = 2,
+        timeout_seconds: float = 30,
+        memory_limit_mb: int = 1024,
+        max_documents: int = 200,
+        start_method: str = "spawn",
+        startup_timeout: float = 60,
+        extract_fn: Callable = _extract_document
+    ):
+        """
+        Initialize the pool (no processes are started yet).
+        
+        Args:
+            parsing_config: Extraction budgets used inside the workers
+            processes: Maximum number of worker processes
+            timeout_seconds: Hard limit per document
+            memory_limit_mb: Address-space headroom per worker (0 = unlimited)
+            max_documents: Recycle a worker after this many documents
+            start_method: multiprocessing start method ("spawn", "forkserver", "fork")
+            startup_timeout: Time allowed for a worker to start
+            extract_fn: Picklable `(parser, source, suffix) -> text` run in the worker
+        """
+        self.parsing_config = replace(parsing_config, worker_processes=0)
+        self.processes = max(1, processes)
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.max_documents = max_documents
+        self.startup_timeout = startup_timeout
+        self.extract_fn = extract_fn
+        
+        self._mp_context = multiprocessing.get_context(start_method)
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()  # warmest worker first
+        self._slots = threading.BoundedSemaphore(self.processes)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats: Dict[str, int] = {"started": 0, "recycled": 0, "timeouts": 0, "crashes": 0}
+    
+    def extract_text(self, source: Document, suffix: str) -> str:
+        """
+        Extract text from one document in a worker process.
+        
+        Args:
+            source: File path or file content (bytes)
+            suffix: File extension selecting the extractor (".pdf", ".docx", ".txt")
+        
+        Returns:
+            Extracted text
+        
+        Raises:
+            ParseTimeoutError: Document exceeded timeout_seconds
+            ParseWorkerError: Worker crashed
+        """
+        if self._closed:
+            raise ParseWorkerError("Parse worker pool is closed")
+        
+        with self._slots:
+            worker = self._acquire()
+            reusable = False
+            try:
+                reply = worker.run(source, suffix, self.timeout_seconds)
+                reusable = not (reply[0] == "error" and reply[1] == "MemoryError")
+            except ParseTimeoutError:
+                self._count("timeouts")
+                FALLBACKS.inc(component="parse_pool", reason="timeout")
+                logger.warning("[WARN] Parse worker %s timed out, replacing it", worker.pid)
+                raise
+            except (EOFError, OSError) as e:
+                self._count("crashes")
+                FALLBACKS.inc(component="parse_pool", reason="worker_crash")
+                raise ParseWorkerError(f"Parse worker {worker.pid} died while parsing") from e
+            finally:
+                self._release(worker, reusable)
+        
+        if reply[0] == "ok":
+            return reply[1]
+        
+        _, error_type, message = reply
+        if error_type == "MemoryError":
+            FALLBACKS.inc(component="parse_pool", reason="memory_limit")
+        raise _PASSTHROUGH_ERRORS.get(error_type, ParseWorkerError)(message)
+    
+    def start(self) -> int:
+        """
+        Start idle workers for every free slot, so the first documents do
+        not pay for process startup (e.g. during pipeline warm-up).
+        
+        Returns:
+            Workers started
+        """
+        acquired = 0
+        while acquired < self.processes and self._slots.acquire(blocking=False):
+            acquired += 1
+        try:
+            missing = 0 if self._closed else max(0, acquired - self._idle.qsize())
+            if missing:
+                with ThreadPoolExecutor(max_workers=missing) as executor:
+                    workers = list(executor.map(lambda _: self._spawn(), range(missing)))
+                for worker in workers:
+                    self._idle.put(worker)
+            return missing
+        finally:
+            for _ in range(acquired):
+                self._slots.release()
+    
+    def extract_many(self, documents: List[Tuple[Document, str]]) -> List[Union[str, Exception]]:
+        """
+        Extract several documents concurrently, one per worker.
+        
+        Args:
+            documents: (source, suffix) pairs
+        
+        Returns:
+            Text for each document in input order, or the exception it raised
+        """
+        def extract(document):
+            try:
+                return self.extract_text(*document)
+            except Exception as e:
+                return e
+        
+        if len(documents) <= 1:
+            return [extract(document) for document in documents]
+        with ThreadPoolExecutor(max_workers=min(self.processes, len(documents))) as executor:
+            return list(executor.map(extract, documents))
+    
+    def _acquire(self) -> _Worker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._spawn()
+    
+    def _spawn(self) -> _Worker:
+        worker = _Worker(
+            self._mp_context,
+            self.extract_fn,
+            self.parsing_config,
+            self.memory_limit_mb,
+            self.startup_timeout
+        )
+        self._count("started")
+        return worker
+    
+    def _release(self, worker: _Worker, reusable: bool) -> None:
+        if reusable and not self._closed and worker.documents < self.max_documents:
+            self._idle.put(worker)
+            return
+        if reusable and worker.documents >= self.max_documents:
+            self._count("recycled")
+        if reusable:
+            worker.stop()
+        else:
+            worker.kill()
+    
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+    
+    def close(self) -> None:
+        """Stop all idle workers; busy ones stop when their document finishes"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+# Shared pools, one per distinct parsing configuration
+_pools: Dict[str, ParseWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_parse_pool(parsing_config: Optional[ParsingConfig] = None) -> ParseWorkerPool:
+    """
+    Get the shared worker pool for a parsing configuration
+    
+    Args:
+        parsing_config: Worker settings and budgets (default: from app config)
+    """
+    config = get_config()
+    parsing_config = parsing_config or config.parsing
+    key = repr(parsing_config)
+    
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ParseWorkerPool(
+                parsing_config,
+                processes=parsing_config.worker_processes,
+                timeout_seconds=parsing_config.worker_timeout_seconds or config.agent1.timeout_seconds,
+                memory_limit_mb=parsing_config.worker_memory_limit_mb,
+                max_documents=parsing_config.worker_max_documents,
+                start_method=parsing_config.worker_start_method
+            )
+            _pools[key] = pool
+    return pool
+
+
+def close_parse_pools() -> None:
+    """Stop every shared pool's workers (e.g. on API shutdown)"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
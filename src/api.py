@@ -10,22 +10,56 @@ Endpoints:
 - POST /match         - Match CV to all jobs (main endpoint)
 - POST /match/single  - Match CV to specific job
 - GET  /history       - View match history
+- GET  /metrics       - Prometheus-format metrics
+- GET  /admin/profiling          - Request profiling status
+- PUT  /admin/profiling          - Toggle profiling of every request
+- GET  /admin/profiles           - List captured profiles
+- GET  /admin/profiles/{id}      - Download a profile (pstats or txt)
+
+Send `X-Profile: 1` with /match or /match/single to profile that request;
+the capture ID is returned in the `X-Profile-ID` response header.
+
+Pass `compact=true` to /match or /match/history to omit the legacy
+duplicate fields (`company`, `location`, `job_type`).
+
+Importing this module only builds the app; the startup event creates the
+pipeline and database and warms them up (catalog, ML model, skill matcher,
+parse workers, background LLM probe). /health reports `ready` and the
+per-step warm-up timings.
 """
-from fastapi import FastAPI, File, UploadFile, HTTPException, Query
+import time
+
+_import_started = time.perf_counter()
+
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
-import tempfile
+from fastapi.responses import PlainTextResponse, FileResponse
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, List, Optional
 from pathlib import Path
 import json
+import uuid
 import logging
+import threading
 from datetime import datetime
 
 from src.agents.pipeline import MatchingPipeline
 from src.storage.database import get_database
+from src.storage.artifacts import get_artifact_sink
+from src.agents.parse_pool import ParseTimeoutError, close_parse_pools
 from src.storage.models import JobPosting
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from src.core.metrics import (
+    REGISTRY, CONTENT_TYPE_LATEST, CATALOG_SIZE, QUEUE_DEPTH,
+    FILE_READ_LATENCY, STAGE_LATENCY
+)
+from src.core.profiling import get_profile_store, PROFILE_FORMATS
+from src.core.payloads import JobCatalog, ORJSONResponse, json_response, etag_matches
+from src.core.job_index import JobFilter
+from src.core.compression import CompressionMiddleware, choose_encoding
+from src.core.config import get_config, setup_logging
+from src.core.prewarm import ExplanationPrewarmer
+
+# Logging is configured by the entry point (setup_logging), not at import
 logger = logging.getLogger(__name__)
 
 # ============================================
@@ -37,7 +71,8 @@ app = FastAPI(
     description="AI-powered resume matching with 4-agent pipeline",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS (allow frontend to call API)
@@ -53,12 +88,60 @@ app.add_middleware(
 # GLOBAL COMPONENTS
 # ============================================
 
-# Initialize pipeline and database
-pipeline = MatchingPipeline(save_to_db=True)
-db = get_database()
+# Pipeline and database, built by the startup event (not at import)
+_pipeline: Optional[MatchingPipeline] = None
+_pipeline_lock = threading.Lock()
+
+# Compress large responses (already-encoded /jobs pages pass through)
+app.add_middleware(CompressionMiddleware, minimum_size=get_config().api.compression_min_bytes)
 
-# Jobs cache (loaded on startup)
+# Jobs cache (loaded on startup) and its ID index / precomputed payloads
 jobs_cache: List[JobPosting] = []
+catalog = JobCatalog()
+
+# Request profiling (opt-in per request or via admin toggle)
+profile_store = get_profile_store()
+
+# Cold-start timings (ms): module import, then each warm-up step
+startup_timings: Dict[str, float] = {}
+
+# Idle-time explanation pre-generation (started on startup if enabled)
+prewarmer: Optional[ExplanationPrewarmer] = None
+
+
+def get_pipeline() -> MatchingPipeline:
+    """The API's matching pipeline, built on first use (normally at startup)"""
+    global _pipeline
+    
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = MatchingPipeline(save_to_db=True)
+    return _pipeline
+
+
+def __getattr__(name: str):
+    """`src.api.pipeline` for callers outside this module"""
+    if name == "pipeline":
+        return get_pipeline()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def matching_busy() -> bool:
+    """True while any matching request is in progress"""
+    return any(QUEUE_DEPTH.get(endpoint=endpoint) > 0 for endpoint in ("match", "match_single"))
+
+
+def set_catalog(jobs: List[JobPosting]) -> None:
+    """Serve a new job catalog: warm scoring features and response payloads"""
+    global catalog
+    
+    pipeline = get_pipeline()
+    pipeline.agent3.prepare_jobs(jobs)
+    catalog = JobCatalog(jobs, max_pages=pipeline.config.api.jobs_page_cache_size)
+    catalog.index  # Build the /jobs search index now, not on the first query
+    jobs_cache[:] = jobs
+    CATALOG_SIZE.set(len(jobs))
 
 
 def load_jobs() -> List[JobPosting]:
@@ -140,6 +223,57 @@ def parse_experience(exp_str: str) -> tuple:
 # API ENDPOINTS
 # ============================================
 
+# Uploads are read in bounded chunks so oversized files are rejected early
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+async def read_upload(file: UploadFile) -> bytes:
+    """
+    Read an upload into memory, enforcing APIConfig.max_upload_size_mb
+    
+    Raises:
+        HTTPException(413): File exceeds the configured limit
+    """
+    pipeline = get_pipeline()
+    max_bytes = pipeline.config.api.max_upload_size_mb * 1024 * 1024
+    too_large = HTTPException(
+        413, f"File too large. Maximum size is {pipeline.config.api.max_upload_size_mb} MB"
+    )
+    
+    # Size is known up front for spooled multipart uploads
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+    
+    read_start = time.perf_counter()
+    buffer = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise too_large
+    FILE_READ_LATENCY.observe(time.perf_counter() - read_start)
+    
+    return bytes(buffer)
+
+
+def start_request(request: Request, response: Response) -> tuple:
+    """
+    Assign a request ID and decide whether to profile the request
+    
+    Returns:
+        (request_id, profiling_requested)
+    """
+    pipeline = get_pipeline()
+    request_id = f"req_{uuid.uuid4().hex[:12]}"
+    response.headers["X-Request-ID"] = request_id
+    
+    header_name = pipeline.config.profiling.header_name
+    flag = request.headers.get(header_name, "").strip().lower()
+    return request_id, flag in ("1", "true", "yes", "on")
+
+
 @app.get("/")
 async def root():
     """Welcome message and API info"""
@@ -152,7 +286,9 @@ async def root():
             "health": "/health",
             "jobs": "/jobs",
             "upload": "/upload",
-            "match": "/match"
+            "match": "/match",
+            "metrics": "/metrics",
+            "profiles": "/admin/profiles"
         }
     }
 
@@ -163,60 +299,98 @@ async def health_check():
     Health check endpoint
     Returns server status and component availability
     """
+    pipeline = get_pipeline()
     return {
         "status": "healthy",
+        "ready": pipeline.ready,
         "timestamp": datetime.now().isoformat(),
+        "startup_ms": startup_timings,
         "components": {
             "agents_loaded": True,
             "jobs_loaded": len(jobs_cache),
-            "ml_model_loaded": pipeline.agent3.ml_predictor is not None,
-            "database_ready": db is not None,
+            "ml_model_loaded": pipeline.agent3.ml_loaded,
+            "database_ready": pipeline.db is not None,
             "ollama_enabled": pipeline.config.llm.enabled if hasattr(pipeline, 'config') else False
-        }
+        },
+        "llm": llm_health(),
+        "prewarm": prewarmer.stats() if prewarmer is not None else {"running": False}
     }
 
 
+def llm_health() -> dict:
+    """Agent 4 availability and circuit breaker state"""
+    pipeline = get_pipeline()
+    health = getattr(pipeline.agent4, "health", None)
+    if health is None:  # LangChain explainer
+        return {"enabled": pipeline.config.llm.enabled, "available": pipeline.agent4.llm_available}
+    return health()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus metrics endpoint
+    
+    Per-stage latency histograms, cache/fallback counters and catalog gauges
+    in the Prometheus text exposition format
+    """
+    CATALOG_SIZE.set(len(jobs_cache))
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/jobs")
 async def get_jobs(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of jobs to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Max jobs to return")
+    limit: int = Query(100, ge=1, le=1000, description="Max jobs to return"),
+    q: Optional[str] = Query(None, description="Title search (every word must prefix-match a title word)"),
+    skills: Optional[str] = Query(None, description="Comma-separated skills (any spelling/alias)"),
+    skills_match: str = Query("any", pattern="^(any|all)$", description="Jobs with any or all of the skills"),
+    seniority_level: Optional[str] = Query(None, description="Comma-separated seniority levels"),
+    remote_type: Optional[str] = Query(None, description="Comma-separated: on-site, hybrid, remote"),
+    employment_type: Optional[str] = Query(None, description="Comma-separated employment types"),
+    location: Optional[str] = Query(None, description="City or country (prefix match)"),
+    min_experience: Optional[float] = Query(None, ge=0, description="Job experience range overlaps this minimum..."),
+    max_experience: Optional[float] = Query(None, ge=0, description="...and this maximum (years)")
 ):
     """
     Get list of available jobs
     Returns paginated job listings with new structure
-    """
-    total_jobs = len(jobs_cache)
-    paginated_jobs = jobs_cache[skip:skip+limit]
     
-    return {
-        "total": total_jobs,
-        "skip": skip,
-        "limit": limit,
-        "count": len(paginated_jobs),
-        "jobs": [
-            {
-                "job_id": job.job_id,
-                "title": job.title,
-                "job_title": job.title,  # Legacy compatibility
-                "company_name": job.company_name,
-                "company": job.company_name,  # Legacy compatibility
-                "location_city": job.location_city,
-                "location_country": job.location_country,
-                "location": f"{job.location_city}, {job.location_country}",  # Legacy compatibility
-                "remote_type": job.remote_type,
-                "employment_type": job.employment_type,
-                "job_type": job.employment_type,  # Legacy compatibility
-                "seniority_level": job.seniority_level,
-                "min_experience_years": job.min_experience_years,
-                "max_experience_years": job.max_experience_years,
-                "description": job.description,
-                "required_skills": job.required_skills[:10] if job.required_skills else [],
-                "preferred_skills": job.preferred_skills[:5] if job.preferred_skills else [],
-                "posted_date": job.posted_date
-            }
-            for job in paginated_jobs
-        ]
+    Filters are answered from the catalog's inverted indexes; with filters,
+    `total` counts the matching jobs. Unfiltered pages are serialized and
+    compressed once per catalog version. The ETag is the catalog version,
+    so unchanged results revalidate with a 304.
+    """
+    pipeline = get_pipeline()
+    current = catalog
+    headers = {
+        "ETag": current.etag,
+        "Cache-Control": f"public, max-age={pipeline.config.api.jobs_max_age_seconds}, must-revalidate",
+        "Vary": "Accept-Encoding",
     }
+    if etag_matches(request.headers.get("if-none-match", ""), current.etag):
+        return Response(status_code=304, headers=headers)
+    
+    query = JobFilter(
+        q=q, skills=skills, skills_match=skills_match, seniority_level=seniority_level,
+        remote_type=remote_type, employment_type=employment_type, location=location,
+        min_experience=min_experience, max_experience=max_experience
+    )
+    if query.active:
+        # Compressed per request by CompressionMiddleware
+        return Response(current.search(query, skip, limit), media_type="application/json", headers=headers)
+    
+    page = current.page(skip, limit)
+    body = page.body
+    encoding = None
+    if len(body) >= pipeline.config.api.compression_min_bytes:
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+    if encoding:
+        # First request per page and encoding compresses off the event loop
+        body = await run_in_threadpool(page.encoded, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.post("/upload")
@@ -232,6 +406,7 @@ async def upload_cv(file: UploadFile = File(...)):
     
     Returns extracted data without matching
     """
+    pipeline = get_pipeline()
     logger.info(f"Uploading file: {file.filename}")
     
     # Validate file type
@@ -242,16 +417,14 @@ async def upload_cv(file: UploadFile = File(...)):
     if file_ext not in ['.pdf', '.docx', '.txt']:
         raise HTTPException(400, f"Unsupported file type: {file_ext}. Use PDF, DOCX, or TXT")
     
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    # Read upload into memory (parsed without a temp file)
+    content = await read_upload(file)
     
     try:
         # Parse with Agent 1
         logger.info("Parsing CV with Agent 1...")
-        parse_result = pipeline.agent1.parse_file(tmp_path)
+        with STAGE_LATENCY.time(stage="parse"):
+            parse_result = pipeline.agent1.parse_bytes(content, file.filename)
         cv_text = parse_result.get('raw_text', '')
         
         if not cv_text or len(cv_text) < 50:
@@ -259,7 +432,11 @@ async def upload_cv(file: UploadFile = File(...)):
         
         # Extract structured data with Agent 2
         logger.info("Extracting data with Agent 2...")
-        extracted = pipeline.agent2.extract(cv_text)
+        with STAGE_LATENCY.time(stage="extract"):
+            extracted = pipeline.agent2.extract(cv_text, sections=parse_result.get('section_spans'))
+        
+        # Remember the candidate so their top matches can be explained while idle
+        pipeline.build_cv_profile(file.filename, cv_text, extracted)
         
         return {
             "success": True,
@@ -281,25 +458,23 @@ async def upload_cv(file: UploadFile = File(...)):
     
     except HTTPException:
         raise
+    except ParseTimeoutError as e:
+        raise HTTPException(422, f"CV parsing timed out: {str(e)}")
     except Exception as e:
         logger.error(f"Failed to process CV: {e}", exc_info=True)
         raise HTTPException(500, f"Failed to process CV: {str(e)}")
-    
-    finally:
-        # Clean up temporary file
-        try:
-            Path(tmp_path).unlink()
-        except:
-            pass
 
 
 @app.post("/match")
 async def match_cv(
+    request: Request,
+    response: Response,
     file: UploadFile = File(..., description="CV file (PDF, DOCX, or TXT)"),
     top_k: int = Query(10, ge=1, le=50, description="Number of top matches to return"),
     explain: bool = Query(False, description="Generate AI explanations (slower)"),
     use_llm: bool = Query(False, description="Enable Ollama LLM (if false, uses rule-based only)"),
-    use_langchain: bool = Query(False, description="Use LangChain for advanced AI features")
+    use_langchain: bool = Query(False, description="Use LangChain for advanced AI features"),
+    compact: bool = Query(False, description="Omit legacy duplicate fields (company, location, job_type)")
 ):
     """
     Match CV to all jobs and return top K matches
@@ -314,7 +489,9 @@ async def match_cv(
     
     Returns top K matches sorted by score
     """
-    logger.info(f"Matching CV: {file.filename} (top_k={top_k}, explain={explain}, use_llm={use_llm})")
+    pipeline = get_pipeline()
+    request_id, profile_requested = start_request(request, response)
+    logger.info(f"[{request_id}] Matching CV: {file.filename} (top_k={top_k}, explain={explain}, use_llm={use_llm})")
     
     if not jobs_cache:
         raise HTTPException(503, "No jobs loaded. Please contact administrator.")
@@ -324,11 +501,8 @@ async def match_cv(
     if file_ext not in ['.pdf', '.docx', '.txt']:
         raise HTTPException(400, f"Unsupported file type: {file_ext}")
     
-    # Save file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    # Read upload into memory (parsed without a temp file)
+    content = await read_upload(file)
     
     try:
         # Handle LangChain mode switch if requested
@@ -339,104 +513,54 @@ async def match_cv(
             pipeline.agent4 = get_explainer_agent(use_langchain=True, config=pipeline.config)
             logger.info("🔄 Switched to LangChain mode for this request")
         
-        # Temporarily disable LLM if use_llm is False
-        original_llm_enabled = pipeline.agent4.llm_available
+        # use_llm=False only affects this request (the explainer is shared)
         if not use_llm:
-            pipeline.agent4.llm_available = False
             logger.info("⚙️ LLM disabled - using rule-based explanations only")
         
         # Run full 4-agent pipeline on all jobs
-        logger.info(f"Running pipeline against {len(jobs_cache)} jobs...")
+        logger.debug("Running pipeline against %d jobs...", len(jobs_cache))
         
-        matches = pipeline.process_cv_batch(
-            cv_file_path=tmp_path,
-            jobs=jobs_cache,
-            top_k=top_k,
-            generate_explanations=explain
-        )
-        
-        # Restore original settings
-        if not use_llm:
-            pipeline.agent4.llm_available = original_llm_enabled
-        if use_langchain and not hasattr(original_agent, 'chain'):
-            pipeline.agent4 = original_agent  # Restore original agent
+        try:
+            with QUEUE_DEPTH.track_inprogress(endpoint="match"), \
+                    profile_store.profile(request_id, requested=profile_requested) as profile_id:
+                matches = pipeline.process_cv_batch(
+                    cv_file_path=file.filename,
+                    cv_bytes=content,
+                    jobs=jobs_cache,
+                    top_k=top_k,
+                    generate_explanations=explain,
+                    use_llm=use_llm,
+                    request_id=request_id
+                )
+        finally:
+            if use_langchain and not hasattr(original_agent, 'chain'):
+                pipeline.agent4 = original_agent  # Restore original agent
+        if profile_id:
+            response.headers["X-Profile-ID"] = profile_id
         
-        # Format results for Next.js frontend
-        results = []
-        for match in matches:
-            # Get job details from cache
-            job_details = next((j for j in jobs_cache if j.job_id == match.job_id), None)
-            
-            # Calculate final score
-            final_score = round(match.score_breakdown.hybrid_score * 100, 1)
-            
-            # Auto-assign status based on score
-            if final_score >= 75:
-                status = "accepted"  # Shortlist
-            elif final_score >= 50:
-                status = "review"    # Manual review needed
-            else:
-                status = "rejected"  # Below threshold
-            
-            result = {
-                "match_id": match.match_id,
-                "job_id": match.job_id,
-                "job_title": match.job_title,
-                # New structure fields
-                "company_name": job_details.company_name if job_details else 'N/A',
-                "company": job_details.company_name if job_details else 'N/A',  # Legacy
-                "location_city": job_details.location_city if job_details else 'Unknown',
-                "location_country": job_details.location_country if job_details else 'India',
-                "location": f"{job_details.location_city}, {job_details.location_country}" if job_details else 'Unknown',  # Legacy
-                "remote_type": job_details.remote_type if job_details else 'on-site',
-                "employment_type": job_details.employment_type if job_details else 'full-time',
-                "job_type": job_details.employment_type if job_details else 'full-time',  # Legacy
-                "seniority_level": job_details.seniority_level if job_details else 'mid',
-                "min_experience_years": job_details.min_experience_years if job_details else 0,
-                "max_experience_years": job_details.max_experience_years if job_details else 0,
-                "description": job_details.description if job_details else None,
-                "required_skills": job_details.required_skills[:10] if job_details and job_details.required_skills else [],
-                "preferred_skills": job_details.preferred_skills[:5] if job_details and job_details.preferred_skills else [],
-                "posted_date": job_details.posted_date if job_details else None,
-                "candidate_name": match.candidate_name,  # From MatchResult
-                "cv_filename": file.filename,
-                "final_score": final_score,
-                "parser_score": round(match.score_breakdown.rule_based_score * 100, 1),
-                "matcher_score": round(match.score_breakdown.skill_score * 100, 1),
-                "scorer_score": round(match.score_breakdown.experience_score * 100, 1),
-                "status": status,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Add explanation if requested
-            if explain and match.decision.explanation:
-                result["explanation"] = match.decision.explanation
-            
-            results.append(result)
+        # Format results for Next.js frontend (job fields precomputed per job)
+        results = catalog.match_rows(matches, file.filename, explain=explain, compact=compact)
         
-        logger.info(f"Matching complete. Found {len(results)} matches.")
+        logger.debug("Matching complete. Found %d matches.", len(results))
         
         # Return format matching Next.js frontend MatchResponse interface
-        return {
+        return json_response({
             "matches": results,
             "cv_text": None,  # Optional field
             "processing_time": None  # Optional field
-        }
+        }, response)
     
+    except ParseTimeoutError as e:
+        raise HTTPException(422, f"CV parsing timed out: {str(e)}")
     except Exception as e:
         logger.error(f"Matching failed: {e}", exc_info=True)
         raise HTTPException(500, f"Matching failed: {str(e)}")
-    
-    finally:
-        # Clean up
-        try:
-            Path(tmp_path).unlink()
-        except:
-            pass
 
 
 @app.post("/match/single")
 async def match_to_single_job(
+    request: Request,
+    response: Response,
     file: UploadFile = File(...),
     job_id: str = Query(..., description="Job ID to match against"),
     explain: bool = Query(True, description="Generate AI explanation")
@@ -446,10 +570,12 @@ async def match_to_single_job(
     
     More detailed than batch matching, includes full explanation
     """
-    logger.info(f"Matching {file.filename} to job {job_id}")
+    pipeline = get_pipeline()
+    request_id, profile_requested = start_request(request, response)
+    logger.info(f"[{request_id}] Matching {file.filename} to job {job_id}")
     
     # Find the job
-    job = next((j for j in jobs_cache if j.job_id == job_id), None)
+    job = catalog.get(job_id)
     if not job:
         raise HTTPException(404, f"Job {job_id} not found")
     
@@ -458,21 +584,24 @@ async def match_to_single_job(
     if file_ext not in ['.pdf', '.docx', '.txt']:
         raise HTTPException(400, f"Unsupported file type: {file_ext}")
     
-    # Save file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    # Read upload into memory (parsed without a temp file)
+    content = await read_upload(file)
     
     try:
         # Run full 4-agent pipeline for single job
-        logger.info(f"Running full pipeline for job: {job.title}")
+        logger.debug("Running full pipeline for job: %s", job.title)
         
-        match = pipeline.process_cv_for_job(
-            cv_file_path=tmp_path,
-            job=job,
-            generate_explanation=explain
-        )
+        with QUEUE_DEPTH.track_inprogress(endpoint="match_single"), \
+                profile_store.profile(request_id, requested=profile_requested) as profile_id:
+            match = pipeline.process_cv_for_job(
+                cv_file_path=file.filename,
+                cv_bytes=content,
+                job=job,
+                generate_explanation=explain,
+                request_id=request_id
+            )
+        if profile_id:
+            response.headers["X-Profile-ID"] = profile_id
         
         return {
             "success": True,
@@ -516,15 +645,11 @@ async def match_to_single_job(
             "timestamp": match.timestamp.isoformat()
         }
     
+    except ParseTimeoutError as e:
+        raise HTTPException(422, f"CV parsing timed out: {str(e)}")
     except Exception as e:
         logger.error(f"Single job matching failed: {e}", exc_info=True)
         raise HTTPException(500, f"Matching failed: {str(e)}")
-    
-    finally:
-        try:
-            Path(tmp_path).unlink()
-        except:
-            pass
 
 
 @app.get("/history")
@@ -537,6 +662,7 @@ async def get_match_history(
     
     Returns recent CV-job matches stored in the system
     """
+    db = get_pipeline().db
     try:
         # Get matches from database
         all_matches = db.get_all_matches()
@@ -574,13 +700,15 @@ async def get_match_history(
 @app.get("/match/history")
 async def get_match_history_v2(
     limit: int = Query(50, ge=1, le=500, description="Max records to return"),
-    skip: int = Query(0, ge=0, description="Number of records to skip")
+    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    compact: bool = Query(False, description="Omit legacy duplicate fields (company, location, job_type)")
 ):
     """
     Get match history from database (Next.js frontend compatible)
     
     Returns recent CV-job matches with format matching frontend TypeScript types
     """
+    db = get_pipeline().db
     try:
         # Get matches from database using correct method
         all_matches = db.get_top_matches(limit=1000)  # Get recent matches
@@ -589,60 +717,13 @@ async def get_match_history_v2(
         total = len(all_matches)
         paginated_matches = all_matches[skip:skip+limit]
         
-        # Format for Next.js frontend
-        formatted_matches = []
-        for m in paginated_matches:
-            # Get full job details from cache using job_id
-            job_details = next((j for j in jobs_cache if j.job_id == m.job_id), None)
-            
-            # Calculate final score
-            final_score = round(m.final_score * 100, 1)
-            
-            # Auto-assign status based on score
-            if final_score >= 75:
-                status = "accepted"
-            elif final_score >= 50:
-                status = "review"
-            else:
-                status = "rejected"
-            
-            formatted_match = {
-                "match_id": m.match_id,
-                "job_id": m.job_id,
-                "job_title": m.job_title,
-                # New structure fields from job cache
-                "company_name": job_details.company_name if job_details else 'N/A',
-                "company": job_details.company_name if job_details else 'N/A',  # Legacy
-                "location_city": job_details.location_city if job_details else 'Unknown',
-                "location_country": job_details.location_country if job_details else 'Unknown',
-                "location": f"{job_details.location_city}, {job_details.location_country}" if job_details else 'Unknown',  # Legacy
-                "remote_type": job_details.remote_type if job_details else 'on-site',
-                "employment_type": job_details.employment_type if job_details else 'full-time',
-                "job_type": job_details.employment_type if job_details else 'full-time',  # Legacy
-                "seniority_level": job_details.seniority_level if job_details else 'mid',
-                "min_experience_years": job_details.min_experience_years if job_details else 0,
-                "max_experience_years": job_details.max_experience_years if job_details else 0,
-                "description": job_details.description if job_details else None,
-                "required_skills": job_details.required_skills[:10] if job_details and job_details.required_skills else [],
-                "preferred_skills": job_details.preferred_skills[:5] if job_details and job_details.preferred_skills else [],
-                "posted_date": job_details.posted_date if job_details else None,
-                "candidate_name": getattr(m, 'candidate_name', None),
-                "cv_filename": getattr(m, 'cv_id', None),  # Use cv_id as filename fallback
-                # Use individual score fields from MatchHistory
-                "final_score": final_score,
-                "parser_score": round(m.rule_based_score * 100, 1),
-                "matcher_score": round(m.skill_score * 100, 1),
-                "scorer_score": round(m.experience_score * 100, 1),
-                "status": status,
-                "explanation": getattr(m, 'explanation', None),
-                "timestamp": m.created_at.isoformat() if hasattr(m, 'created_at') else datetime.now().isoformat()
-            }
-            formatted_matches.append(formatted_match)
+        # Format for Next.js frontend (job fields precomputed per job)
+        formatted_matches = catalog.history_rows(paginated_matches, compact=compact)
         
-        return {
+        return json_response({
             "matches": formatted_matches,
             "total": total
-        }
+        })
     
     except Exception as e:
         logger.error(f"Failed to get history: {e}")
@@ -656,6 +737,7 @@ async def clear_match_history():
     
     WARNING: This permanently deletes all match records!
     """
+    db = get_pipeline().db
     try:
         deleted_count = db.clear_all_matches()
         logger.info(f"Cleared {deleted_count} matches from database")
@@ -671,6 +753,66 @@ async def clear_match_history():
         raise HTTPException(500, f"Failed to clear history: {str(e)}")
 
 
+# ============================================
+# PROFILING (ADMIN)
+# ============================================
+
+@app.get("/admin/profiling")
+async def get_profiling_status():
+    """Request profiling status and retention settings"""
+    pipeline = get_pipeline()
+    return {
+        "enabled": profile_store.enabled,
+        "header": pipeline.config.profiling.header_name,
+        "max_profiles": profile_store.max_profiles,
+        "stored_profiles": len(profile_store.list_profiles())
+    }
+
+
+@app.put("/admin/profiling")
+async def set_profiling(
+    enabled: bool = Query(..., description="Profile every matching request")
+):
+    """
+    Toggle profiling of every matching request
+    
+    Per-request profiling via the X-Profile header works regardless
+    """
+    profile_store.enabled = enabled
+    logger.info(f"Request profiling {'enabled' if enabled else 'disabled'}")
+    return {"success": True, "enabled": enabled}
+
+
+@app.get("/admin/profiles")
+async def list_profiles():
+    """List captured request profiles, newest first"""
+    profiles = profile_store.list_profiles()
+    return {"profiles": profiles, "total": len(profiles)}
+
+
+@app.get("/admin/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = Query("pstats", description=f"One of: {', '.join(PROFILE_FORMATS)}")
+):
+    """
+    Download a captured profile
+    
+    `pstats` loads with `python -m pstats` or snakeviz;
+    `txt` is the top functions by cumulative time
+    """
+    if format not in PROFILE_FORMATS:
+        raise HTTPException(400, f"Unsupported format: {format}")
+    
+    path = profile_store.get_profile_path(profile_id, format)
+    if path is None:
+        raise HTTPException(404, f"Profile {profile_id} not found")
+    
+    if format == "txt":
+        return PlainTextResponse(path.read_text(encoding="utf-8"))
+    return FileResponse(path, media_type="application/octet-stream", filename=path.name)
+
+
 # ============================================
 # STARTUP & SHUTDOWN
 # ============================================
@@ -678,21 +820,40 @@ async def clear_match_history():
 @app.on_event("startup")
 async def startup_event():
     """Initialize components when server starts"""
-    global jobs_cache
+    setup_logging()
     
     logger.info("=" * 60)
     logger.info("🚀 Starting Recruiter Pro AI API Server...")
     logger.info("=" * 60)
     
+    # Build the agents and open the database (deferred from import)
+    start = time.perf_counter()
+    pipeline = get_pipeline()
+    startup_timings["pipeline"] = round((time.perf_counter() - start) * 1000, 2)
+    
     # Load jobs
     logger.info("Loading jobs from database...")
-    jobs_cache = load_jobs()
+    start = time.perf_counter()
+    set_catalog(load_jobs())
+    startup_timings["catalog"] = round((time.perf_counter() - start) * 1000, 2)
     logger.info(f"✅ Loaded {len(jobs_cache)} jobs")
     
+    # Warm up models and caches before serving
+    startup_timings.update(pipeline.warm_up())
+    
+    # Pre-generate explanations for recent CVs while the API is idle
+    global prewarmer
+    if pipeline.config.prewarm.enabled and pipeline.config.llm.enabled:
+        prewarmer = ExplanationPrewarmer(
+            pipeline, lambda: jobs_cache, pipeline.config.prewarm,
+            version=lambda: catalog.version, busy=matching_busy
+        )
+        prewarmer.start()
+    
     # Initialize database
     logger.info("Initializing database...")
     try:
-        # Database is auto-initialized when get_database() is called
+        get_database()
         logger.info("[OK] Database ready")
     except Exception as e:
         logger.warning(f"[WARN] Database initialization failed: {e}")
@@ -722,7 +883,19 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup when server shuts down"""
     logger.info("👋 Shutting down API Server...")
-    # Add any cleanup code here if needed
+    # Drain queued raw-profile artifacts before the process exits
+    get_artifact_sink().close()
+    close_parse_pools()
+    if prewarmer is not None:
+        prewarmer.stop()
+    if _pipeline is None:
+        return  # Never started
+    close_explainer = getattr(_pipeline.agent4, "close", None)
+    if close_explainer is not None:
+        close_explainer()
+
+
+startup_timings["import"] = round((time.perf_counter() - _import_started) * 1000, 2)
 
 
 # ============================================
@@ -732,6 +905,7 @@ async def shutdown_event():
 if __name__ == "__main__":
     import uvicorn
     
+    setup_logging()
     uvicorn.run(
         "src.api:app",
         host="0.0.0.0",
@@ -0,0 +1,175 @@
+"""
+Circuit Breaker
+Fast-fail calls to a dependency that keeps failing, with exponential backoff
+
+States:
+- closed: calls go through; `failure_threshold` consecutive failures open it
+- open: calls are refused without being attempted until the reset timeout
+  has passed
+- half_open: one trial call is let through; success closes the circuit,
+  failure re-opens it with the reset timeout multiplied by `backoff_factor`
+  (capped at `max_reset_timeout`)
+
+A background health probe can drive the breaker too: `trip()` opens it as
+soon as the dependency is seen down, `allow_trial()` lets a trial through
+as soon as it is seen back up instead of waiting out the backoff.
+
+Usage:
+    breaker = CircuitBreaker("ollama")
+    if breaker.allow_request():
+        try:
+            call()
+        except Exception:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .metrics import CIRCUIT_STATE
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Gauge values for the metrics endpoint
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker"""
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 5.0,
+        max_reset_timeout: float = 300.0,
+        backoff_factor: float = 2.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: Circuit label in metrics and /health
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds open before the first trial call
+            max_reset_timeout: Cap on the backed-off reset timeout
+            backoff_factor: Reset timeout multiplier per failed trial
+            clock: Monotonic time source (seconds)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max(reset_timeout, max_reset_timeout)
+        self.backoff_factor = backoff_factor
+        self._clock = clock
+        self._lock = threading.Lock()
+        
+        self._state = CLOSED
+        self._failures = 0              # Consecutive failures
+        self._timeout = reset_timeout   # Current (backed-off) reset timeout
+        self._retry_at = 0.0            # When an open circuit allows a trial
+        self._trial_running = False
+        self._opened = 0
+        self._last_error: Optional[str] = None
+        CIRCUIT_STATE.set(_STATE_VALUES[CLOSED], circuit=name)
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+    
+    def retry_in(self) -> float:
+        """Seconds until an open circuit allows a trial (0 otherwise)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._retry_at - self._clock())
+    
+    def allow_request(self) -> bool:
+        """
+        Whether a call may go ahead now
+        
+        A True from an open circuit whose timeout has passed makes that call
+        the half-open trial: record its outcome, or no other trial runs.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if self._clock() < self._retry_at:
+                    return False
+                self._set_state(HALF_OPEN)
+            if self._trial_running:
+                return False
+            self._trial_running = True
+            return True
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._timeout = self.reset_timeout
+            self._trial_running = False
+            self._last_error = None
+            self._set_state(CLOSED)
+    
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._failures += 1
+            if error is not None:
+                self._last_error = f"{type(error).__name__}: {error}"
+            if self._state == HALF_OPEN:
+                self._trial_running = False
+                self._timeout = min(self._timeout * self.backoff_factor, self.max_reset_timeout)
+                self._open()
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+    
+    def trip(self, reason: Optional[str] = None) -> None:
+        """
+        Open now (e.g. a health probe saw the dependency down)
+        
+        Tripping an open circuit whose timeout has passed counts as a failed
+        trial, so repeated probes back off like trial calls do.
+        """
+        with self._lock:
+            if reason:
+                self._last_error = reason
+            if self._state == OPEN and self._clock() < self._retry_at:
+                return
+            if self._state != CLOSED:
+                self._timeout = min(self._timeout * self.backoff_factor, self.max_reset_timeout)
+            self._trial_running = False
+            self._open()
+    
+    def allow_trial(self) -> None:
+        """Let the next call through as a trial (e.g. a probe saw it back up)"""
+        with self._lock:
+            if self._state == OPEN:
+                self._retry_at = self._clock()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """State for /health"""
+        with self._lock:
+            retry_in = max(0.0, self._retry_at - self._clock()) if self._state == OPEN else 0.0
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_in_seconds": round(retry_in, 2),
+                "reset_timeout_seconds": self._timeout,
+                "times_opened": self._opened,
+                "last_error": self._last_error,
+            }
+    
+    def _open(self) -> None:
+        # Caller holds the lock
+        self._retry_at = self._clock() + self._timeout
+        self._opened += 1
+        self._set_state(OPEN)
+    
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            CIRCUIT_STATE.set(_STATE_VALUES[state], circuit=self.name)
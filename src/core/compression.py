@@ -0,0 +1,165 @@
+"""
+HTTP Response Compression
+Brotli/gzip encoding negotiation and an ASGI middleware
+
+`CompressionMiddleware` compresses complete (non-streaming) responses above
+a size threshold with the best encoding the client accepts: Brotli when the
+optional `brotli` package is installed, otherwise gzip. Responses that
+already carry a Content-Encoding (e.g. precompressed /jobs pages) and
+streaming responses (file downloads) pass through untouched.
+"""
+import gzip
+from typing import Dict, Iterable, Optional
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Most preferred first
+SUPPORTED_ENCODINGS = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+# Levels for bodies compressed once and served many times
+PRECOMPRESS_LEVELS = {"br": 9, "gzip": 9}
+
+# Responses already compressed in their format
+_INCOMPRESSIBLE_TYPES = ("image/", "audio/", "video/", "application/zip", "application/gzip")
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip()] = q
+    return accepted
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str] = SUPPORTED_ENCODINGS) -> Optional[str]:
+    """
+    Best available encoding the client accepts
+    
+    Returns:
+        "br", "gzip" or None (send uncompressed)
+    """
+    accepted = accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    for encoding in available:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a body
+    
+    Args:
+        body: Uncompressed bytes
+        encoding: "br" or "gzip"
+        level: Brotli quality (0-11) or gzip level (1-9); None = PRECOMPRESS_LEVELS
+    """
+    if level is None:
+        level = PRECOMPRESS_LEVELS.get(encoding)
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    if encoding == "gzip":
+        # mtime=0 keeps the bytes reproducible
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class CompressionMiddleware:
+    """
+    Compress complete responses of at least `minimum_size` bytes
+    
+    Per-request compression favours speed (gzip level 6, Brotli quality 5);
+    responses served repeatedly should be precompressed instead.
+    """
+    
+    LEVELS = {"br": 5, "gzip": 6}
+    
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        accept = ""
+        for name, value in scope.get("headers", ()):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start = None
+        passthrough = False
+        
+        async def send_compressed(message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = {name.lower(): value for name, value in message.get("headers", ())}
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                passthrough = (
+                    b"content-encoding" in headers
+                    or content_type.startswith(_INCOMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message  # Held until the body shows whether to compress
+                return
+            
+            if passthrough or start is None:
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                # e.g. pathsend: nothing to compress
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            
+            held, start = start, None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # Streaming or small: send as-is
+                passthrough = True
+                await send(held)
+                await send(message)
+                return
+            
+            body = compress(body, encoding, self.LEVELS[encoding])
+            headers, vary = [], []
+            for name, value in held.get("headers", ()):
+                if name.lower() == b"vary":
+                    vary.append(value)
+                elif name.lower() != b"content-length":
+                    headers.append((name, value))
+            if b"accept-encoding" not in b", ".join(vary).lower():
+                vary.append(b"Accept-Encoding")
+            headers += [
+                (b"content-encoding", encoding.encode("latin-1")),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"vary", b", ".join(vary)),
+            ]
+            await send({**held, "headers": headers})
+            await send({**message, "body": body})
+        
+        await self.app(scope, receive, send_compressed)
@@ -1,8 +1,15 @@
 """
 Configuration Module for Recruiter-Pro-AI
 Centralized configuration loading from YAML and environment variables
+
+Also owns process-wide logging setup: modules only call
+`logging.getLogger(__name__)`; entry points (API, scripts) call
+`setup_logging()` once.
 """
 import os
+import json
+import random
+import logging
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -91,9 +98,18 @@ class LLMConfig:
     base_url: str = "http://localhost:11500"
     temperature: float = 0.2
     max_tokens: int = 500
-    timeout_seconds: int = 120  # Increased to 120 seconds for AI Matching Engine
-    cache_enabled: bool = True
+    timeout_seconds: int = 120  # Read timeout; increased to 120 seconds for AI Matching Engine
+    connect_timeout_seconds: float = 3.0
+    pool_maxsize: int = 4       # Keep-alive connections to Ollama (>= explain stage workers)
+    batch_size: int = 4         # Matches per batched explanation prompt (1 = one prompt per match)
+    cache_enabled: bool = True  # Cache LLM explanations by prompt
     cache_ttl_hours: int = 24
+    cache_max_entries: int = 2048
+    probe_interval_seconds: float = 60.0  # Background Ollama re-probe (0 = probe once)
+    probe_timeout_seconds: float = 2.0
+    breaker_failure_threshold: int = 3    # Consecutive failures that open the circuit
+    breaker_reset_seconds: float = 5.0    # First wait before a trial call
+    breaker_max_reset_seconds: float = 300.0
     
     # LangChain mode selection
     use_langchain: bool = False  # False = Direct HTTP (fast), True = LangChain (advanced)
@@ -111,6 +127,113 @@ class APIConfig:
     cors_origins: list = field(default_factory=lambda: ["http://localhost:8501"])
     api_docs_enabled: bool = True
     max_upload_size_mb: int = 10
+    
+    # Compress responses at least this large (gzip, or Brotli if installed)
+    compression_min_bytes: int = 1024
+    # /jobs Cache-Control max-age; clients revalidate with If-None-Match after it
+    jobs_max_age_seconds: int = 0
+    # Serialized /jobs pages kept per catalog version
+    jobs_page_cache_size: int = 64
+
+
+@dataclass
+class ParsingConfig:
+    """CV parsing (Agent 1) budgets"""
+    # PDF extraction budget per document (0 = unlimited)
+    pdf_max_pages: int = 30
+    pdf_max_chars: int = 100_000
+    
+    # Stop reading pages once these section headers have been seen...
+    pdf_early_stop: bool = True
+    pdf_early_stop_sections: list = field(default_factory=lambda: ["experience", "skills"])
+    # ...plus this many further pages, so the last section can finish
+    pdf_early_stop_grace_pages: int = 1
+    
+    # Process-isolated extraction (0 = extract in the calling process)
+    worker_processes: int = 0
+    worker_timeout_seconds: float = 0  # Per document; 0 = agents.agent1.timeout_seconds
+    worker_memory_limit_mb: int = 1024  # Headroom per worker; 0 = unlimited (POSIX only)
+    worker_max_documents: int = 200  # Recycle a worker after this many documents
+    worker_start_method: str = "spawn"
+
+
+@dataclass
+class ArtifactsConfig:
+    """Intermediate artifact persistence (e.g. Agent 1 raw profiles)"""
+    mode: str = "jsonl_gz"  # "off", "json" (file per artifact) or "jsonl_gz"
+    background: bool = True  # Write from a daemon thread, off the request path
+    output_dir: str = "data/processed/raw_profiles"
+    
+    # Retention
+    max_files: int = 20
+    max_age_days: float = 7
+    rotate_mb: float = 50  # jsonl_gz: start a new file beyond this size
+    
+    queue_size: int = 1000  # background: artifacts dropped when full
+
+
+@dataclass
+class PipelineConfig:
+    """Staged matching pipeline configuration"""
+    # Worker threads per stage (1 = run inline, no executor)
+    stage_workers: Dict[str, int] = field(default_factory=lambda: {
+        "score": 1,
+        "explain": 1,
+        "persist": 1,
+    })
+    
+    # Candidate pre-filter: minimum required-skill overlap (0 = disabled)
+    candidate_min_skill_overlap: int = 0
+    
+    # Batch explanations only for matches at or above this hybrid score
+    explain_min_score: float = 0.6
+    
+    # Which batch results get persisted: only the returned "top_k", or "all"
+    # scored jobs (builds a decision, MatchResult and row for every job)
+    persist_scope: str = "top_k"
+    
+    def workers_for(self, stage: str) -> int:
+        """Get worker count for a stage (defaults to 1)"""
+        return max(1, int(self.stage_workers.get(stage, 1)))
+
+
+@dataclass
+class ProfilingConfig:
+    """Request-scoped profiling configuration"""
+    enabled: bool = False  # Admin toggle: profile every matching request
+    header_name: str = "X-Profile"  # Per-request opt-in header
+    output_dir: str = "data/profiles"
+    max_profiles: int = 20
+    summary_lines: int = 40
+
+
+@dataclass
+class PrewarmConfig:
+    """Idle-time explanation pre-generation for recently seen CVs"""
+    enabled: bool = True
+    top_n: int = 5  # Jobs explained per recent CV
+    min_score: float = 0.6  # Skip matches below this hybrid score
+    max_recent_cvs: int = 50
+    interval_seconds: float = 30.0  # Pause between passes
+    
+    # Throttling: only run while idle and within budget
+    max_load: float = 0.5  # 1-minute load average per CPU
+    budget_per_hour: int = 120  # LLM explanations generated per hour
+
+
+@dataclass
+class LoggingConfig:
+    """Logging configuration (applied by setup_logging)"""
+    level: str = "INFO"
+    format: str = "text"  # "text" or "json" (one object per line)
+    
+    # Fraction of matching requests that log a summary line with stage timings
+    request_summary_sample_rate: float = 1.0
+    
+    # Chatty third-party loggers held at WARNING or above
+    quiet_loggers: list = field(default_factory=lambda: [
+        "httpx", "urllib3", "pdfminer", "multipart", "python_multipart"
+    ])
 
 
 @dataclass
@@ -125,6 +248,12 @@ class Config:
     scoring: ScoringConfig = field(default_factory=ScoringConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
     api: APIConfig = field(default_factory=APIConfig)
+    parsing: ParsingConfig = field(default_factory=ParsingConfig)
+    artifacts: ArtifactsConfig = field(default_factory=ArtifactsConfig)
+    pipeline: PipelineConfig = field(default_factory=PipelineConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    prewarm: PrewarmConfig = field(default_factory=PrewarmConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
     
     # Agents
     agent1: AgentConfig = field(default_factory=AgentConfig)
@@ -167,6 +296,24 @@ class Config:
         if 'api' in data:
             config.api = APIConfig(**data['api'])
         
+        if 'parsing' in data:
+            config.parsing = ParsingConfig(**data['parsing'])
+        
+        if 'artifacts' in data:
+            config.artifacts = ArtifactsConfig(**data['artifacts'])
+        
+        if 'pipeline' in data:
+            config.pipeline = PipelineConfig(**data['pipeline'])
+        
+        if 'profiling' in data:
+            config.profiling = ProfilingConfig(**data['profiling'])
+        
+        if 'prewarm' in data:
+            config.prewarm = PrewarmConfig(**data['prewarm'])
+        
+        if 'logging' in data:
+            config.logging = LoggingConfig(**data['logging'])
+        
         # Update from environment variables (override YAML)
         config._load_from_env()
         
@@ -204,6 +351,20 @@ class Config:
         if os.getenv('CORS_ORIGINS'):
             self.api.cors_origins = os.getenv('CORS_ORIGINS').split(',')
         
+        # Artifacts
+        if os.getenv('ARTIFACTS_MODE'):
+            self.artifacts.mode = os.getenv('ARTIFACTS_MODE').lower()
+        
+        # Profiling
+        if os.getenv('PROFILING_ENABLED'):
+            self.profiling.enabled = os.getenv('PROFILING_ENABLED').lower() == 'true'
+        
+        # Logging
+        if os.getenv('LOG_LEVEL'):
+            self.logging.level = os.getenv('LOG_LEVEL').upper()
+        if os.getenv('LOG_FORMAT'):
+            self.logging.format = os.getenv('LOG_FORMAT').lower()
+        
         # Environment
         if os.getenv('ENV'):
             self.env = os.getenv('ENV')
@@ -276,5 +437,77 @@ def load_decision_rules() -> Dict[str, Any]:
         return yaml.safe_load(f)
 
 
-# Initialize configuration on module import
-config = get_config()
+# ============================================
+# LOGGING
+# ============================================
+
+# Attributes every LogRecord has; anything else came in via `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+TEXT_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_logging_configured = False
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including `extra` fields"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+def setup_logging(logging_config: Optional[LoggingConfig] = None, force: bool = False) -> None:
+    """
+    Configure root logging for the process (idempotent)
+    
+    Installs a single stream handler (text or JSON) on the root logger.
+    Handlers added by others (pytest, uvicorn) are left alone.
+    
+    Args:
+        logging_config: Settings to apply (default: get_config().logging)
+        force: Re-apply even if logging was already configured
+    """
+    global _logging_configured
+    
+    if _logging_configured and not force:
+        return
+    
+    logging_config = logging_config or get_config().logging
+    level = logging.getLevelName(logging_config.level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    
+    root = logging.getLogger()
+    for handler in [h for h in root.handlers if getattr(h, "_recruiter_handler", False)]:
+        root.removeHandler(handler)
+    
+    handler = logging.StreamHandler()
+    handler._recruiter_handler = True
+    if logging_config.format == "json":
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT))
+    
+    root.addHandler(handler)
+    root.setLevel(level)
+    for name in logging_config.quiet_loggers:
+        logging.getLogger(name).setLevel(max(logging.WARNING, level))
+    
+    _logging_configured = True
+
+
+def should_log_request_summary() -> bool:
+    """Sample whether this request logs its summary line"""
+    rate = get_config().logging.request_summary_sample_rate
+    return rate >= 1.0 or (rate > 0 and random.random() < rate)
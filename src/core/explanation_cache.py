@@ -0,0 +1,83 @@
+"""
+Explanation Cache
+LLM explanations keyed by the prompt they answer
+
+An explanation is a function of its prompt (candidate, job, scores, decision
+and skills), so the cache key is a digest of the single-match prompt:
+a changed score or job gives a new key and stale entries simply age out.
+Only explanations produced by the LLM are stored, never rule-based
+fallbacks, so a cached answer is always the one Ollama would give.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+from .metrics import CACHE_EVENTS
+
+
+class ExplanationCache:
+    """Thread-safe LRU of explanations with a time-to-live"""
+    
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 86400.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Entries kept (least recently used evicted)
+            ttl_seconds: Age after which an entry is ignored (0 = no expiry)
+            clock: Monotonic time source (seconds)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get(self, key: str, record: bool = True) -> Optional[str]:
+        """
+        Cached explanation, or None
+        
+        Args:
+            key: Prompt digest
+            record: Count the lookup in the cache hit/miss metrics
+        """
+        return self.get_many([key], record=record)[0]
+    
+    def get_many(self, keys: List[str], record: bool = True) -> List[Optional[str]]:
+        """Cached explanations (None where missing), under one lock and one metric update"""
+        found: List[Optional[str]] = []
+        with self._lock:
+            now = self._clock()
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and self.ttl_seconds and now - entry[0] > self.ttl_seconds:
+                    del self._entries[key]
+                    entry = None
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                found.append(entry[1] if entry is not None else None)
+        if record:
+            hits = len(found) - found.count(None)
+            if hits:
+                CACHE_EVENTS.inc(hits, cache="explanation", result="hit")
+            if hits < len(found):
+                CACHE_EVENTS.inc(len(found) - hits, cache="explanation", result="miss")
+        return found
+    
+    def put(self, key: str, explanation: str) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), explanation)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,76 @@
+"""
+Pooled HTTP Client
+Keep-alive `requests` sessions for outbound calls (Ollama)
+
+`pooled_session()` mounts an adapter with a bounded connection pool, so
+repeated calls to the same host reuse TCP connections instead of paying
+connection setup on every request. Each request is counted by whether it
+opened a new connection or reused a pooled one:
+
+    recruiter_http_connections_total{client="ollama",result="new"}
+    recruiter_http_connections_total{client="ollama",result="reused"}
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .metrics import HTTP_CONNECTIONS
+
+# Set by the connection pools when a request opens a connection; pools and
+# the adapter run in the calling thread, so this is per request
+_state = threading.local()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _state.opened = True
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _state.opened = True
+        return super()._new_conn()
+
+
+class CountingAdapter(HTTPAdapter):
+    """HTTPAdapter recording new vs reused connections per request"""
+    
+    __attrs__ = HTTPAdapter.__attrs__ + ["client"]
+    
+    def __init__(self, client: str, **kwargs):
+        self.client = client
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+    
+    def send(self, request, *args, **kwargs):
+        _state.opened = False
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            HTTP_CONNECTIONS.inc(client=self.client, result="new" if _state.opened else "reused")
+
+
+def pooled_session(client: str, pool_maxsize: int = 10) -> requests.Session:
+    """
+    Session with keep-alive connection pooling for one upstream service
+    
+    Args:
+        client: Metrics label for the upstream (e.g. "ollama")
+        pool_maxsize: Connections kept open per host; set it to the number of
+            threads calling concurrently, or extra calls open throwaway
+            connections
+    """
+    session = requests.Session()
+    adapter = CountingAdapter(client, pool_connections=1, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,268 @@
+"""
+Job Catalog Search Index
+Inverted indexes and bitsets answering /jobs filters without scanning jobs
+
+Jobs are numbered by catalog position and every posting set is a bitset (a
+Python int, bit i = job i), so a query is a handful of big-int AND/ORs:
+
+- title and location: word → postings; prefix search over the sorted words
+- skills: registry skill ID → postings (required + preferred)
+- seniority_level, remote_type, employment_type: value → postings
+- experience: sorted distinct min/max years with cumulative "≤ value"
+  bitsets, so a range costs two bisects
+
+Keys held by at least 1/64 of the jobs keep a ready bitset. Rarer ones keep a
+position array that becomes a bitset only when queried, so the number of
+full-size bitsets per field is at most 64 × (keys per job).
+"""
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..storage.models import JobPosting
+from .skill_registry import SkillRegistry, get_skill_registry
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+# Set-bit positions of every byte value
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+
+def _words(text: Optional[str]) -> List[str]:
+    return _WORD_RE.findall(text.lower()) if text else []
+
+
+def _csv(value: Optional[str]) -> List[str]:
+    """Comma-separated query values, stripped and lower-cased"""
+    if not value:
+        return []
+    return [part.strip().lower() for part in value.split(",") if part.strip()]
+
+
+def bitset(positions: Iterable[int], size: int) -> int:
+    """Bitset of `size` bits with the given positions set"""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def count(mask: int) -> int:
+    """Number of set bits"""
+    return bin(mask).count("1")
+
+
+def positions(mask: int, skip: int = 0, limit: Optional[int] = None) -> List[int]:
+    """Set-bit positions in ascending order, paginated"""
+    result: List[int] = []
+    if not mask:
+        return result
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if not byte:
+            continue
+        bits = _BYTE_BITS[byte]
+        if skip >= len(bits):
+            skip -= len(bits)
+            continue
+        base = offset << 3
+        for bit in bits[skip:]:
+            result.append(base + bit)
+            if limit is not None and len(result) >= limit:
+                return result
+        skip = 0
+    return result
+
+
+class _Postings:
+    """Key → job postings, as bitsets for common keys and arrays for rare ones"""
+    
+    def __init__(self, postings: Dict[str, List[int]], size: int, dense_min: int):
+        self.size = size
+        self.keys = sorted(postings)  # For prefix search
+        self._dense: Dict[str, int] = {}
+        self._sparse: Dict[str, array] = {}
+        for key, items in postings.items():
+            if len(items) >= dense_min:
+                self._dense[key] = bitset(items, size)
+            else:
+                self._sparse[key] = array("I", items)
+    
+    def union(self, keys: Iterable[str]) -> int:
+        """Jobs holding any of the keys"""
+        mask = 0
+        buffer = None
+        for key in keys:
+            dense = self._dense.get(key)
+            if dense is not None:
+                mask |= dense
+                continue
+            sparse = self._sparse.get(key)
+            if sparse is None:
+                continue
+            if buffer is None:
+                buffer = bytearray((self.size + 7) // 8)
+            for position in sparse:
+                buffer[position >> 3] |= 1 << (position & 7)
+        if buffer is not None:
+            mask |= int.from_bytes(buffer, "little")
+        return mask
+    
+    def get(self, key: str) -> int:
+        return self.union((key,))
+    
+    def prefixed(self, prefix: str) -> int:
+        """Jobs holding any key starting with prefix"""
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\uffff", start)
+        return self.union(self.keys[start:end])
+
+
+class _Cumulative:
+    """Bitsets of jobs whose value is ≤ each distinct value"""
+    
+    def __init__(self, values: Sequence[float]):
+        order = sorted(range(len(values)), key=values.__getitem__)
+        buffer = bytearray((len(values) + 7) // 8)
+        self.values: List[float] = []
+        self.at_most: List[int] = []
+        for i, position in enumerate(order):
+            buffer[position >> 3] |= 1 << (position & 7)
+            value = values[position]
+            if i + 1 == len(order) or values[order[i + 1]] != value:
+                self.values.append(value)
+                self.at_most.append(int.from_bytes(buffer, "little"))
+    
+    def le(self, value: float) -> int:
+        """Jobs with value ≤ `value`"""
+        i = bisect_right(self.values, value)
+        return self.at_most[i - 1] if i else 0
+    
+    def lt(self, value: float) -> int:
+        """Jobs with value < `value`"""
+        i = bisect_left(self.values, value)
+        return self.at_most[i - 1] if i else 0
+
+
+@dataclass
+class JobFilter:
+    """/jobs query filters (None or empty = not filtered)"""
+    q: Optional[str] = None                  # Title words (prefix match, all must match)
+    skills: Optional[str] = None             # Comma-separated skills
+    skills_match: str = "any"                # "any" or "all"
+    seniority_level: Optional[str] = None    # Comma-separated values (any)
+    remote_type: Optional[str] = None
+    employment_type: Optional[str] = None
+    location: Optional[str] = None           # City/country words (prefix match)
+    min_experience: Optional[float] = None   # Job's experience range overlaps
+    max_experience: Optional[float] = None   # [min_experience, max_experience]
+    
+    @property
+    def active(self) -> bool:
+        return any((
+            _words(self.q), _csv(self.skills), _csv(self.seniority_level), _csv(self.remote_type),
+            _csv(self.employment_type), _words(self.location),
+            self.min_experience is not None, self.max_experience is not None
+        ))
+
+
+class JobIndex:
+    """
+    Search index over a job catalog
+    
+    Example:
+        index = JobIndex(jobs)
+        mask = index.match(JobFilter(q="python dev", remote_type="remote"))
+        index.count(mask), index.positions(mask, skip=0, limit=20)
+    """
+    
+    # Keys held by at least 1/DENSE_FRACTION of jobs keep a ready bitset
+    DENSE_FRACTION = 64
+    
+    def __init__(self, jobs: Sequence[JobPosting], registry: Optional[SkillRegistry] = None):
+        self.size = len(jobs)
+        self.registry = registry or get_skill_registry()
+        self.all = (1 << self.size) - 1
+        dense_min = max(1, self.size // self.DENSE_FRACTION)
+        
+        fields: Dict[str, Dict[str, List[int]]] = {
+            name: {} for name in ("title", "location", "skills", "seniority_level", "remote_type", "employment_type")
+        }
+        
+        def add(field: str, keys: Iterable, position: int) -> None:
+            postings = fields[field]
+            for key in keys:
+                items = postings.setdefault(key, [])
+                if not items or items[-1] != position:
+                    items.append(position)
+        
+        skill_ids: Dict[str, int] = {}  # Catalogs repeat a few hundred spellings
+        
+        def intern(skill: str) -> int:
+            skill_id = skill_ids.get(skill)
+            if skill_id is None:
+                skill_id = skill_ids[skill] = self.registry.intern(skill)
+            return skill_id
+        
+        for i, job in enumerate(jobs):
+            add("title", _words(job.title), i)
+            add("location", _words(job.location_city) + _words(job.location_country), i)
+            skills = {intern(s) for s in job.required_skills + job.preferred_skills if s and s.strip()}
+            skills.discard(None)  # Past the registry's ad-hoc cap
+            add("skills", skills, i)
+            add("seniority_level", (job.seniority_level.lower(),), i)
+            add("remote_type", (job.remote_type.lower(),), i)
+            add("employment_type", (job.employment_type.lower(),), i)
+        
+        self._fields = {name: _Postings(postings, self.size, dense_min) for name, postings in fields.items()}
+        self._min_years = _Cumulative([job.min_experience_years for job in jobs])
+        self._max_years = _Cumulative([job.max_experience_years for job in jobs])
+    
+    def match(self, query: JobFilter) -> int:
+        """Bitset of jobs matching every filter in the query"""
+        mask = self.all
+        
+        for field, text in (("title", query.q), ("location", query.location)):
+            for word in _words(text):
+                mask &= self._fields[field].prefixed(word)
+        
+        skills = _csv(query.skills)
+        if skills:
+            postings = self._fields["skills"]
+            skill_ids = [self.registry.id_of(skill) for skill in skills]
+            if query.skills_match == "all":
+                for skill_id in skill_ids:
+                    mask &= postings.get(skill_id) if skill_id is not None else 0
+            else:
+                mask &= postings.union(skill_id for skill_id in skill_ids if skill_id is not None)
+        
+        for field in ("seniority_level", "remote_type", "employment_type"):
+            values = _csv(getattr(query, field))
+            if values:
+                mask &= self._fields[field].union(values)
+        
+        # Overlap: job.min <= max_experience and job.max >= min_experience
+        if query.max_experience is not None:
+            mask &= self._min_years.le(query.max_experience)
+        if query.min_experience is not None:
+            mask &= ~self._max_years.lt(query.min_experience)
+        
+        return mask & self.all
+    
+    @staticmethod
+    def count(mask: int) -> int:
+        return count(mask)
+    
+    @staticmethod
+    def positions(mask: int, skip: int = 0, limit: Optional[int] = None) -> List[int]:
+        return positions(mask, skip, limit)
+    
+    def search(self, query: JobFilter, skip: int = 0, limit: Optional[int] = None) -> Tuple[int, List[int]]:
+        """
+        Returns:
+            (total matching jobs, catalog positions of the requested page)
+        """
+        mask = self.match(query)
+        return count(mask), positions(mask, skip, limit)
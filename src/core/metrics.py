@@ -0,0 +1,344 @@
+"""
+Metrics Module for Recruiter-Pro-AI
+In-process counters, gauges and histograms rendered in Prometheus text format
+
+No external services: metrics live in a process-wide registry and are
+scraped from the API's /metrics endpoint.
+
+Usage:
+    from src.core.metrics import STAGE_LATENCY
+    STAGE_LATENCY.observe(0.012, stage="parse")
+    
+    with LLM_CALL_LATENCY.time():
+        call_llm()
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds: 1ms .. 60s
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+LabelKey = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric:
+    """Base class: a named metric family with optional labels"""
+    type_name = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, str]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+    
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return lines
+    
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+    type_name = "counter"
+    
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+    
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+    
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    type_name = "gauge"
+    
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+    
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+    
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+    
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+    
+    @contextmanager
+    def track_inprogress(self, **labels):
+        """Increment while the block runs (e.g. queue depth)"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+    
+    def _samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in items
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values (seconds for latencies)"""
+    type_name = "histogram"
+    
+    def __init__(self, name, documentation, labelnames=(), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # key -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[LabelKey, List[int]] = {}
+        self._sums: Dict[LabelKey, float] = {}
+    
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            self._sums[key] += value
+    
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of the block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+    
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(self._key(labels), []))
+    
+    def sum(self, **labels) -> float:
+        return self._sums.get(self._key(labels), 0.0)
+    
+    def _samples(self):
+        with self._lock:
+            items = sorted((k, list(c), self._sums[k]) for k, c in self._counts.items())
+        
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families, rendered together"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.type_name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+    
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+    
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+    
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format (0.0.4)"""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Content type for the /metrics endpoint
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Process-wide registry
+REGISTRY = MetricsRegistry()
+
+
+# ============================================
+# APPLICATION METRICS
+# ============================================
+
+STAGE_LATENCY = REGISTRY.histogram(
+    "recruiter_pipeline_stage_seconds",
+    "Latency of each matching pipeline stage",
+    ["stage"]
+)
+
+FILE_READ_LATENCY = REGISTRY.histogram(
+    "recruiter_file_read_seconds",
+    "Time to read an uploaded CV file"
+)
+
+PDF_EXTRACTION_LATENCY = REGISTRY.histogram(
+    "recruiter_pdf_extraction_seconds",
+    "PDF text extraction latency by backend",
+    ["backend"]
+)
+
+JOB_SCORE_LATENCY = REGISTRY.histogram(
+    "recruiter_job_score_seconds",
+    "Agent 3 latency to score one CV against one job",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+)
+
+ML_INFERENCE_LATENCY = REGISTRY.histogram(
+    "recruiter_ml_inference_seconds",
+    "ATS model inference latency"
+)
+
+LLM_CALL_LATENCY = REGISTRY.histogram(
+    "recruiter_llm_call_seconds",
+    "LLM explanation call latency",
+    ["provider"]
+)
+
+LLM_TOKENS = REGISTRY.counter(
+    "recruiter_llm_tokens_total",
+    "Tokens processed by the LLM as reported by Ollama (prompt/output)",
+    ["kind"]
+)
+
+DB_WRITE_LATENCY = REGISTRY.histogram(
+    "recruiter_db_write_seconds",
+    "Database write latency",
+    ["operation"]
+)
+
+CACHE_EVENTS = REGISTRY.counter(
+    "recruiter_cache_events_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"]
+)
+
+FALLBACKS = REGISTRY.counter(
+    "recruiter_fallbacks_total",
+    "Fallbacks to a degraded code path",
+    ["component", "reason"]
+)
+
+CATALOG_SIZE = REGISTRY.gauge(
+    "recruiter_job_catalog_size",
+    "Number of jobs loaded in the catalog"
+)
+
+QUEUE_DEPTH = REGISTRY.gauge(
+    "recruiter_requests_in_progress",
+    "Matching requests currently in progress",
+    ["endpoint"]
+)
+
+HTTP_CONNECTIONS = REGISTRY.counter(
+    "recruiter_http_connections_total",
+    "Outbound HTTP requests by client and connection (new/reused)",
+    ["client", "result"]
+)
+
+CIRCUIT_STATE = REGISTRY.gauge(
+    "recruiter_circuit_state",
+    "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+    ["circuit"]
+)
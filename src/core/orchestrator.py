@@ -2,44 +2,271 @@
 Agent Orchestrator - 4-Agent Pipeline Coordinator
 Manages the complete CV-Job matching workflow
 
-Pipeline Flow:
-1. Agent 1 (Parser) → Extract text from CV files
-2. Agent 2 (Extractor) → Parse structured data from text
-3. Agent 3 (Scorer) → Calculate hybrid scores (rules + ML)
-4. Agent 4 (Explainer) → Generate LLM explanations
+Pipeline Flow (one stage per step, each timed independently):
+1. parse            → Agent 1 extracts text from the CV file
+2. extract          → Agent 2 parses structured data, builds the CVProfile
+3. candidate_filter → Cheap pre-filter of the job list (pass-through by default)
+4. score            → Agent 3 hybrid scores (rules + ML), ranked
+5. decide           → Threshold-based hiring decision per match
+6. explain          → Agent 4 explanations for the top matches
+7. persist          → Save results to the database
 
-Design: Layered pipeline with error handling and logging
+Design: Stages are small objects with a `run(pipeline, ctx)` method and their
+own worker count. Swap one with `MatchingPipeline.replace_stage()` to profile
+or benchmark an alternative (e.g. a vectorized scorer) in isolation.
 """
 import time
 import uuid
 import logging
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
 from pathlib import Path
-from datetime import datetime
 
 from ..storage.models import (
     CVProfile, JobPosting, MatchResult, MatchDecision,
     DecisionType, ScoreBreakdown
 )
 from ..storage.database import get_database
-from ..core.config import get_config
+from .config import get_config, should_log_request_summary
+from .metrics import STAGE_LATENCY, JOB_SCORE_LATENCY
+from .prewarm import RecentCVs
 
-from .agent1_parser import RawParser
-from .agent2_extractor import CandidateExtractor
-from .agent3_scorer import HybridScoringAgent
-from .agent4_llm_explainer import get_explainer_agent
+from ..agents.agent1_parser import RawParser
+from ..agents.agent2_extractor import CandidateExtractor
+from ..agents.agent3_scorer import HybridScoringAgent, ScoreRecord
+from ..agents.agent4_factory import get_explainer_agent
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class ScoredJob:
+    """
+    A job with its score record and per-match bookkeeping
+    
+    The ScoreBreakdown model is built on first access to `score`, so jobs
+    that are neither returned nor persisted never allocate one.
+    """
+    __slots__ = ("job", "record", "elapsed_ms", "decision", "explanation", "result", "_score")
+    
+    def __init__(self, job: JobPosting, record: ScoreRecord, elapsed_ms: float):
+        self.job = job
+        self.record = record
+        self.elapsed_ms = elapsed_ms
+        self.decision: Optional[MatchDecision] = None
+        self.explanation: Optional[str] = None
+        self.result: Optional[MatchResult] = None
+        self._score: Optional[ScoreBreakdown] = None
+    
+    @property
+    def score(self) -> ScoreBreakdown:
+        if self._score is None:
+            self._score = self.record.breakdown()
+        return self._score
+
+
+@dataclass
+class MatchContext:
+    """
+    State threaded through the pipeline stages for one CV
+    
+    `cv_file_path` is a path on disk, or just the original file name when
+    the content is supplied in memory via `cv_bytes`.
+    """
+    cv_file_path: str
+    jobs: List[JobPosting]
+    cv_bytes: Optional[bytes] = None
+    top_k: Optional[int] = None
+    generate_explanations: bool = True
+    use_llm: bool = True  # False: rule-based explanations for this request only
+    explain_min_score: float = 0.0
+    request_id: Optional[str] = None
+    filter_candidates: bool = True  # False: score every job (explicitly requested)
+    
+    # Filled in by the stages
+    cv_text: str = ""
+    cv_sections: Optional[Dict] = None  # Agent 1 section spans into cv_text
+    extracted_data: Dict = field(default_factory=dict)
+    cv: Optional[CVProfile] = None
+    candidates: List[JobPosting] = field(default_factory=list)
+    scored: List[ScoredJob] = field(default_factory=list)
+    selected: List[ScoredJob] = field(default_factory=list)
+    results: List[MatchResult] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.perf_counter)
+
+
+class PipelineStage:
+    """
+    Base class for a pipeline stage
+    
+    Subclasses set `name` and implement `run()`. `map()` fans work out over
+    `max_workers` threads when the stage is configured for concurrency.
+    """
+    name: str = "stage"
+    
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max(1, max_workers)
+    
+    def run(self, pipeline: "MatchingPipeline", ctx: MatchContext) -> None:
+        raise NotImplementedError
+    
+    def map(self, fn: Callable, items: List) -> List:
+        """Apply fn to items, concurrently if max_workers > 1 (order preserved)"""
+        if self.max_workers == 1 or len(items) < 2:
+            return [fn(item) for item in items]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(fn, items))
+
+
+class ParseStage(PipelineStage):
+    """Agent 1: file (or in-memory upload) → raw text"""
+    name = "parse"
+    
+    def __init__(self, max_workers: int = 1, min_text_length: int = 50):
+        super().__init__(max_workers)
+        self.min_text_length = min_text_length
+    
+    def run(self, pipeline, ctx):
+        if ctx.cv_bytes is not None:
+            result = pipeline.agent1.parse_bytes(ctx.cv_bytes, ctx.cv_file_path)
+        else:
+            result = pipeline.agent1.parse_file(ctx.cv_file_path)
+        ctx.cv_text = result.get('raw_text', '')
+        ctx.cv_sections = result.get('section_spans')
+        
+        if not ctx.cv_text or len(ctx.cv_text) < self.min_text_length:
+            raise ValueError("CV parsing failed or file too short")
+
+
+class ExtractStage(PipelineStage):
+    """Agent 2: raw text → structured data → CVProfile"""
+    name = "extract"
+    
+    def run(self, pipeline, ctx):
+        ctx.extracted_data = pipeline.agent2.extract(ctx.cv_text, sections=ctx.cv_sections)
+        ctx.cv = pipeline.build_cv_profile(ctx.cv_file_path, ctx.cv_text, ctx.extracted_data)
+
+
+class CandidateFilterStage(PipelineStage):
+    """
+    Cheap pre-filter before full scoring
+    
+    Drops jobs sharing fewer than `min_skill_overlap` required skills (by
+    canonical skill ID) with the CV. With the default of 0, or when the
+    request names its jobs explicitly (`ctx.filter_candidates` False, e.g.
+    /match/single), every job passes through unchanged.
+    """
+    name = "candidate_filter"
+    
+    def __init__(self, max_workers: int = 1, min_skill_overlap: int = 0):
+        super().__init__(max_workers)
+        self.min_skill_overlap = min_skill_overlap
+    
+    def run(self, pipeline, ctx):
+        if self.min_skill_overlap <= 0 or not ctx.filter_candidates:
+            ctx.candidates = list(ctx.jobs)
+            return
+        
+        agent3 = pipeline.agent3
+        cv_skills = agent3.cv_skill_ids(ctx.cv)
+        ctx.candidates = [
+            job for job in ctx.jobs
+            if len(cv_skills & agent3.job_skill_ids(job)[0]) >= self.min_skill_overlap
+        ]
+
+
+class ScoreStage(PipelineStage):
+    """Agent 3: hybrid score every candidate job, then rank"""
+    name = "score"
+    
+    def run(self, pipeline, ctx):
+        cv = ctx.cv
+        pipeline.agent3.prepare_cv(cv)  # Normalize/tokenize the CV once, before fanning out
+        
+        def score_one(job: JobPosting) -> ScoredJob:
+            start = time.perf_counter()
+            record = pipeline.agent3.score_record(cv, job)
+            elapsed = time.perf_counter() - start
+            JOB_SCORE_LATENCY.observe(elapsed)
+            return ScoredJob(job, record, elapsed * 1000)
+        
+        scored = self.map(score_one, ctx.candidates)
+        scored.sort(key=lambda s: s.record.hybrid_score, reverse=True)
+        
+        ctx.scored = scored
+        ctx.selected = scored[:ctx.top_k] if ctx.top_k else scored
+
+
+class DecideStage(PipelineStage):
+    """Threshold-based decision for every match that will be returned or saved"""
+    name = "decide"
+    
+    def run(self, pipeline, ctx):
+        for item in pipeline._persisted(ctx):
+            item.decision = pipeline._make_decision(item.score)
+
+
+class ExplainStage(PipelineStage):
+    """
+    Agent 4: explanations for returned matches above the score floor
+    
+    Matches are explained in batches of `llm.batch_size` (one LLM prompt per
+    batch) when the explainer supports it; batches run on `max_workers`.
+    Skipped entirely when `llm.enabled` is off.
+    """
+    name = "explain"
+    
+    def run(self, pipeline, ctx):
+        if not (ctx.generate_explanations and pipeline.config.llm.enabled):
+            return
+        
+        targets = [s for s in ctx.selected if s.record.hybrid_score >= ctx.explain_min_score]
+        explain_many = getattr(pipeline.agent4, "generate_explanations", None)
+        batch_size = max(1, pipeline.config.llm.batch_size) if explain_many else 1
+        
+        def explain_batch(batch: List[ScoredJob]) -> None:
+            drafts = [pipeline._match_result(ctx, item) for item in batch]
+            if explain_many is None:
+                explanations = [pipeline.agent4.generate_explanation(draft, use_llm=ctx.use_llm) for draft in drafts]
+            else:
+                explanations = explain_many(drafts, use_llm=ctx.use_llm)
+            for item, explanation in zip(batch, explanations):
+                item.explanation = explanation
+                item.decision.explanation = explanation
+                item.result.decision = item.decision
+        
+        self.map(explain_batch, [targets[i:i + batch_size] for i in range(0, len(targets), batch_size)])
+
+
+class PersistStage(PipelineStage):
+    """Collect final MatchResults and save them in one transaction"""
+    name = "persist"
+    
+    def run(self, pipeline, ctx):
+        results = {id(item): pipeline._match_result(ctx, item) for item in pipeline._persisted(ctx)}
+        ctx.results = [results[id(item)] for item in ctx.selected]
+        
+        if pipeline.save_to_db and pipeline.db:
+            pipeline.db.save_matches(list(results.values()))
+
+
 class MatchingPipeline:
     """
     4-Agent Pipeline for CV-Job Matching
     
-    Orchestrates the complete workflow from CV file to match decision
+    Orchestrates the complete workflow from CV file to match decision as a
+    sequence of pluggable, individually timed stages.
     """
     
+    AGENT_VERSIONS = {
+        "agent1": "1.0",
+        "agent2": "1.0",
+        "agent3": "2.0-hybrid",
+        "agent4": "2.0-llm"
+    }
+    
     def __init__(self, config=None, save_to_db: bool = True):
         """
         Initialize pipeline with all agents
@@ -53,149 +280,212 @@ class MatchingPipeline:
         self.db = get_database() if save_to_db else None
         
         # Initialize agents
-        logger.info("🚀 Initializing 4-Agent Pipeline...")
-        
-        self.agent1 = RawParser()
-        logger.info("✅ Agent 1 (Parser) ready")
+        logger.info("Initializing 4-Agent Pipeline...")
         
+        self.agent1 = RawParser(parsing_config=self.config.parsing)
         self.agent2 = CandidateExtractor()
-        logger.info("✅ Agent 2 (Extractor) ready")
-        
         self.agent3 = HybridScoringAgent(config=self.config)
-        logger.info("✅ Agent 3 (Scorer) ready")
+        self.agent4 = get_explainer_agent(config=self.config)
+        
+        langchain_mode = getattr(self.config.llm, 'use_langchain', False)
+        logger.info(f"[OK] Agents ready - LangChain: {langchain_mode}")
+        
+        self.stages: Dict[str, PipelineStage] = self._default_stages()
+        self.last_timings: Dict[str, float] = {}
+        self.warmup_timings: Dict[str, float] = {}
+        self.ready = False
+        
+        # CVs seen lately, for idle-time explanation pre-generation
+        self.recent_cvs = RecentCVs(max_entries=self.config.prewarm.max_recent_cvs)
+    
+    def _default_stages(self) -> Dict[str, PipelineStage]:
+        """Build the default stage chain from pipeline configuration"""
+        pipeline_config = self.config.pipeline
+        workers = pipeline_config.workers_for
+        
+        stages = [
+            ParseStage(workers("parse")),
+            ExtractStage(workers("extract")),
+            CandidateFilterStage(
+                workers("candidate_filter"),
+                min_skill_overlap=pipeline_config.candidate_min_skill_overlap
+            ),
+            ScoreStage(workers("score")),
+            DecideStage(workers("decide")),
+            ExplainStage(workers("explain")),
+            PersistStage(workers("persist")),
+        ]
+        return {stage.name: stage for stage in stages}
+    
+    def warm_up(self) -> Dict[str, float]:
+        """
+        Do the one-off work a first request would otherwise pay for
+        
+        Loads the ML model, builds the skill matcher automaton, starts the
+        parse worker processes and starts the background LLM probe (which
+        does not block). Agents also initialize these lazily, so requests
+        served before warm-up still work.
+        
+        Returns:
+            Per-step timings (ms), also kept in `warmup_timings`
+        """
+        steps = [
+            ("ml_model", self.agent3.load_ml_model),
+            ("skill_matcher", self.agent3.skill_registry.matcher),
+        ]
+        if self.agent1.worker_pool is not None:
+            steps.append(("parse_pool", self.agent1.worker_pool.start))
+        start_probe = getattr(self.agent4, "start_probe", None)
+        if start_probe is not None:
+            steps.append(("llm_probe", start_probe))
+        
+        for name, step in steps:
+            start = time.perf_counter()
+            step()
+            self.warmup_timings[name] = round((time.perf_counter() - start) * 1000, 2)
+        
+        self.ready = True
+        logger.info(f"[OK] Pipeline warmed up: {self.warmup_timings}")
+        return self.warmup_timings
+    
+    def replace_stage(self, name: str, stage: PipelineStage) -> None:
+        """Swap in an alternative implementation for a named stage"""
+        if name not in self.stages:
+            raise KeyError(f"Unknown pipeline stage: {name}")
+        self.stages[name] = stage
+    
+    def run(self, ctx: MatchContext) -> MatchContext:
+        """
+        Run every stage over the context, recording per-stage timings (ms)
+        
+        Returns:
+            The same context, with results and timings filled in
+        """
+        for name, stage in self.stages.items():
+            start = time.perf_counter()
+            try:
+                stage.run(self, ctx)
+            except Exception as e:
+                logger.error(f"[ERROR] Pipeline stage '{name}' failed: {e}")
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                STAGE_LATENCY.observe(elapsed, stage=name)
+                ctx.timings[name] = elapsed * 1000
         
-        self.agent4 = get_explainer_agent()
-        logger.info("✅ Agent 4 (Explainer) ready")
+        ctx.timings["total"] = (time.perf_counter() - ctx.started_at) * 1000
+        self.last_timings = dict(ctx.timings)
         
-        logger.info("🎉 Pipeline initialization complete!")
+        # One (sampled) summary line per request instead of per-item logging
+        if should_log_request_summary():
+            logger.info(
+                "[OK] Pipeline complete in %.0fms (%s)",
+                ctx.timings["total"],
+                ", ".join(f"{k}={v:.0f}ms" for k, v in ctx.timings.items() if k != "total"),
+                extra={
+                    "request_id": ctx.request_id,
+                    "jobs": len(ctx.jobs),
+                    "results": len(ctx.results),
+                    "timings_ms": {k: round(v, 2) for k, v in ctx.timings.items()},
+                }
+            )
+        return ctx
     
     def process_cv_for_job(
         self,
         cv_file_path: str,
         job: JobPosting,
-        generate_explanation: bool = True
+        generate_explanation: bool = True,
+        request_id: Optional[str] = None,
+        cv_bytes: Optional[bytes] = None
     ) -> MatchResult:
         """
         Process a single CV against a job posting
         
         Args:
-            cv_file_path: Path to CV file (PDF/DOCX/TXT)
+            cv_file_path: Path to CV file (PDF/DOCX/TXT), or its file name with cv_bytes
             job: Job posting to match against
             generate_explanation: Whether to generate LLM explanation
+            request_id: Correlation ID for the summary log line
+            cv_bytes: CV content already in memory (skips reading from disk)
         
         Returns:
             MatchResult with complete scoring and decision
         """
-        start_time = time.time()
-        
-        try:
-            # Step 1: Parse CV file
-            logger.info(f"📄 Step 1: Parsing {Path(cv_file_path).name}...")
-            result = self.agent1.parse_file(cv_file_path)
-            cv_text = result.get('raw_text', '')
-            
-            if not cv_text or len(cv_text) < 50:
-                raise ValueError("CV parsing failed or file too short")
-            
-            # Step 2: Extract structured data
-            logger.info("🔍 Step 2: Extracting structured data...")
-            extracted_data = self.agent2.extract(cv_text)
-            
-            # Normalize extracted data
-            education = extracted_data.get('education', '')
-            if isinstance(education, list):
-                education = ', '.join(education) if education else None
-            
-            # Build CV profile
-            cv = CVProfile(
-                cv_id=str(uuid.uuid4()),
-                file_name=Path(cv_file_path).name,
-                file_path=cv_file_path,
-                name=extracted_data.get('name'),
-                email=extracted_data.get('email'),
-                phone=extracted_data.get('phone'),
-                skills=extracted_data.get('skills', []),
-                experience_years=extracted_data.get('experience_years'),
-                education=education,
-                raw_text=cv_text,
-                extracted_data=extracted_data
-            )
-            
-            # Step 3: Score match
-            logger.info("🎯 Step 3: Calculating hybrid score...")
-            score_breakdown = self.agent3.score_match(cv, job)
-            
-            # Make decision
-            decision = self._make_decision(score_breakdown)
-            
-            # Step 4: Generate explanation (optional)
-            explanation = None
-            if generate_explanation and self.config.llm.enabled:
-                logger.info("💬 Step 4: Generating LLM explanation...")
-                
-                # Build match result (without explanation first)
-                match_result = self._build_match_result(
-                    cv, job, score_breakdown, decision, None, start_time
-                )
-                
-                explanation = self.agent4.generate_explanation(match_result)
-                
-                # Update decision with explanation
-                decision = MatchDecision(
-                    decision=decision.decision,
-                    confidence=decision.confidence,
-                    reason=decision.reason,
-                    explanation=explanation,
-                    recommendations=decision.recommendations,
-                    red_flags=decision.red_flags,
-                    strengths=decision.strengths
-                )
-            
-            # Build final result
-            match_result = self._build_match_result(
-                cv, job, score_breakdown, decision, explanation, start_time
-            )
-            
-            # Save to database
-            if self.save_to_db and self.db:
-                self.db.save_match(match_result)
-                logger.info(f"💾 Saved to database: {match_result.match_id}")
-            
-            processing_time = (time.time() - start_time) * 1000
-            logger.info(f"✅ Pipeline complete in {processing_time:.0f}ms - Decision: {decision.decision.value.upper()}")
-            
-            return match_result
-            
-        except Exception as e:
-            logger.error(f"❌ Pipeline failed: {e}")
-            raise
+        ctx = MatchContext(
+            cv_file_path=cv_file_path,
+            jobs=[job],
+            cv_bytes=cv_bytes,
+            generate_explanations=generate_explanation,
+            request_id=request_id,
+            filter_candidates=False  # The caller asked for this job; always score it
+        )
+        return self.run(ctx).results[0]
     
     def process_cv_batch(
         self,
         cv_file_path: str,
         jobs: List[JobPosting],
         top_k: int = 10,
-        generate_explanations: bool = True
+        generate_explanations: bool = True,
+        use_llm: bool = True,
+        request_id: Optional[str] = None,
+        cv_bytes: Optional[bytes] = None
     ) -> List[MatchResult]:
         """
         Process one CV against multiple jobs
         
         Args:
-            cv_file_path: Path to CV file
+            cv_file_path: Path to CV file, or its file name with cv_bytes
             jobs: List of job postings
             top_k: Return only top K matches
             generate_explanations: Whether to generate LLM explanations
+            use_llm: False for rule-based explanations only (shared agents
+                are not touched)
+            request_id: Correlation ID for the summary log line
+            cv_bytes: CV content already in memory (skips reading from disk)
         
         Returns:
             List of MatchResults, sorted by score (descending)
         """
-        logger.info(f"📦 Batch processing: 1 CV vs {len(jobs)} jobs")
+        logger.debug("Batch processing: 1 CV vs %d jobs", len(jobs))
         
-        # Parse CV once
-        result = self.agent1.parse_file(cv_file_path)
-        cv_text = result.get('raw_text', '')
-        extracted_data = self.agent2.extract(cv_text)
+        ctx = MatchContext(
+            cv_file_path=cv_file_path,
+            jobs=jobs,
+            cv_bytes=cv_bytes,
+            top_k=top_k,
+            generate_explanations=generate_explanations,
+            use_llm=use_llm,
+            explain_min_score=self.config.pipeline.explain_min_score,
+            request_id=request_id
+        )
+        return self.run(ctx).results
+    
+    def _persisted(self, ctx: MatchContext) -> List[ScoredJob]:
+        """Matches that get a decision and a database row"""
+        if self.config.pipeline.persist_scope == "all":
+            return ctx.scored
+        return ctx.selected
+    
+    def _match_result(self, ctx: MatchContext, item: ScoredJob) -> MatchResult:
+        """The match's MatchResult, built once and shared by the explain and persist stages"""
+        if item.result is None:
+            item.result = self._build_match_result(
+                ctx.cv, item.job, item.score, item.decision,
+                item.explanation, item.elapsed_ms
+            )
+        return item.result
+    
+    def build_cv_profile(self, cv_file_path: str, cv_text: str, extracted_data: Dict) -> CVProfile:
+        """
+        Build a CVProfile from Agent 2 output and remember it as a recent CV
         
+        Args:
+            cv_file_path: Path to the CV file, or its original file name
+            cv_text: Raw text from Agent 1
+            extracted_data: Structured data from Agent 2
+        """
         # Normalize extracted data
         education = extracted_data.get('education', '')
         if isinstance(education, list):
@@ -207,40 +497,15 @@ class MatchingPipeline:
             file_path=cv_file_path,
             name=extracted_data.get('name'),
             email=extracted_data.get('email'),
+            phone=extracted_data.get('phone'),
             skills=extracted_data.get('skills', []),
             experience_years=extracted_data.get('experience_years'),
             education=education,
             raw_text=cv_text,
             extracted_data=extracted_data
         )
-        
-        # Score against all jobs
-        matches = []
-        for job in jobs:
-            start_time = time.time()
-            
-            score_breakdown = self.agent3.score_match(cv, job)
-            decision = self._make_decision(score_breakdown)
-            
-            # Generate explanation only for top candidates
-            explanation = None
-            if generate_explanations and score_breakdown.hybrid_score >= 0.6:
-                match_temp = self._build_match_result(cv, job, score_breakdown, decision, None, start_time)
-                explanation = self.agent4.generate_explanation(match_temp)
-                decision.explanation = explanation
-            
-            match_result = self._build_match_result(cv, job, score_breakdown, decision, explanation, start_time)
-            matches.append(match_result)
-            
-            if self.save_to_db and self.db:
-                self.db.save_match(match_result)
-        
-        # Sort by score and return top K
-        matches.sort(key=lambda m: m.final_score, reverse=True)
-        top_matches = matches[:top_k]
-        
-        logger.info(f"✅ Batch complete: Top {len(top_matches)} matches returned")
-        return top_matches
+        self.recent_cvs.add(cv)
+        return cv
     
     def _make_decision(self, score: ScoreBreakdown) -> MatchDecision:
         """
@@ -316,11 +581,9 @@ class MatchingPipeline:
         score: ScoreBreakdown,
         decision: MatchDecision,
         explanation: Optional[str],
-        start_time: float
+        processing_time_ms: float
     ) -> MatchResult:
         """Build MatchResult from components"""
-        processing_time = (time.time() - start_time) * 1000
-        
         return MatchResult(
             match_id=f"match_{uuid.uuid4().hex[:12]}",
             cv_id=cv.cv_id,
@@ -330,13 +593,8 @@ class MatchingPipeline:
             score_breakdown=score,
             final_score=score.hybrid_score,
             decision=decision,
-            processing_time_ms=processing_time,
-            agent_versions={
-                "agent1": "1.0",
-                "agent2": "1.0",
-                "agent3": "2.0-hybrid",
-                "agent4": "2.0-llm"
-            }
+            processing_time_ms=processing_time_ms,
+            agent_versions=dict(self.AGENT_VERSIONS)
         )
 
 
@@ -0,0 +1,333 @@
+"""
+API Response Payloads
+Precomputed per-job JSON fragments and orjson-backed responses
+
+Every match row repeats the same job details (company, location, skills,
+...). `JobCatalog` builds that fragment once per job when the catalog is
+loaded, so formatting a response only adds the per-match scores. Rows come
+in two shapes:
+
+- full: the fields plus legacy aliases kept for older frontends
+  (`company`, `location`, `job_type`)
+- compact: the same fields without the legacy duplicates
+
+/jobs listings are served from pre-serialized per-job entries. Each
+(skip, limit) page is assembled and compressed once per catalog version
+and tagged with that version for conditional GETs. Filtered listings are
+answered by the catalog's `JobIndex` and assembled from the same entries.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..storage.models import JobPosting, MatchHistory, MatchResult
+from .compression import compress
+from .job_index import JobFilter, JobIndex
+
+# Aliases duplicating company_name, location_city/country and employment_type
+LEGACY_JOB_FIELDS = frozenset({"company", "location", "job_type"})
+
+# Job fields for matches whose job is no longer in the catalog
+MISSING_JOB_FIELDS: Dict[str, Any] = {
+    "company_name": "N/A",
+    "company": "N/A",
+    "location_city": "Unknown",
+    "location_country": "Unknown",
+    "location": "Unknown",
+    "remote_type": "on-site",
+    "employment_type": "full-time",
+    "job_type": "full-time",
+    "seniority_level": "mid",
+    "min_experience_years": 0,
+    "max_experience_years": 0,
+    "description": None,
+    "required_skills": [],
+    "preferred_skills": [],
+    "posted_date": None,
+}
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson
+    
+    Falls back to compact stdlib JSON when orjson is not installed.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_response(content: Any, response: Optional[Response] = None) -> ORJSONResponse:
+    """
+    Serialize content directly, skipping FastAPI's jsonable_encoder pass
+    
+    Args:
+        content: JSON-native payload (dicts, lists, str, numbers, None)
+        response: Injected endpoint Response whose headers (X-Request-ID,
+            X-Profile-ID, ...) are carried over
+    """
+    result = ORJSONResponse(content)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-type"):
+                result.headers[name] = value
+    return result
+
+
+def job_fields(job: JobPosting, compact: bool = False) -> Dict[str, Any]:
+    """Static job details shared by every match row for this job"""
+    fields = {
+        "company_name": job.company_name,
+        "company": job.company_name,
+        "location_city": job.location_city,
+        "location_country": job.location_country,
+        "location": f"{job.location_city}, {job.location_country}",
+        "remote_type": job.remote_type,
+        "employment_type": job.employment_type,
+        "job_type": job.employment_type,
+        "seniority_level": job.seniority_level,
+        "min_experience_years": job.min_experience_years,
+        "max_experience_years": job.max_experience_years,
+        "description": job.description,
+        "required_skills": job.required_skills[:10] if job.required_skills else [],
+        "preferred_skills": job.preferred_skills[:5] if job.preferred_skills else [],
+        "posted_date": job.posted_date,
+    }
+    if compact:
+        return _without_legacy(fields)
+    return fields
+
+
+def _without_legacy(fields: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in fields.items() if key not in LEGACY_JOB_FIELDS}
+
+
+_MISSING_COMPACT = _without_legacy(MISSING_JOB_FIELDS)
+
+
+def listing_entry(job: JobPosting) -> Dict[str, Any]:
+    """One job as listed by /jobs"""
+    return {"job_id": job.job_id, "title": job.title, "job_title": job.title, **job_fields(job)}
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+class JobsPage:
+    """One serialized /jobs page and its compressed variants (built on demand)"""
+    
+    __slots__ = ("body", "_encoded", "_lock")
+    
+    def __init__(self, body: bytes):
+        self.body = body
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+    
+    def encoded(self, encoding: str) -> bytes:
+        """Body compressed for serving many times, cached per encoding"""
+        with self._lock:
+            data = self._encoded.get(encoding)
+            if data is None:
+                data = self._encoded[encoding] = compress(self.body, encoding)
+            return data
+
+
+def match_status(final_score: float) -> str:
+    """Frontend status for a 0-100 score"""
+    if final_score >= 75:
+        return "accepted"  # Shortlist
+    if final_score >= 50:
+        return "review"    # Manual review needed
+    return "rejected"      # Below threshold
+
+
+class JobCatalog:
+    """
+    Loaded jobs indexed by ID, with their precomputed payload fragments
+    
+    `version` is a content hash of the listing: it changes whenever a
+    served job changes and is stable across restarts otherwise.
+    """
+    
+    def __init__(self, jobs: Iterable[JobPosting] = (), max_pages: int = 64):
+        """
+        Args:
+            jobs: Catalog in listing order
+            max_pages: Serialized /jobs pages kept (least recently used evicted)
+        """
+        self.jobs: List[JobPosting] = list(jobs)
+        self._by_id: Dict[str, JobPosting] = {}
+        self._full: Dict[str, Dict[str, Any]] = {}
+        self._compact: Dict[str, Dict[str, Any]] = {}
+        for job in self.jobs:
+            self._by_id.setdefault(job.job_id, job)
+            if job.job_id not in self._full:
+                self._full[job.job_id] = job_fields(job)
+                self._compact[job.job_id] = job_fields(job, compact=True)
+        
+        self._listing: List[bytes] = [dumps(listing_entry(job)) for job in self.jobs]
+        digest = hashlib.blake2b(digest_size=8)
+        for entry in self._listing:
+            digest.update(entry)
+            digest.update(b"\n")
+        self.version = digest.hexdigest()
+        self.etag = f'W/"{self.version}"'
+        
+        self.max_pages = max_pages
+        self._pages: "OrderedDict[Tuple[int, int], JobsPage]" = OrderedDict()
+        self._pages_lock = threading.Lock()
+        self._index: Optional[JobIndex] = None
+    
+    def __len__(self) -> int:
+        return len(self.jobs)
+    
+    @property
+    def index(self) -> JobIndex:
+        """Search index, built on first use (or warmed by the loader)"""
+        if self._index is None:
+            self._index = JobIndex(self.jobs)
+        return self._index
+    
+    def get(self, job_id: str) -> Optional[JobPosting]:
+        """Job by ID (first occurrence), or None"""
+        return self._by_id.get(job_id)
+    
+    def fields(self, job_id: str, compact: bool = False) -> Dict[str, Any]:
+        """Precomputed job fragment (shared; do not mutate)"""
+        if compact:
+            return self._compact.get(job_id, _MISSING_COMPACT)
+        return self._full.get(job_id, MISSING_JOB_FIELDS)
+    
+    def page(self, skip: int, limit: int) -> JobsPage:
+        """
+        Serialized /jobs page, assembled from pre-serialized entries
+        
+        Args:
+            skip: Jobs to skip
+            limit: Max jobs in the page
+        """
+        key = (skip, limit)
+        with self._pages_lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                return page
+        
+        page = JobsPage(self._listing_body(len(self.jobs), skip, limit, self._listing[skip:skip + limit]))
+        
+        with self._pages_lock:
+            page = self._pages.setdefault(key, page)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return page
+    
+    def search(self, query: JobFilter, skip: int, limit: int) -> bytes:
+        """
+        Serialized /jobs page of the jobs matching a filter
+        
+        `total` is the number of matching jobs.
+        """
+        total, page = self.index.search(query, skip, limit)
+        listing = self._listing
+        return self._listing_body(total, skip, limit, [listing[i] for i in page])
+    
+    @staticmethod
+    def _listing_body(total: int, skip: int, limit: int, entries: List[bytes]) -> bytes:
+        header = dumps({"total": total, "skip": skip, "limit": limit, "count": len(entries)})
+        return header[:-1] + b',"jobs":[' + b",".join(entries) + b"]}"
+    
+    def match_rows(
+        self,
+        matches: List[MatchResult],
+        cv_filename: str,
+        explain: bool = False,
+        compact: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Format pipeline results for the /match response
+        
+        Args:
+            matches: Ranked match results
+            cv_filename: Uploaded file name, echoed per row
+            explain: Include explanations when present
+            compact: Omit legacy duplicate fields
+        """
+        timestamp = datetime.now().isoformat()
+        rows = []
+        for match in matches:
+            score = match.score_breakdown
+            final_score = round(score.hybrid_score * 100, 1)
+            row = {
+                "match_id": match.match_id,
+                "job_id": match.job_id,
+                "job_title": match.job_title,
+                **self.fields(match.job_id, compact),
+                "candidate_name": match.candidate_name,
+                "cv_filename": cv_filename,
+                "final_score": final_score,
+                "parser_score": round(score.rule_based_score * 100, 1),
+                "matcher_score": round(score.skill_score * 100, 1),
+                "scorer_score": round(score.experience_score * 100, 1),
+                "status": match_status(final_score),
+                "timestamp": timestamp,
+            }
+            if explain and match.decision.explanation:
+                row["explanation"] = match.decision.explanation
+            rows.append(row)
+        return rows
+    
+    def history_rows(self, records: List[MatchHistory], compact: bool = False) -> List[Dict[str, Any]]:
+        """Format stored matches for the /match/history response"""
+        rows = []
+        for m in records:
+            final_score = round(m.final_score * 100, 1)
+            rows.append({
+                "match_id": m.match_id,
+                "job_id": m.job_id,
+                "job_title": m.job_title,
+                **self.fields(m.job_id, compact),
+                "candidate_name": m.candidate_name,
+                "cv_filename": m.cv_id,  # cv_id as filename fallback
+                "final_score": final_score,
+                "parser_score": round(m.rule_based_score * 100, 1),
+                "matcher_score": round(m.skill_score * 100, 1),
+                "scorer_score": round(m.experience_score * 100, 1),
+                "status": match_status(final_score),
+                "explanation": m.explanation,
+                "timestamp": m.created_at.isoformat(),
+            })
+        return rows
@@ -0,0 +1,213 @@
+"""
+Idle-Time Explanation Pre-generation
+Explain the top jobs of recently seen CVs before anyone asks
+
+`RecentCVs` keeps the profiles of the last CVs uploaded or matched. While
+the API is idle, `ExplanationPrewarmer` scores each of them against the
+catalog and asks Agent 4 for explanations of their top-N jobs, which land in
+the explanation cache; a later /match/single for one of those pairs builds
+the same prompt and is answered from the cache.
+
+Work only runs when all of these hold:
+- no matching request is in flight (`busy()` is False)
+- the load average per CPU is at most `max_load`
+- the LLM is reachable and its circuit breaker is closed
+- fewer than `budget_per_hour` explanations were generated in the last hour
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Set
+
+from ..storage.models import CVProfile, JobPosting, MatchResult
+from .circuit_breaker import CLOSED
+from .config import PrewarmConfig
+
+logger = logging.getLogger(__name__)
+
+
+def cv_digest(cv: CVProfile) -> str:
+    """Content key of a CV (same text = same candidate)"""
+    return hashlib.blake2b((cv.raw_text or cv.cv_id).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class RecentCVs:
+    """Most recently seen CV profiles, newest first, one entry per CV text"""
+    
+    def __init__(self, max_entries: int = 50):
+        self.max_entries = max_entries
+        self._profiles: "OrderedDict[str, CVProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def add(self, cv: CVProfile) -> None:
+        key = cv_digest(cv)
+        with self._lock:
+            self._profiles[key] = cv
+            self._profiles.move_to_end(key)
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+    
+    def snapshot(self) -> List[CVProfile]:
+        """Profiles, newest first"""
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+    
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+
+class ExplanationPrewarmer:
+    """
+    Background worker pre-generating explanations for recent CVs
+    
+    Example:
+        prewarmer = ExplanationPrewarmer(pipeline, lambda: jobs, config.prewarm, version=lambda: catalog.version)
+        prewarmer.start()
+    """
+    
+    def __init__(
+        self,
+        pipeline,
+        jobs: Callable[[], List[JobPosting]],
+        config: Optional[PrewarmConfig] = None,
+        version: Optional[Callable[[], str]] = None,
+        busy: Callable[[], bool] = lambda: False,
+        load: Optional[Callable[[], float]] = None
+    ):
+        """
+        Args:
+            pipeline: MatchingPipeline whose agents score and explain
+            jobs: Current job catalog
+            config: Throttling settings (defaults: PrewarmConfig())
+            version: Content version of the catalog (e.g. JobCatalog.version);
+                default: the tuple of job IDs
+            busy: True while requests are being served
+            load: Load average per CPU (default: os.getloadavg, 0 where
+                unavailable)
+        """
+        self.pipeline = pipeline
+        self.jobs = jobs
+        self.version = version or (lambda: tuple(job.job_id for job in self.jobs()))
+        self.config = config or PrewarmConfig()
+        self.busy = busy
+        self.load = load or _load_per_cpu
+        self.generated = 0
+        self._spent: Deque[float] = deque()  # Generation times in the last hour
+        self._done: Set[str] = set()         # CVs whose top-N are all cached
+        self._catalog = None  # Version of the catalog _done refers to
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="explanation-prewarm", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout=5)
+    
+    def stats(self) -> Dict:
+        """Worker state for /health"""
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "generated": self.generated,
+            "budget_left": self._budget_left(),
+            "cvs_done": len(self._done),
+        }
+    
+    def _loop(self) -> None:
+        while not self._stop.wait(self.config.interval_seconds):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"[WARN] Explanation pre-generation failed: {e}")
+    
+    def run_once(self) -> int:
+        """
+        One pass over the recent CVs, newest first
+        
+        Returns:
+            Explanations generated
+        """
+        agent = self.pipeline.agent4
+        if getattr(agent, "cache", None) is None:
+            return 0  # Nowhere to keep the results
+        
+        jobs, version = self.jobs(), self.version()
+        if version != self._catalog:
+            self._catalog = version
+            self._done.clear()
+        
+        generated = 0
+        for cv in self.pipeline.recent_cvs.snapshot():
+            if not jobs or not self._can_run():
+                break
+            key = cv_digest(cv)
+            if key in self._done:
+                continue
+            
+            drafts = self._top_matches(cv, jobs)
+            pending = [draft for draft in drafts if not agent.is_cached(draft)]
+            batch = pending[:self._budget_left()]
+            if batch:
+                agent.generate_explanations(batch)
+                now = time.monotonic()
+                self._spent.extend([now] * len(batch))
+                generated += len(batch)
+            if len(batch) == len(pending):
+                self._done.add(key)
+        
+        self.generated += generated
+        if generated:
+            logger.info(f"[OK] Pre-generated {generated} explanations")
+        return generated
+    
+    def _top_matches(self, cv: CVProfile, jobs: List[JobPosting]) -> List[MatchResult]:
+        """Draft results for the CV's top-N jobs, built as the explain stage builds them"""
+        from .orchestrator import MatchContext
+        
+        pipeline = self.pipeline
+        ctx = MatchContext(cv_file_path=cv.file_path or cv.file_name, jobs=jobs, top_k=self.config.top_n)
+        ctx.cv, ctx.cv_text = cv, cv.raw_text or ""
+        for name in ("candidate_filter", "score"):
+            pipeline.stages[name].run(pipeline, ctx)
+        
+        drafts = []
+        for item in ctx.selected:
+            if item.record.hybrid_score < self.config.min_score:
+                continue
+            decision = pipeline._make_decision(item.score)
+            drafts.append(pipeline._build_match_result(cv, item.job, item.score, decision, None, item.elapsed_ms))
+        return drafts
+    
+    def _can_run(self) -> bool:
+        agent = self.pipeline.agent4
+        breaker = getattr(agent, "breaker", None)
+        return (
+            not self._stop.is_set()
+            and not self.busy()
+            and self.load() <= self.config.max_load
+            and agent.llm_available
+            and (breaker is None or breaker.state == CLOSED)
+            and self._budget_left() > 0
+        )
+    
+    def _budget_left(self) -> int:
+        cutoff = time.monotonic() - 3600
+        while self._spent and self._spent[0] < cutoff:
+            self._spent.popleft()
+        return max(0, self.config.budget_per_hour - len(self._spent))
+
+
+def _load_per_cpu() -> float:
+    if not hasattr(os, "getloadavg"):
+        return 0.0
+    return os.getloadavg()[0] / (os.cpu_count() or 1)
@@ -0,0 +1,171 @@
+"""
+Request-scoped Profiling for Recruiter-Pro-AI
+Opt-in cProfile capture of individual matching requests
+
+A request is profiled when it asks for it (X-Profile header) or when the
+admin toggle is on. Each capture is written to `data/profiles/` as:
+- <request_id>.pstats : binary stats (`python -m pstats`, snakeviz, ...)
+- <request_id>.txt    : top functions by cumulative time
+
+Only one request is profiled at a time (cProfile is process-global in
+practice); concurrent requests simply run unprofiled. The oldest captures
+are pruned once `max_profiles` is exceeded.
+"""
+import cProfile
+import io
+import logging
+import pstats
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .config import PROJECT_ROOT, get_config
+
+logger = logging.getLogger(__name__)
+
+# Request IDs become file names: keep them boring
+_PROFILE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_\-]{1,64}$")
+
+PROFILE_FORMATS = {
+    "pstats": ".pstats",
+    "txt": ".txt",
+}
+
+
+class ProfileStore:
+    """Captures, stores and lists request profiles"""
+    
+    def __init__(
+        self,
+        output_dir: str = "data/profiles",
+        max_profiles: int = 20,
+        enabled: bool = False,
+        summary_lines: int = 40
+    ):
+        """
+        Args:
+            output_dir: Directory for captured profiles (relative to project root)
+            max_profiles: Number of captures to retain
+            enabled: Admin toggle - profile every request while True
+            summary_lines: Functions listed in the text summary
+        """
+        path = Path(output_dir)
+        self.output_dir = path if path.is_absolute() else PROJECT_ROOT / path
+        self.max_profiles = max_profiles
+        self.enabled = enabled
+        self.summary_lines = summary_lines
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def is_valid_id(profile_id: str) -> bool:
+        """Check a profile/request ID is safe to use as a file name"""
+        return bool(profile_id) and bool(_PROFILE_ID_PATTERN.match(profile_id))
+    
+    @contextmanager
+    def profile(self, request_id: str, requested: bool = False):
+        """
+        Profile the enclosed block if requested or globally enabled
+        
+        Yields:
+            The request ID when a capture is running, otherwise None
+        """
+        if not (requested or self.enabled) or not self.is_valid_id(request_id):
+            yield None
+            return
+        
+        # Another request is already being profiled - run this one plain
+        if not self._lock.acquire(blocking=False):
+            yield None
+            return
+        
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                yield request_id
+            finally:
+                profiler.disable()
+        finally:
+            self._lock.release()
+            self._save(profiler, request_id)
+    
+    def _save(self, profiler: cProfile.Profile, request_id: str) -> None:
+        """Write pstats and text summary, then enforce retention"""
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(self.output_dir / f"{request_id}.pstats"))
+            
+            buffer = io.StringIO()
+            stats = pstats.Stats(profiler, stream=buffer)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.summary_lines)
+            (self.output_dir / f"{request_id}.txt").write_text(buffer.getvalue(), encoding="utf-8")
+            
+            logger.info(f"Saved profile {request_id} to {self.output_dir}")
+            self._prune()
+        except Exception as e:
+            logger.warning(f"Failed to save profile {request_id}: {e}")
+    
+    def _prune(self) -> None:
+        """Delete the oldest captures beyond max_profiles"""
+        captures = sorted(
+            self.output_dir.glob("*.pstats"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True
+        )
+        for stale in captures[self.max_profiles:]:
+            for suffix in PROFILE_FORMATS.values():
+                stale.with_suffix(suffix).unlink(missing_ok=True)
+    
+    def list_profiles(self) -> List[Dict]:
+        """List retained captures, newest first"""
+        if not self.output_dir.exists():
+            return []
+        
+        captures = sorted(
+            self.output_dir.glob("*.pstats"),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True
+        )
+        return [
+            {
+                "profile_id": path.stem,
+                "size_bytes": path.stat().st_size,
+                "created_at": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
+                "formats": [
+                    fmt for fmt, suffix in PROFILE_FORMATS.items()
+                    if path.with_suffix(suffix).exists()
+                ]
+            }
+            for path in captures
+        ]
+    
+    def get_profile_path(self, profile_id: str, fmt: str = "pstats") -> Optional[Path]:
+        """Resolve a stored capture to its file, or None if unknown"""
+        if not self.is_valid_id(profile_id) or fmt not in PROFILE_FORMATS:
+            return None
+        
+        path = self.output_dir / f"{profile_id}{PROFILE_FORMATS[fmt]}"
+        return path if path.exists() else None
+
+
+# Singleton instance
+_profile_store: Optional[ProfileStore] = None
+
+
+def get_profile_store(reload: bool = False) -> ProfileStore:
+    """Get profile store singleton (configured from ProfilingConfig)"""
+    global _profile_store
+    
+    if _profile_store is None or reload:
+        profiling_config = get_config().profiling
+        _profile_store = ProfileStore(
+            output_dir=profiling_config.output_dir,
+            max_profiles=profiling_config.max_profiles,
+            enabled=profiling_config.enabled,
+            summary_lines=profiling_config.summary_lines
+        )
+    
+    return _profile_store
@@ -0,0 +1,443 @@
+"""
+Canonical Skill Registry for Recruiter-Pro-AI
+One compiled view of every skill vocabulary, shared by all agents
+
+Each distinct skill gets an integer ID. Aliases, synonyms and spelling
+variants ("JS", "node js", "Node.js") resolve to that ID through one hash
+map, so normalization is a dictionary lookup instead of a scan.
+
+Sources, merged in order (earlier entries win on conflicts):
+1. data/dictionaries/skills_canonical.json: {category: {Canonical: [aliases]}}
+2. SKILL_SYNONYMS: extra alias → canonical spellings
+3. SKILL_VOCABULARY: terms Agent 2 looks for in CV text, by category
+4. utils.skill_extraction: the resume-parsing vocabulary (technical, soft
+   and domain skills) and its abbreviations
+5. SKILL_FAMILIES: related skills (parent → children) that satisfy each
+   other when matching, e.g. a "sql" requirement and a "mysql" CV
+
+Skills not known to any source are interned on first sight (category
+"other"), so job skills from any catalog get stable IDs too, up to
+`max_adhoc_skills`; past that cap unknown spellings are left out of ID sets
+rather than growing the registry forever. `intern()`
+memoizes raw spellings in an LRU cache (hits/misses in
+recruiter_cache_events_total{cache="skill_normalizer"}), and canonical
+names are `sys.intern`ed so equal skills share one string object.
+"""
+import json
+import logging
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .config import PROJECT_ROOT, get_config
+from .metrics import CACHE_EVENTS
+from ..utils.skill_extraction import DOMAIN_SKILLS, SKILL_VARIATIONS, SOFT_SKILLS, TECHNICAL_SKILLS
+from ..utils.skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+# Terms Agent 2 extracts from CV text, grouped by category
+SKILL_VOCABULARY = {
+    "programming_languages": [
+        'python', 'java', 'javascript', 'js', 'typescript', 'ts', 'c++', 'cpp',
+        'c#', 'csharp', 'ruby', 'php', 'swift', 'kotlin', 'go', 'golang', 'rust',
+        'scala', 'r', 'perl', 'shell', 'bash', 'powershell', 'vba',
+    ],
+    "web_frontend": [
+        'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'react', 'reactjs',
+        'angular', 'angularjs', 'vue', 'vuejs', 'svelte', 'jquery', 'bootstrap',
+        'tailwind', 'webpack', 'vite', 'nextjs', 'gatsby', 'redux', 'mobx',
+    ],
+    "web_backend": [
+        'nodejs', 'node.js', 'node', 'express', 'expressjs', 'django', 'flask',
+        'fastapi', 'spring', 'springboot', 'asp.net', 'laravel', 'rails', 'nestjs',
+    ],
+    "databases": [
+        'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'mongo', 'redis',
+        'oracle', 'sqlite', 'dynamodb', 'cassandra', 'couchdb', 'elasticsearch',
+        'neo4j', 'mariadb', 'mssql', 'sqlserver', 'firebase',
+    ],
+    "cloud_devops": [
+        'aws', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes', 'k8s',
+        'jenkins', 'terraform', 'ansible', 'git', 'github', 'gitlab', 'bitbucket',
+        'linux', 'unix', 'ubuntu', 'centos', 'debian', 'ci/cd', 'cicd',
+    ],
+    "data_science": [
+        'pandas', 'numpy', 'scipy', 'matplotlib', 'seaborn', 'tensorflow',
+        'pytorch', 'keras', 'scikit-learn', 'sklearn', 'machine learning', 'ml',
+        'deep learning', 'ai', 'artificial intelligence', 'data science',
+        'big data', 'hadoop', 'spark', 'pyspark', 'airflow', 'kafka',
+    ],
+    "mobile": ['android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic'],
+    "testing": [
+        'selenium', 'pytest', 'junit', 'jest', 'mocha', 'chai', 'cypress',
+        'testing', 'unit testing', 'integration testing', 'tdd', 'bdd',
+    ],
+    "design": [
+        'photoshop', 'illustrator', 'figma', 'sketch', 'adobe xd', 'indesign',
+        'ui/ux', 'ui', 'ux', 'design', 'graphic design', 'web design',
+    ],
+    "soft_skills": [
+        'communication', 'leadership', 'management', 'teamwork', 'collaboration',
+        'problem solving', 'analytical', 'critical thinking', 'agile', 'scrum',
+        'project management', 'time management', 'presentation',
+    ],
+    "other_technical": [
+        'rest', 'restful', 'api', 'graphql', 'soap', 'microservices',
+        'websocket', 'json', 'xml', 'yaml', 'oauth', 'jwt', 'saml',
+    ],
+}
+
+# Alias → canonical spelling (beyond skills_canonical.json)
+SKILL_SYNONYMS = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'nodejs': 'node.js',
+    'node': 'node.js',
+    'reactjs': 'react',
+    'vuejs': 'vue',
+    'angularjs': 'angular',
+    'mongo': 'mongodb',
+    'postgres': 'postgresql',
+    'k8s': 'kubernetes',
+    'sklearn': 'scikit-learn',
+    'cpp': 'c++',
+    'csharp': 'c#',
+    'golang': 'go',
+    'mssql': 'sql server',
+    'sqlserver': 'sql server',
+    'cicd': 'ci/cd',
+    'restful': 'rest',
+    'springboot': 'spring',
+}
+
+# Related skills: a parent and its children (and siblings) satisfy each other
+# when matching. Children that are plain aliases of the parent collapse into it.
+SKILL_FAMILIES = {
+    'javascript': ['js', 'es6', 'es2015', 'ecmascript'],
+    'python': ['py', 'python3', 'python2'],
+    'java': ['jdk', 'jre', 'java8', 'java11', 'java17'],
+    'csharp': ['c#', 'cs', 'dotnet', '.net', 'net', 'asp.net', 'aspnet'],
+    'cpp': ['c++', 'cplusplus'],
+    'sql': ['mysql', 'postgresql', 'mssql', 'tsql', 'plsql', 'ms sql', 'microsoft sql'],
+    'react': ['reactjs', 'react.js'],
+    'angular': ['angularjs', 'angular.js'],
+    'vue': ['vuejs', 'vue.js'],
+    'node': ['nodejs', 'node.js'],
+    'docker': ['containerization', 'containers'],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services', 'amazon cloud'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'azure': ['microsoft azure', 'azure cloud'],
+    'machine learning': ['ml', 'machinelearning'],
+    'deep learning': ['dl', 'deeplearning', 'neural networks'],
+    'artificial intelligence': ['ai'],
+    'devops': ['dev ops', 'devsecops'],
+    'cicd': ['ci/cd', 'ci-cd', 'continuous integration', 'continuous deployment'],
+    'api': ['rest api', 'restful', 'rest', 'graphql'],
+    'html': ['html5'],
+    'css': ['css3', 'scss', 'sass'],
+    'typescript': ['ts'],
+    'mongodb': ['mongo'],
+    'postgresql': ['postgres'],
+    'jenkins': ['ci'],
+    'git': ['github', 'gitlab', 'version control'],
+    'agile': ['scrum', 'kanban'],
+    'flask': ['python flask'],
+    'fastapi': ['fast api'],
+    'django': ['python django'],
+    'spring': ['spring boot', 'springboot'],
+    'llm': ['large language model', 'gpt', 'generative ai', 'genai'],
+    'nlp': ['natural language processing', 'text processing'],
+    'rag': ['retrieval augmented generation'],
+    'langchain': ['lang chain'],
+    'tensorflow': ['tf'],
+    'pytorch': ['torch'],
+    'scikit': ['sklearn', 'scikit-learn'],
+}
+
+# Names/aliases (outside Agent 2's vocabulary) too short or too common as
+# plain words to be matched in free text (e.g. "cv" for Computer Vision,
+# "education" for the section header)
+MIN_ALIAS_LENGTH = 3
+AMBIGUOUS_ALIASES = {"next", "chef", "torch", "lambda", "education"}
+
+# Raw spellings remembered by SkillRegistry.intern()
+NORMALIZER_CACHE_SIZE = 8192
+
+# Unknown skills SkillRegistry.intern() registers on first sight
+MAX_ADHOC_SKILLS = 20_000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def skill_key(skill: str) -> str:
+    """Lookup key: lower-case, trimmed, single spaces"""
+    return _WHITESPACE_RE.sub(" ", skill.lower().strip())
+
+
+def _compact_key(key: str) -> str:
+    """Punctuation-insensitive variant ("node.js" → "nodejs", "scikit-learn" → "scikit learn")"""
+    return key.replace('.', '').replace('-', ' ')
+
+
+@dataclass
+class SkillInfo:
+    """One canonical skill"""
+    id: int
+    name: str  # Canonical lower-case name
+    display: str
+    category: str = "other"
+    parent: Optional[int] = None
+
+
+class SkillRegistry:
+    """
+    Skill IDs, alias map, categories and families
+    
+    Lookups accept any spelling; `intern()` assigns an ID to unknown skills
+    (None once `max_adhoc_skills` of them have been registered).
+    """
+    
+    def __init__(self, cache_size: int = NORMALIZER_CACHE_SIZE, max_adhoc_skills: int = MAX_ADHOC_SKILLS):
+        self.skills: List[SkillInfo] = []
+        self.max_adhoc_skills = max_adhoc_skills
+        self._adhoc_count = 0
+        self._ids: Dict[str, int] = {}
+        self._extractable: Dict[str, int] = {}  # Terms safe to find in free text
+        self._matcher: Optional[SkillMatcher] = None
+        self._lock = threading.Lock()
+        
+        # LRU memo: raw spelling → ID
+        self.cache_size = cache_size
+        self._memo: "OrderedDict[str, int]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+    
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    
+    def add_skill(self, name: str, category: str = "other", display: Optional[str] = None) -> int:
+        """Register a canonical skill (returns the existing ID if known)"""
+        key = skill_key(name)
+        skill_id = self.id_of(key)
+        if skill_id is not None:
+            return skill_id
+        
+        with self._lock:
+            if key in self._ids:  # Registered by another thread meanwhile
+                return self._ids[key]
+            skill_id = len(self.skills)
+            self.skills.append(SkillInfo(skill_id, sys.intern(key), display or name, category))
+            self._ids[key] = skill_id
+            self._ids.setdefault(_compact_key(key), skill_id)
+        return skill_id
+    
+    def add_alias(self, alias: str, skill_id: int, extractable: bool = False) -> None:
+        """Map an alias to a skill (existing mappings are kept)"""
+        key = skill_key(alias)
+        if not key:
+            return
+        self._ids.setdefault(key, skill_id)
+        self._ids.setdefault(_compact_key(key), skill_id)
+        if extractable:
+            self._extractable.setdefault(key, self._ids[key])
+            self._matcher = None
+    
+    def set_parent(self, skill_id: int, parent_id: int) -> None:
+        """Place a skill in a family (first parent wins; no cycles)"""
+        skill = self.skills[skill_id]
+        if skill_id == parent_id or skill.parent is not None:
+            return
+        if self.family(parent_id) == skill_id:
+            return
+        skill.parent = parent_id
+    
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    
+    def id_of(self, skill: str) -> Optional[int]:
+        """ID for any known spelling, else None"""
+        key = skill_key(skill)
+        skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._ids.get(_compact_key(key))
+        return skill_id
+    
+    def intern(self, skill: str) -> Optional[int]:
+        """
+        ID for a skill, registering unknown skills (LRU-memoized)
+        
+        Returns None for an unknown skill once `max_adhoc_skills` have been
+        registered; such skills are skipped by `intern_all()`.
+        """
+        with self._memo_lock:
+            skill_id = self._memo.get(skill)
+            if skill_id is not None:
+                self._memo.move_to_end(skill)
+        if skill_id is not None:
+            CACHE_EVENTS.inc(cache="skill_normalizer", result="hit")
+            return skill_id
+        
+        CACHE_EVENTS.inc(cache="skill_normalizer", result="miss")
+        skill_id = self.id_of(skill)
+        if skill_id is None:
+            skill_id = self._add_adhoc(skill)
+            if skill_id is None:
+                return None
+        
+        with self._memo_lock:
+            self._memo[skill] = skill_id
+            if len(self._memo) > self.cache_size:
+                self._memo.popitem(last=False)
+        return skill_id
+    
+    def _add_adhoc(self, skill: str) -> Optional[int]:
+        """Register an unknown skill, within the ad-hoc cap"""
+        with self._lock:
+            if self._adhoc_count >= self.max_adhoc_skills:
+                if self._adhoc_count == self.max_adhoc_skills:
+                    logger.warning(f"[WARN] {self.max_adhoc_skills} unknown skills registered; ignoring new ones")
+                    self._adhoc_count += 1  # Warn once
+                return None
+            self._adhoc_count += 1
+        return self.add_skill(skill)
+    
+    def intern_all(self, skills: Iterable[str]) -> Set[int]:
+        """IDs for a list of skills (blank entries and skills past the ad-hoc cap skipped)"""
+        ids = {self.intern(skill) for skill in skills if skill and skill.strip()}
+        ids.discard(None)
+        return ids
+    
+    def name(self, skill_id: int) -> str:
+        return self.skills[skill_id].name
+    
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        """Canonical names, sorted"""
+        return sorted(self.skills[skill_id].name for skill_id in skill_ids)
+    
+    def canonical(self, skill: str) -> str:
+        """Canonical name (interned string); unknown skills get their normalized spelling"""
+        skill_id = self.intern(skill)
+        return self.skills[skill_id].name if skill_id is not None else sys.intern(skill_key(skill))
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """Normalizer memo size and process-wide hit rate"""
+        hits = CACHE_EVENTS.get(cache="skill_normalizer", result="hit")
+        misses = CACHE_EVENTS.get(cache="skill_normalizer", result="miss")
+        return {
+            "size": len(self._memo),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0
+        }
+    
+    def category(self, skill: str) -> str:
+        skill_id = self.id_of(skill)
+        return self.skills[skill_id].category if skill_id is not None else "other"
+    
+    def family(self, skill_id: int) -> int:
+        """Root of the skill's family (the skill itself if it has no parent)"""
+        parent = self.skills[skill_id].parent
+        while parent is not None:
+            skill_id, parent = parent, self.skills[parent].parent
+        return skill_id
+    
+    def matcher(self) -> SkillMatcher:
+        """Automaton over the extractable terms, reporting canonical names"""
+        if self._matcher is None:
+            self._matcher = SkillMatcher({
+                term: self.skills[skill_id].name for term, skill_id in self._extractable.items()
+            })
+        return self._matcher
+    
+    def __len__(self) -> int:
+        return len(self.skills)
+    
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def build(
+        cls,
+        canonical_path: Optional[Path] = None,
+        cache_size: int = NORMALIZER_CACHE_SIZE,
+        max_adhoc_skills: int = MAX_ADHOC_SKILLS
+    ) -> "SkillRegistry":
+        """Merge skills_canonical.json with the built-in tables"""
+        registry = cls(cache_size, max_adhoc_skills)
+        canonical = cls._load_canonical(canonical_path) if canonical_path else {}
+        
+        def extractable(term: str) -> bool:
+            return len(term) >= MIN_ALIAS_LENGTH and term not in AMBIGUOUS_ALIASES
+        
+        # 1. Canonical names first, so they win over other entries' aliases
+        for category, skills in canonical.items():
+            for display in skills:
+                skill_id = registry.add_skill(display, category, display)
+                registry.add_alias(display, skill_id, extractable(skill_key(display)))
+        for category, skills in canonical.items():
+            for display, aliases in skills.items():
+                skill_id = registry.id_of(display)
+                for alias in aliases:
+                    registry.add_alias(alias, skill_id, extractable(skill_key(alias)))
+        
+        # 2-3. Agent 2 vocabulary and its synonyms
+        categories = {term: category for category, terms in SKILL_VOCABULARY.items() for term in terms}
+        for alias, target in SKILL_SYNONYMS.items():
+            target_id = registry.add_skill(target, categories.get(target, "other"))
+            registry.add_alias(alias, target_id)
+        for term, category in categories.items():
+            registry.add_alias(term, registry.add_skill(term, category), extractable=True)
+        
+        # 4. Resume-parsing vocabulary and abbreviations
+        for category, terms in (("technical", TECHNICAL_SKILLS), ("soft", SOFT_SKILLS), ("domain", DOMAIN_SKILLS)):
+            for term in sorted(terms):
+                registry.add_alias(term, registry.add_skill(term, category), extractable(term))
+        for alias, target in SKILL_VARIATIONS.items():
+            registry.add_alias(alias, registry.add_skill(target), extractable(alias))
+        
+        # 5. Families
+        for parent, children in SKILL_FAMILIES.items():
+            parent_id = registry.add_skill(parent)
+            for child in children:
+                registry.set_parent(registry.add_skill(child), parent_id)
+        
+        return registry
+    
+    @staticmethod
+    def _load_canonical(path: Path) -> Dict[str, Dict[str, List[str]]]:
+        """{category: {Canonical: [aliases]}} from skills_canonical.json"""
+        if not path.exists():
+            logger.warning(f"Skills database not found: {path}")
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load skills database: {e}")
+            return {}
+        # Skip non-category entries such as "comment"
+        return {category: skills for category, skills in data.items() if isinstance(skills, dict)}
+
+
+# Singleton instance
+_skill_registry: Optional[SkillRegistry] = None
+
+
+def get_skill_registry(reload: bool = False) -> SkillRegistry:
+    """Get the shared skill registry (built on first use)"""
+    global _skill_registry
+    
+    if _skill_registry is None or reload:
+        path = Path(get_config().skills_database_path)
+        _skill_registry = SkillRegistry.build(path if path.is_absolute() else PROJECT_ROOT / path)
+        logger.debug("Skill registry built: %d skills", len(_skill_registry))
+    
+    return _skill_registry
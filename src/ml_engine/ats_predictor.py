@@ -5,14 +5,15 @@ Loads trained model and provides clean prediction interface.
 """
 
 import os
-import joblib
 import json
-import pandas as pd
-import numpy as np
-from typing import Dict, Union, List
+from typing import TYPE_CHECKING, Dict, Union, List
 import logging
 
-logging.basicConfig(level=logging.INFO)
+# pandas/joblib/numpy (and the sklearn/xgboost modules a model unpickles)
+# are imported when a model is loaded, not when this module is imported
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,7 +39,7 @@ class ATSPredictor:
         self.feature_engineer = None
         self.metadata = None
         self.optimal_threshold = 0.5
-        
+    
     def load_model(self) -> bool:
         """
         Load trained model and artifacts.
@@ -53,6 +54,7 @@ class ATSPredictor:
                 logger.error(f"Model not found at {model_path}")
                 return False
             
+            import joblib
             self.model = joblib.load(model_path)
             logger.info(f"✅ Loaded model from {model_path}")
             
@@ -76,14 +78,14 @@ class ATSPredictor:
                 logger.warning(f"Metadata not found at {metadata_path}. Using default threshold.")
             
             return True
-            
+        
         except Exception as e:
             logger.error(f"Error loading model: {e}")
             return False
     
     def predict(
         self, 
-        cv_data: Union[Dict, pd.DataFrame],
+        cv_data: Union[Dict, "pd.DataFrame"],
         use_optimal_threshold: bool = True
     ) -> Dict:
         """
@@ -92,12 +94,13 @@ class ATSPredictor:
         Args:
             cv_data: Resume data (dict or DataFrame)
             use_optimal_threshold: Use optimal threshold for classification
-            
+        
         Returns:
             Dictionary with prediction, probability, score, and risk level
         """
         if self.model is None or self.feature_engineer is None:
             raise RuntimeError("Model not loaded. Call load_model() first.")
+        import pandas as pd
         
         # Convert to DataFrame if dict
         if isinstance(cv_data, dict):
@@ -146,7 +149,7 @@ class ATSPredictor:
     
     def predict_batch(
         self,
-        cv_data_list: Union[List[Dict], pd.DataFrame],
+        cv_data_list: Union[List[Dict], "pd.DataFrame"],
         use_optimal_threshold: bool = True
     ) -> List[Dict]:
         """
@@ -155,11 +158,12 @@ class ATSPredictor:
         Args:
             cv_data_list: List of resume dicts or DataFrame
             use_optimal_threshold: Use optimal threshold for classification
-            
+        
         Returns:
             List of prediction dictionaries
         """
         if isinstance(cv_data_list, list):
+            import pandas as pd
             cv_df = pd.DataFrame(cv_data_list)
         else:
             cv_df = cv_data_list
@@ -178,7 +182,7 @@ class ATSPredictor:
         
         Args:
             top_n: Number of top features to return
-            
+        
         Returns:
             Dictionary of feature names and importance scores
         """
@@ -197,6 +201,7 @@ class ATSPredictor:
             importances = classifier.feature_importances_
         elif hasattr(classifier, 'coef_'):
             # Linear models (LR)
+            import numpy as np
             importances = np.abs(classifier.coef_[0])
         else:
             logger.warning("Model does not have feature importances")
@@ -239,14 +244,14 @@ class ATSPredictor:
 
 
 # Convenience function for quick predictions
-def predict_resume(cv_data: Union[Dict, pd.DataFrame], model_dir: str = "models/production") -> Dict:
+def predict_resume(cv_data: Union[Dict, "pd.DataFrame"], model_dir: str = "models/production") -> Dict:
     """
     Quick prediction function.
     
     Args:
         cv_data: Resume data (dict or DataFrame)
         model_dir: Directory containing trained model
-        
+    
     Returns:
         Prediction dictionary
     """
@@ -16,7 +16,6 @@ from typing import Dict, List, Tuple
 import logging
 import os
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 sns.set_style("whitegrid")
@@ -10,7 +10,6 @@ from sklearn.model_selection import train_test_split
 from typing import Tuple
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
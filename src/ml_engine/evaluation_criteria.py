@@ -14,7 +14,6 @@ from sklearn.metrics import (
 from typing import Dict, Tuple
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
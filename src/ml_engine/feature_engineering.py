@@ -12,7 +12,6 @@ from sklearn.preprocessing import StandardScaler, LabelEncoder
 from typing import Dict, List, Tuple
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -182,7 +181,7 @@ class FeatureEngineer:
         if not self.fitted:
             raise RuntimeError("FeatureEngineer must be fitted before transform. Call fit_transform first.")
         
-        logger.info("Transforming data with fitted pipeline...")
+        logger.debug("Transforming data with fitted pipeline...")
         
         # Normalize column names (handle variations)
         df = df.copy().reset_index(drop=True)
@@ -233,6 +232,6 @@ class FeatureEngineer:
         X = all_features.values
         X[:, numerical_indices] = self.scaler.transform(X[:, numerical_indices])
         
-        logger.info(f"✅ Transform complete. Shape: {X.shape}")
+        logger.debug("Transform complete. Shape: %s", X.shape)
         
         return X
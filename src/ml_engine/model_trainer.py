@@ -24,7 +24,6 @@ from datetime import datetime
 
 from .evaluation_criteria import EvaluationCriteria
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
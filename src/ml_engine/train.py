@@ -27,11 +27,8 @@ from src.ml_engine.feature_engineering import FeatureEngineer
 from src.ml_engine.cross_validation import CrossValidationEvaluator
 from src.ml_engine.model_trainer import ATSModelTrainer
 from src.ml_engine.evaluation_criteria import EvaluationCriteria
+from src.core.config import setup_logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -249,4 +246,5 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    setup_logging()
     main(args)
@@ -0,0 +1,285 @@
+"""
+Artifact Sink for Recruiter-Pro-AI
+Optional persistence of intermediate artifacts (e.g. Agent 1 raw profiles)
+
+Modes (ArtifactsConfig.mode):
+- off      : discard (no disk I/O)
+- json     : one pretty-printed JSON file per artifact (legacy layout)
+- jsonl_gz : compact JSON lines appended to gzip logs, rotated by size
+
+With `background: true` writes are queued and performed by a daemon thread,
+so callers never wait on the disk. A full queue drops the artifact (counted
+in recruiter_fallbacks_total) rather than blocking a request.
+
+Retention keeps at most `max_files` files and nothing older than
+`max_age_days` in the output directory.
+"""
+import gzip
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..core.config import PROJECT_ROOT, ArtifactsConfig, get_config
+from ..core.metrics import FALLBACKS
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_MODES = ("off", "json", "jsonl_gz")
+
+
+def _resolve(output_dir: str) -> Path:
+    path = Path(output_dir)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def _enforce_retention(directory: Path, pattern: str, max_files: int, max_age_days: float) -> int:
+    """
+    Delete files beyond the count/age limits (newest kept)
+    
+    Returns:
+        Number of files removed
+    """
+    if not directory.exists():
+        return 0
+    
+    files = sorted(directory.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+    cutoff = time.time() - max_age_days * 86400 if max_age_days else None
+    
+    removed = 0
+    for index, path in enumerate(files):
+        expired = cutoff is not None and path.stat().st_mtime < cutoff
+        if (max_files and index >= max_files) or expired:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+class ArtifactSink:
+    """Base sink: discards everything (mode 'off')"""
+    
+    def write(self, kind: str, artifact_id: str, data: Dict) -> None:
+        """Persist one artifact (no-op here)"""
+    
+    def write_many(self, records: List[tuple]) -> None:
+        """Persist (kind, artifact_id, data) records"""
+        for kind, artifact_id, data in records:
+            self.write(kind, artifact_id, data)
+    
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until queued artifacts are on disk"""
+    
+    def close(self) -> None:
+        """Flush and release resources"""
+        self.flush()
+    
+    def describe(self) -> str:
+        return "off"
+
+
+class JsonFileSink(ArtifactSink):
+    """One indented JSON file per artifact: `<output_dir>/<artifact_id>.json`"""
+    
+    # Directory listing for retention is amortized over this many writes
+    RETENTION_EVERY = 50
+    
+    def __init__(self, output_dir: Path, max_files: int = 1000, max_age_days: float = 7):
+        self.output_dir = output_dir
+        self.max_files = max_files
+        self.max_age_days = max_age_days
+        self._writes = 0
+    
+    def write(self, kind, artifact_id, data):
+        self.write_many([(kind, artifact_id, data)])
+    
+    def write_many(self, records: List[tuple]) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for _, artifact_id, data in records:
+            with open(self.output_dir / f"{artifact_id}.json", 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        
+        self._writes += len(records)
+        if self._writes >= self.RETENTION_EVERY:
+            self._writes = 0
+            _enforce_retention(self.output_dir, "*.json", self.max_files, self.max_age_days)
+    
+    def describe(self):
+        return f"json files in {self.output_dir}"
+
+
+class JsonlGzipSink(ArtifactSink):
+    """
+    Append compact JSON lines to `<output_dir>/artifacts-<timestamp>.jsonl.gz`
+    
+    Each `write_many()` call appends one complete gzip member, so the log
+    stays readable (`zcat`, `gzip.open`) even if the process dies. Files
+    rotate at `rotate_mb` and old ones are pruned on rotation.
+    """
+    
+    def __init__(
+        self,
+        output_dir: Path,
+        max_files: int = 20,
+        max_age_days: float = 7,
+        rotate_mb: float = 50
+    ):
+        self.output_dir = output_dir
+        self.max_files = max_files
+        self.max_age_days = max_age_days
+        self.rotate_bytes = int(rotate_mb * 1024 * 1024)
+        self._current: Optional[Path] = None
+        self._lock = threading.Lock()
+    
+    def write(self, kind, artifact_id, data):
+        self.write_many([(kind, artifact_id, data)])
+    
+    def write_many(self, records: List[tuple]) -> None:
+        written_at = datetime.now().isoformat()
+        lines = "".join(
+            json.dumps(
+                {"kind": kind, "id": artifact_id, "written_at": written_at, "data": data},
+                ensure_ascii=False,
+                separators=(",", ":")
+            ) + "\n"
+            for kind, artifact_id, data in records
+        )
+        
+        with self._lock:
+            path = self._target()
+            with gzip.open(path, "at", encoding="utf-8", compresslevel=6) as f:
+                f.write(lines)
+    
+    def _target(self) -> Path:
+        """Current log file, rotating when it has grown past the limit"""
+        if self._current is None or (
+            self._current.exists() and self._current.stat().st_size >= self.rotate_bytes
+        ):
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            self._current = self.output_dir / f"artifacts-{stamp}.jsonl.gz"
+            _enforce_retention(self.output_dir, "artifacts-*.jsonl.gz", self.max_files, self.max_age_days)
+        return self._current
+    
+    def describe(self):
+        return f"jsonl.gz log in {self.output_dir}"
+
+
+class BackgroundSink(ArtifactSink):
+    """Queue writes for a daemon thread that batches them into the target sink"""
+    
+    def __init__(self, target: ArtifactSink, queue_size: int = 1000, batch_size: int = 100):
+        self.target = target
+        self.batch_size = batch_size
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._closed = False
+        self._thread = threading.Thread(target=self._worker, name="artifact-writer", daemon=True)
+        self._thread.start()
+    
+    def write(self, kind, artifact_id, data):
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait((kind, artifact_id, data))
+        except queue.Full:
+            FALLBACKS.inc(component="artifacts", reason="queue_full")
+    
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    # Put the stop marker back so it ends the loop after this batch
+                    self._queue.task_done()
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+            
+            try:
+                self.target.write_many(batch)
+            except Exception as e:
+                logger.warning("Failed to write %d artifacts: %s", len(batch), e)
+                FALLBACKS.inc(component="artifacts", reason="write_error")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Block until the queue is drained (timeout in seconds, None = wait)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks and self._thread.is_alive():
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(0.005)
+    
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join(timeout=10)
+    
+    def describe(self):
+        return f"background → {self.target.describe()}"
+
+
+def create_artifact_sink(artifacts_config: ArtifactsConfig) -> ArtifactSink:
+    """Build the sink described by the configuration"""
+    mode = artifacts_config.mode
+    if mode not in ARTIFACT_MODES:
+        raise ValueError(f"Unknown artifact mode: {mode}. Use one of {ARTIFACT_MODES}")
+    if mode == "off":
+        return ArtifactSink()
+    
+    output_dir = _resolve(artifacts_config.output_dir)
+    if mode == "json":
+        sink = JsonFileSink(output_dir, artifacts_config.max_files, artifacts_config.max_age_days)
+    else:
+        sink = JsonlGzipSink(
+            output_dir,
+            artifacts_config.max_files,
+            artifacts_config.max_age_days,
+            artifacts_config.rotate_mb
+        )
+    
+    if artifacts_config.background:
+        return BackgroundSink(sink, queue_size=artifacts_config.queue_size)
+    return sink
+
+
+# Singleton instance
+_artifact_sink: Optional[ArtifactSink] = None
+
+
+def get_artifact_sink(reload: bool = False, output_dir: Optional[str] = None) -> ArtifactSink:
+    """
+    Get the shared artifact sink (configured from ArtifactsConfig)
+    
+    Args:
+        reload: Close the current sink and build a new one
+        output_dir: Build a separate sink writing here instead (not shared)
+    """
+    global _artifact_sink
+    
+    if output_dir is not None:
+        return create_artifact_sink(replace(get_config().artifacts, output_dir=output_dir))
+    
+    if _artifact_sink is None or reload:
+        if _artifact_sink is not None:
+            _artifact_sink.close()
+        _artifact_sink = create_artifact_sink(get_config().artifacts)
+    
+    return _artifact_sink
@@ -11,6 +11,7 @@ from contextlib import contextmanager
 
 from .models import MatchHistory, MatchResult, match_result_to_history
 from ..core.config import get_config
+from ..core.metrics import DB_WRITE_LATENCY
 
 
 class Database:
@@ -141,6 +142,34 @@ class Database:
             conn.commit()
             self._initialized = True
     
+    _INSERT_MATCH_SQL = """
+        INSERT INTO match_history (
+            match_id, cv_id, job_id,
+            candidate_name, candidate_email, candidate_skills,
+            job_title, required_skills,
+            skill_score, experience_score, education_score, keyword_score,
+            rule_based_score, ml_score, final_score,
+            decision, confidence, reason, explanation,
+            matched_skills, missing_skills, processing_time_ms,
+            created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _history_row(history: MatchHistory) -> tuple:
+        """Flatten a MatchHistory into INSERT parameters"""
+        return (
+            history.match_id, history.cv_id, history.job_id,
+            history.candidate_name, history.candidate_email, history.candidate_skills,
+            history.job_title, history.required_skills,
+            history.skill_score, history.experience_score, 
+            history.education_score, history.keyword_score,
+            history.rule_based_score, history.ml_score, history.final_score,
+            history.decision, history.confidence, history.reason, history.explanation,
+            history.matched_skills, history.missing_skills, history.processing_time_ms,
+            history.created_at
+        )
+    
     def save_match(self, match: MatchResult) -> int:
         """
         Save a match result to database
@@ -156,34 +185,34 @@ class Database:
         
         history = match_result_to_history(match)
         
-        with self.get_connection() as conn:
+        with DB_WRITE_LATENCY.time(operation="save_match"), self.get_connection() as conn:
             cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO match_history (
-                    match_id, cv_id, job_id,
-                    candidate_name, candidate_email, candidate_skills,
-                    job_title, required_skills,
-                    skill_score, experience_score, education_score, keyword_score,
-                    rule_based_score, ml_score, final_score,
-                    decision, confidence, reason, explanation,
-                    matched_skills, missing_skills, processing_time_ms,
-                    created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                history.match_id, history.cv_id, history.job_id,
-                history.candidate_name, history.candidate_email, history.candidate_skills,
-                history.job_title, history.required_skills,
-                history.skill_score, history.experience_score, 
-                history.education_score, history.keyword_score,
-                history.rule_based_score, history.ml_score, history.final_score,
-                history.decision, history.confidence, history.reason, history.explanation,
-                history.matched_skills, history.missing_skills, history.processing_time_ms,
-                history.created_at
-            ))
-            
+            cursor.execute(self._INSERT_MATCH_SQL, self._history_row(history))
             return cursor.lastrowid
     
+    def save_matches(self, matches: List[MatchResult]) -> int:
+        """
+        Save many match results in a single transaction
+        
+        Args:
+            matches: MatchResult instances
+        
+        Returns:
+            Number of rows inserted
+        """
+        if not matches:
+            return 0
+        
+        if not self._initialized:
+            self.initialize_schema()
+        
+        rows = [self._history_row(match_result_to_history(m)) for m in matches]
+        
+        with DB_WRITE_LATENCY.time(operation="save_matches"), self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self._INSERT_MATCH_SQL, rows)
+            return len(rows)
+    
     def get_match_by_id(self, match_id: str) -> Optional[MatchHistory]:
         """Get match by match_id"""
         with self.get_connection() as conn:
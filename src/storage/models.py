@@ -4,7 +4,7 @@ Pydantic schemas for CV, Job, Match, and Decision entities
 """
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from enum import Enum
 
 
@@ -40,6 +40,12 @@ class CVProfile(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
+    # Normalized skill IDs, text tokens and role features, computed once by
+    # Agent 3 (not serialized)
+    _skill_ids: Optional[frozenset] = PrivateAttr(default=None)
+    _tokens: Optional[frozenset] = PrivateAttr(default=None)
+    _roles: Optional[tuple] = PrivateAttr(default=None)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -90,6 +96,12 @@ class JobPosting(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     is_active: bool = Field(True, description="Job is currently active")
     
+    # (required, preferred) skill IDs, description keywords and title
+    # features, computed once per catalog load by Agent 3
+    _skill_ids: Optional[tuple] = PrivateAttr(default=None)
+    _keywords: Optional[frozenset] = PrivateAttr(default=None)
+    _title: Optional[Any] = PrivateAttr(default=None)
+    
     @field_validator('remote_type')
     @classmethod
     def validate_remote_type(cls, v):
@@ -2,7 +2,10 @@
 Skill extraction utilities for resume parsing.
 """
 import re
-from typing import List, Set
+from functools import lru_cache
+from typing import FrozenSet, List, Set
+
+from .skill_matcher import SkillMatcher
 
 # Comprehensive skill database
 TECHNICAL_SKILLS = {
@@ -52,53 +55,56 @@ DOMAIN_SKILLS = {
 
 ALL_SKILLS = TECHNICAL_SKILLS | SOFT_SKILLS | DOMAIN_SKILLS
 
+# Common abbreviations reported as the full skill name (registered in
+# SkillRegistry; two-letter ones are not matched in free text)
+SKILL_VARIATIONS = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'k8s': 'kubernetes',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'dl': 'deep learning',
+    'cv': 'computer vision',
+    'db': 'database',
+}
+
+
+@lru_cache(maxsize=32)
+def _skill_matcher(base: SkillMatcher, custom_skills: FrozenSet[str]) -> SkillMatcher:
+    """The registry automaton extended with one distinct custom skill set."""
+    from ..core.skill_registry import get_skill_registry
+    
+    registry = get_skill_registry()
+    terms = dict(base.terms)
+    for skill in custom_skills:
+        skill_id = registry.id_of(skill)
+        terms.setdefault(skill, registry.name(skill_id) if skill_id is not None else skill)
+    return SkillMatcher(terms)
+
 
 def extract_skills(text: str, custom_skills: List[str] = None) -> List[str]:
     """
     Extract skills from text using pattern matching.
     
+    Matches the SkillRegistry vocabulary (the one Agent 2 uses), so skills
+    are reported by their canonical registry names.
+    
     Args:
         text: Text to extract skills from
         custom_skills: Additional skills to look for
-        
+    
     Returns:
         List of found skills
     """
     if not text:
         return []
     
-    text_lower = text.lower()
-    found_skills = set()
+    from ..core.skill_registry import get_skill_registry
     
-    # Combine default and custom skills
-    skills_to_check = ALL_SKILLS.copy()
+    matcher = get_skill_registry().matcher()
     if custom_skills:
-        skills_to_check.update([s.lower() for s in custom_skills])
-    
-    # Check for each skill
-    for skill in skills_to_check:
-        # Use word boundaries for exact matches
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.add(skill)
-    
-    # Also check for common variations
-    variations = {
-        'js': 'javascript',
-        'ts': 'typescript',
-        'k8s': 'kubernetes',
-        'ml': 'machine learning',
-        'ai': 'artificial intelligence',
-        'dl': 'deep learning',
-        'cv': 'computer vision',
-        'db': 'database',
-    }
-    
-    for abbr, full_name in variations.items():
-        if re.search(r'\b' + abbr + r'\b', text_lower):
-            found_skills.add(full_name)
-    
-    return sorted(list(found_skills))
+        matcher = _skill_matcher(matcher, frozenset(s.lower().strip() for s in custom_skills if s and s.strip()))
+    return sorted(matcher.find(text))
 
 
 def extract_skills_from_list(text: str, delimiter: str = '|') -> List[str]:
@@ -108,7 +114,7 @@ def extract_skills_from_list(text: str, delimiter: str = '|') -> List[str]:
     Args:
         text: Text containing delimited skills
         delimiter: Delimiter character
-        
+    
     Returns:
         List of skills
     """
@@ -130,7 +136,7 @@ def categorize_skills(skills: List[str]) -> dict:
     
     Args:
         skills: List of skills
-        
+    
     Returns:
         Dictionary with categorized skills
     """
@@ -162,7 +168,7 @@ def calculate_skill_match(profile_skills: List[str], job_skills: List[str]) -> d
     Args:
         profile_skills: Skills from candidate profile
         job_skills: Required skills from job
-        
+    
     Returns:
         Dictionary with matching metrics
     """
@@ -197,7 +203,7 @@ def extract_skill_level(text: str, skill: str) -> str:
     Args:
         text: Text containing skill information
         skill: Skill to check
-        
+    
     Returns:
         Proficiency level (beginner, intermediate, advanced, expert) or 'unknown'
     """
@@ -225,27 +231,21 @@ def extract_skill_level(text: str, skill: str) -> str:
 
 def normalize_skill_name(skill: str) -> str:
     """
-    Normalize skill name to standard format.
+    Normalize skill name to its canonical form (see SkillRegistry).
+    
+    Aliases map to the registry's canonical name, which is not always the
+    long form ("amazon web services" -> "aws", "k8s" -> "kubernetes").
+    Unknown skills are only lower-cased and trimmed; they are not added to
+    the registry.
     
     Args:
         skill: Skill name
-        
+    
     Returns:
-        Normalized skill name
+        Canonical lower-case skill name
     """
-    # Common normalizations
-    normalizations = {
-        'js': 'javascript',
-        'ts': 'typescript',
-        'k8s': 'kubernetes',
-        'aws': 'amazon web services',
-        'gcp': 'google cloud platform',
-        'ml': 'machine learning',
-        'ai': 'artificial intelligence',
-        'dl': 'deep learning',
-        'nlp': 'natural language processing',
-        'cv': 'computer vision',
-    }
+    from ..core.skill_registry import get_skill_registry, skill_key
     
-    skill_lower = skill.lower().strip()
-    return normalizations.get(skill_lower, skill_lower)
+    registry = get_skill_registry()
+    skill_id = registry.id_of(skill)
+    return registry.name(skill_id) if skill_id is not None else skill_key(skill)
@@ -0,0 +1,128 @@
+"""
+One-pass dictionary matching for skill extraction.
+
+All skill terms are compiled into a single trie-shaped regex, so a CV is
+scanned once regardless of dictionary size (instead of one substring check
+or regex per skill). Matches use word-boundary semantics that also work for
+terms starting or ending in symbols ("c++", "c#", ".net"): a term must not
+be preceded or followed by a letter, digit or underscore, and must not
+start right after a dot inside a word ("js" is not found in "node.js").
+
+Overlapping terms are all reported: "react native" yields both
+"react native" and "react".
+"""
+import re
+from typing import Dict, Iterable, Optional, Set
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Regex alternation shaped as a character trie.
+    
+    Shared prefixes are matched once, and longer continuations are tried
+    before stopping, so each start position yields its longest term.
+    Spaces inside terms match any run of whitespace.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True  # End of a term
+    
+    def build(node: Dict) -> str:
+        ends_here = "" in node
+        branches = [
+            (r"\s+" if char == " " else re.escape(char)) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        group = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends_here:
+            # Optional continuation: greedy, falls back to the shorter term
+            return f"(?:{group})?"
+        return group
+    
+    return build(trie)
+
+
+class SkillMatcher:
+    """
+    Compiled matcher for a term → canonical skill mapping.
+    
+    Example:
+        matcher = SkillMatcher({"js": "javascript", "javascript": "javascript"})
+        matcher.find("Senior JS developer")  # {"javascript"}
+    """
+    
+    def __init__(self, terms: Dict[str, str]):
+        """
+        Args:
+            terms: Lower-case term → canonical skill it stands for
+        """
+        self.terms = {
+            _WHITESPACE_RE.sub(" ", term.lower().strip()): canonical
+            for term, canonical in terms.items()
+            if term and term.strip()
+        }
+        # Each start position reports only its longest term; keep the
+        # shorter terms it contains that end on a boundary ("react" in
+        # "react native", "node" in "node.js")
+        self._prefixes = {
+            term: [
+                term[:end] for end in range(1, len(term))
+                if term[:end] in self.terms and not self._is_word_char(term[end])
+            ]
+            for term in self.terms
+        }
+        self._pattern = re.compile(
+            r"(?<!\w)(?<!\w\.)(?=(" + _trie_pattern(self.terms) + r")(?!\w))"
+        ) if self.terms else None
+    
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == "_"
+    
+    def find_terms(self, text: str) -> Set[str]:
+        """All dictionary terms occurring in text (case-insensitive)."""
+        if not text or self._pattern is None:
+            return set()
+        
+        found: Set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            term = match.group(1)
+            if term not in self.terms:
+                term = _WHITESPACE_RE.sub(" ", term)
+            found.add(term)
+            found.update(self._prefixes[term])
+        return found
+    
+    def find(self, text: str) -> Set[str]:
+        """Canonical skills whose terms occur in text."""
+        return {self.terms[term] for term in self.find_terms(text)}
+
+
+def build_skill_matcher(
+    vocabulary: Iterable[str],
+    synonyms: Optional[Dict[str, str]] = None,
+    aliases: Optional[Dict[str, str]] = None
+) -> SkillMatcher:
+    """
+    Combine a skill vocabulary with synonym and alias tables.
+    
+    Vocabulary terms (normalized through synonyms) take precedence over
+    aliases, so existing outputs keep their spelling.
+    
+    Args:
+        vocabulary: Skill terms, each reported as itself (or its synonym)
+        synonyms: term → preferred spelling for vocabulary terms
+        aliases: Extra alias → canonical entries
+    """
+    synonyms = synonyms or {}
+    terms: Dict[str, str] = dict(aliases or {})
+    terms.update({term: synonyms.get(term, term) for term in vocabulary})
+    return SkillMatcher(terms)
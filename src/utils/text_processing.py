@@ -4,20 +4,30 @@ Text processing utilities for resume and job description parsing.
 import re
 import string
 from typing import List
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import nltk
 
-# Download required NLTK data (run once)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+_nltk_ready = False
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+
+def _ensure_nltk() -> None:
+    """
+    Import NLTK and download its data on first use (not at import time)
+    """
+    global _nltk_ready
+    if _nltk_ready:
+        return
+    import nltk
+    
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+    
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+    
+    _nltk_ready = True
 
 
 def clean_text(text: str) -> str:
@@ -26,7 +36,7 @@ def clean_text(text: str) -> str:
     
     Args:
         text: Raw text to clean
-        
+    
     Returns:
         Cleaned text string
     """
@@ -61,13 +71,17 @@ def remove_stopwords(text: str, custom_stopwords: List[str] = None) -> str:
     Args:
         text: Text to process
         custom_stopwords: Additional stopwords to remove
-        
+    
     Returns:
         Text with stopwords removed
     """
     if not text:
         return ""
     
+    _ensure_nltk()
+    from nltk.corpus import stopwords
+    from nltk.tokenize import word_tokenize
+    
     # Get English stopwords
     stop_words = set(stopwords.words('english'))
     
@@ -90,7 +104,7 @@ def extract_years_of_experience(text: str) -> int:
     
     Args:
         text: Text containing experience information
-        
+    
     Returns:
         Number of years (integer), or 0 if not found
     """
@@ -118,7 +132,7 @@ def extract_email(text: str) -> str:
     
     Args:
         text: Text containing email
-        
+    
     Returns:
         Email address or empty string
     """
@@ -137,7 +151,7 @@ def extract_phone(text: str) -> str:
     
     Args:
         text: Text containing phone number
-        
+    
     Returns:
         Phone number or empty string
     """
@@ -164,7 +178,7 @@ def normalize_whitespace(text: str) -> str:
     
     Args:
         text: Text to normalize
-        
+    
     Returns:
         Text with normalized whitespace
     """
@@ -181,7 +195,7 @@ def extract_section(text: str, section_name: str) -> str:
     Args:
         text: Full resume text
         section_name: Name of section to extract (e.g., 'experience', 'education')
-        
+    
     Returns:
         Section text or empty string
     """
@@ -1,9 +1,65 @@
 """
 Pytest configuration and shared fixtures
 """
+import copy
+from datetime import datetime
+
 import pytest
 from pathlib import Path
 
+from benchmarks.stub_ollama import StubOllama
+from src.core.config import get_config
+from src.storage.models import DecisionType, MatchDecision, MatchResult, ScoreBreakdown
+
 @pytest.fixture
 def project_root():
     return Path(__file__).parent.parent
+
+
+@pytest.fixture
+def stub():
+    """Local stand-in for Ollama (see benchmarks/stub_ollama.py)"""
+    with StubOllama() as server:
+        yield server
+
+
+@pytest.fixture
+def stub_config(stub):
+    """Copy of the app config with the LLM pointed at the stub"""
+    config = copy.deepcopy(get_config())
+    config.llm.base_url = stub.base_url
+    config.llm.model = stub.model
+    return config
+
+
+@pytest.fixture
+def sample_match():
+    """Create sample match result for testing"""
+    return MatchResult(
+        match_id="test_123",
+        cv_id="cv_456",
+        job_id="job_789",
+        candidate_name="John Doe",
+        job_title="Python Developer",
+        score_breakdown=ScoreBreakdown(
+            skill_score=0.85,
+            experience_score=0.75,
+            education_score=0.80,
+            keyword_score=0.70,
+            rule_based_score=0.80,
+            hybrid_score=0.82,
+            matched_skills=["Python", "Django", "PostgreSQL", "Docker", "AWS"],
+            missing_skills=["Kubernetes", "Redis"],
+            extra_skills=["Java", "Spring Boot"]
+        ),
+        final_score=0.82,
+        decision=MatchDecision(
+            decision=DecisionType.SHORTLIST,
+            confidence=0.85,
+            reason="Strong technical fit",
+            strengths=["Solid Python skills", "Cloud experience"],
+            red_flags=[],
+            recommendations=["Technical interview", "System design assessment"]
+        ),
+        timestamp=datetime.now()
+    )
@@ -0,0 +1,176 @@
+"""
+Unit tests for Agent 3 rule-based feature scoring
+"""
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.synthetic import SyntheticData
+from src.agents.agent3_scorer import ROLE_KEYWORDS, HybridScoringAgent
+from src.core.config import PROJECT_ROOT
+from src.storage.models import CVProfile
+
+from .test_orchestrator import make_job
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    agent = HybridScoringAgent()
+    agent.ml_predictor = None
+    return agent
+
+
+def make_cv(text: str, **extracted) -> CVProfile:
+    return CVProfile(cv_id="cv", file_name="cv.txt", raw_text=text, extracted_data=extracted)
+
+
+def legacy_title_similarity(cv, job):
+    """_score_title_similarity before precomputed features (reference)"""
+    if not cv.extracted_data:
+        return 0.4
+    cv_roles = []
+    if 'title' in cv.extracted_data:
+        cv_roles.append(cv.extracted_data['title'].lower())
+    if 'current_role' in cv.extracted_data:
+        cv_roles.append(cv.extracted_data['current_role'].lower())
+    if not cv_roles and cv.raw_text:
+        role_patterns = [
+            r'(software|web|mobile|backend|frontend|full[ -]?stack|data|ml|ai|devops|security|cloud)\s+(engineer|developer|architect|analyst)',
+            r'(junior|senior|lead|principal)\s+(engineer|developer|programmer)',
+            r'(intern|trainee|student).*?(engineer|developer|programmer)',
+        ]
+        for pattern in role_patterns:
+            match = re.search(pattern, cv.raw_text.lower())
+            if match:
+                cv_roles.append(match.group(0))
+                break
+    if not cv_roles:
+        return 0.4
+    job_title = job.title.lower()
+    for cv_role in cv_roles:
+        if cv_role in job_title or job_title in cv_role:
+            return 1.0
+        if len(set(job_title.split()).intersection(set(cv_role.split()))) >= 2:
+            return 0.95
+        for key, synonyms in ROLE_KEYWORDS.items():
+            key_in_job = key in job_title or any(syn in job_title for syn in synonyms)
+            key_in_cv = key in cv_role or any(syn in cv_role for syn in synonyms)
+            if key_in_job and key_in_cv:
+                return 0.85
+    for level in ['intern', 'junior', 'mid', 'senior', 'lead', 'principal', 'staff', 'manager', 'director']:
+        if level in job_title:
+            for cv_role in cv_roles:
+                if level in cv_role:
+                    return 0.7
+    for domain in ['engineering', 'developer', 'data', 'marketing', 'sales', 'design', 'product']:
+        if domain in job_title and any(domain in cv_role for cv_role in cv_roles):
+            return 0.5
+    return 0.3
+
+
+TITLES = [
+    "Senior Python Developer", "Full-Stack Dev", "Site Reliability Engineer", "Marketing Manager",
+    "Data Scientist", "Sales Director", "Product Designer", "Junior QA Analyst", "Staff Accountant",
+    "Mid-level Cyber Security Specialist", "Head of Growth", "Graduate Trainee", "Chef",
+    "Staff Nurse", "Sales Associate",
+]
+
+
+class TestKeywordScoring:
+    """Test precomputed job keywords and CV token sets"""
+    
+    def test_keywords_in_text_order(self, scorer):
+        """Keywords are the first distinct non-stopwords, in description order"""
+        words = [f"kw{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(30)]
+        keywords = scorer._extract_keywords("The team and " + " ".join(words + words))
+        
+        assert keywords == ["team"] + words[:19]
+    
+    def test_keyword_score_is_set_overlap(self, scorer):
+        """Score is the share of job keywords that are words of the CV"""
+        job = make_job("job", "Developer", ["python"])
+        job.description = "Build pipelines with Python and Airflow"
+        cv = make_cv("Python developer. Maintained pipelines; airflows are my thing.")
+        
+        assert scorer.job_keywords(job) == {"build", "pipelines", "python", "airflow"}
+        assert scorer._score_keywords(cv, job) == 0.5
+    
+    def test_cached_per_job_and_cv(self, scorer):
+        """Keywords and tokens are computed once and reused"""
+        job = make_job("job", "Developer", ["python"])
+        cv = make_cv("Python developer")
+        scorer.prepare_jobs([job])
+        scorer.prepare_cv(cv)
+        
+        assert scorer.job_keywords(job) is job._keywords
+        assert scorer.cv_tokens(cv) is cv._tokens
+    
+    def test_reproducible_across_processes(self):
+        """Keyword choice does not depend on string hash randomization"""
+        code = (
+            "from src.agents.agent3_scorer import HybridScoringAgent\n"
+            "text = ' '.join('term%s' % chr(97 + i) for i in range(26))\n"
+            "print(','.join(HybridScoringAgent._extract_keywords(text)))\n"
+        )
+        outputs = set()
+        for seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            result = subprocess.run(
+                [sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env,
+                capture_output=True, text=True, check=True
+            )
+            outputs.add(result.stdout.strip().splitlines()[-1])
+        
+        assert len(outputs) == 1
+
+
+class TestTitleSimilarity:
+    """Test precomputed title features against the previous implementation"""
+    
+    @pytest.fixture(scope="class")
+    def corpus(self):
+        data = SyntheticData(seed=3)
+        jobs = data.jobs(150)
+        for i, title in enumerate(TITLES):
+            job = make_job(f"title{i}", "x", ["python"])
+            job.title = title
+            jobs.append(job)
+        
+        roles = TITLES + sorted({job.title for job in jobs[:40]})
+        cvs = [make_cv(text, skills=[]) for text in data.cv_texts(40)]
+        cvs += [make_cv("", title=role) for role in roles]
+        cvs += [make_cv("", title=a, current_role=b) for a, b in zip(roles, reversed(roles))]
+        cvs += [make_cv("Senior developer"), make_cv("no role here", skills=[])]
+        return cvs, jobs
+    
+    def test_matches_legacy_scores(self, scorer, corpus):
+        """Scores are identical to the per-call implementation on the corpus"""
+        cvs, jobs = corpus
+        scorer.prepare_jobs(jobs)
+        
+        for cv in cvs:
+            scorer.prepare_cv(cv)
+            for job in jobs:
+                assert scorer._score_title_similarity(cv, job) == legacy_title_similarity(cv, job), (
+                    cv.extracted_data, cv.raw_text[:80], job.title
+                )
+    
+    def test_corpus_covers_every_score(self, corpus):
+        """The regression corpus exercises every branch"""
+        cvs, jobs = corpus
+        scores = {legacy_title_similarity(cv, job) for cv in cvs for job in jobs}
+        
+        assert scores == {1.0, 0.95, 0.85, 0.7, 0.5, 0.4, 0.3}
+    
+    def test_features_cached(self, scorer):
+        """Job and CV role features are computed once"""
+        job = make_job("job", "Senior Data Engineer", ["python"])
+        cv = make_cv("", title="Data Analyst")
+        scorer._score_title_similarity(cv, job)
+        
+        assert scorer.job_title_features(job) is job._title
+        assert scorer.cv_role_features(cv) is cv._roles
+        assert job._title.terms == {"senior", "data", "engineer"}
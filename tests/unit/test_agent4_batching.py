@@ -0,0 +1,70 @@
+"""
+Unit tests for batched Agent 4 explanation prompts
+"""
+import json
+
+import pytest
+
+from benchmarks.stub_ollama import DEFAULT_RESPONSE
+from src.agents.agent4_llm_explainer import LLMExplainerAgent, parse_batch_explanations
+
+LONG = "A detailed explanation of this match that is comfortably over fifty characters."
+
+
+@pytest.fixture
+def matches(sample_match):
+    return [sample_match.model_copy(update={"job_title": f"Role {i}"}) for i in range(5)]
+
+
+def make_agent(config, batch_size=4):
+    config.llm.batch_size = batch_size
+    agent = LLMExplainerAgent(config)
+    agent.llm_available = True
+    return agent
+
+
+class TestParseBatch:
+    """Test validation of batched JSON responses"""
+    
+    def test_wrapped_json_parsed(self):
+        """Prose and code fences around the JSON are ignored"""
+        text = 'Here you go:\n```json\n{"explanations": [{"id": 2, "explanation": "%s"}]}\n```' % LONG
+        
+        assert parse_batch_explanations(text, 2) == {1: LONG}
+    
+    def test_invalid_entries_dropped(self):
+        """Unknown, repeated, non-numeric and too-short entries are skipped"""
+        entries = [
+            {"id": 1, "explanation": LONG},
+            {"id": 1, "explanation": LONG + " again"},
+            {"id": 3, "explanation": LONG},
+            {"id": "x", "explanation": LONG},
+            {"id": 2, "explanation": "too short"},
+        ]
+        
+        assert parse_batch_explanations(json.dumps(entries), 2) == {0: LONG}
+        assert parse_batch_explanations("not json {", 2) == {}
+
+
+class TestBatchedExplanations:
+    """Test one prompt per batch and single-call fallback"""
+    
+    def test_one_call_per_batch(self, stub, stub_config, matches):
+        """Five matches with batch_size 4 take two LLM calls"""
+        explanations = make_agent(stub_config).generate_explanations(matches)
+        
+        assert explanations == [DEFAULT_RESPONSE] * 5
+        assert stub.requests == 2
+    
+    def test_unparsed_entries_retried_singly(self, stub, stub_config, matches):
+        """Entries missing from the batched answer fall back to single calls"""
+        def respond(prompt):
+            if "### Match" in prompt:
+                return json.dumps({"explanations": [{"id": 1, "explanation": LONG}]})
+            return DEFAULT_RESPONSE
+        
+        stub.respond = respond
+        explanations = make_agent(stub_config, batch_size=3).generate_explanations(matches[:3])
+        
+        assert explanations == [LONG, DEFAULT_RESPONSE, DEFAULT_RESPONSE]
+        assert stub.requests == 3
@@ -4,41 +4,6 @@ Run with: pytest tests/test_agent4_modes.py -v -s
 """
 import pytest
 from src.agents.agent4_factory import get_explainer_agent
-from src.storage.models import MatchResult, ScoreBreakdown, MatchDecision, DecisionType
-from datetime import datetime
-
-
-@pytest.fixture
-def sample_match():
-    """Create sample match result for testing"""
-    return MatchResult(
-        match_id="test_123",
-        cv_id="cv_456",
-        job_id="job_789",
-        candidate_name="John Doe",
-        job_title="Python Developer",
-        score_breakdown=ScoreBreakdown(
-            skill_score=0.85,
-            experience_score=0.75,
-            education_score=0.80,
-            keyword_score=0.70,
-            rule_based_score=0.80,
-            hybrid_score=0.82,
-            matched_skills=["Python", "Django", "PostgreSQL", "Docker", "AWS"],
-            missing_skills=["Kubernetes", "Redis"],
-            extra_skills=["Java", "Spring Boot"]
-        ),
-        final_score=0.82,
-        decision=MatchDecision(
-            decision=DecisionType.SHORTLIST,
-            confidence=0.85,
-            reason="Strong technical fit",
-            strengths=["Solid Python skills", "Cloud experience"],
-            red_flags=[],
-            recommendations=["Technical interview", "System design assessment"]
-        ),
-        timestamp=datetime.now()
-    )
 
 
 def test_direct_http_mode(sample_match):
@@ -81,7 +46,7 @@ def test_langchain_mode(sample_match):
             "Should mention matched skills"
         
         print("\n✅ LangChain mode test PASSED")
-        
+    
     except ImportError as e:
         pytest.skip(f"LangChain not installed: {e}")
 
@@ -0,0 +1,172 @@
+"""
+Unit tests for precomputed API response payloads, caching and compression
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api as api
+import src.core.payloads as payloads
+from src.core.compression import choose_encoding
+from src.core.payloads import LEGACY_JOB_FIELDS, JobCatalog, json_response
+from src.storage.database import Database
+
+from .test_orchestrator import CV_TEXT, make_job
+
+
+@pytest.fixture
+def jobs():
+    return [
+        make_job("job_py", "Python Developer", ["python", "fastapi", "docker"]),
+        make_job("job_js", "Frontend Developer", ["react", "javascript", "css"]),
+    ]
+
+
+@pytest.fixture
+def served(jobs, tmp_path, monkeypatch):
+    """Serve `jobs` from the API with a throwaway database"""
+    db = Database(db_path=str(tmp_path / "history.db"))
+    db.initialize_schema()
+    monkeypatch.setattr(api.pipeline, "db", db)
+    api.set_catalog(jobs)
+    yield TestClient(api.app)
+    api.set_catalog([])
+
+
+class TestJobCatalog:
+    """Test per-job fragments and row formatting"""
+    
+    def test_fragments_precomputed_once(self, jobs):
+        """Every row for a job shares the fragment built at load"""
+        catalog = JobCatalog(jobs)
+        
+        assert catalog.fields("job_py") is catalog.fields("job_py")
+        assert catalog.fields("job_py")["location"] == "Cairo, India"
+        assert catalog.get("job_js") is jobs[1]
+    
+    def test_compact_drops_only_legacy_fields(self, jobs):
+        """Compact fragments are the full ones minus the legacy aliases"""
+        catalog = JobCatalog(jobs)
+        full, compact = catalog.fields("job_py"), catalog.fields("job_py", compact=True)
+        
+        assert set(full) - set(compact) == LEGACY_JOB_FIELDS
+        assert all(compact[key] == full[key] for key in compact)
+    
+    def test_unknown_job_uses_placeholders(self):
+        """Matches whose job left the catalog still format"""
+        fields = JobCatalog().fields("gone", compact=True)
+        
+        assert fields["company_name"] == "N/A"
+        assert "company" not in fields
+    
+    def test_stdlib_fallback_renders_same_json(self, jobs, monkeypatch):
+        """Without orjson the body decodes to the same content"""
+        content = {"matches": [JobCatalog(jobs).fields("job_py")], "total": 1}
+        fast = json_response(content).body
+        monkeypatch.setattr(payloads, "ORJSON_AVAILABLE", False)
+        
+        assert json.loads(json_response(content).body) == json.loads(fast)
+
+
+class TestMatchResponses:
+    """Test /match and /match/history bodies"""
+    
+    def test_match_full_and_compact(self, served):
+        """Compact responses omit legacy aliases; headers are preserved"""
+        files = {"file": ("cv.txt", CV_TEXT.encode(), "text/plain")}
+        full = served.post("/match", params={"top_k": 2}, files=files)
+        compact = served.post("/match", params={"top_k": 2, "compact": True}, files=files)
+        
+        assert full.status_code == compact.status_code == 200
+        assert full.headers["X-Request-ID"].startswith("req_")
+        rows = full.json()["matches"]
+        assert rows[0]["company"] == rows[0]["company_name"] == "Acme"
+        assert len({row["timestamp"] for row in rows}) == 1
+        for row in compact.json()["matches"]:
+            assert not LEGACY_JOB_FIELDS & set(row)
+    
+    def test_history_uses_catalog_fields(self, served):
+        """Stored matches are joined to the catalog by job ID"""
+        files = {"file": ("cv.txt", CV_TEXT.encode(), "text/plain")}
+        served.post("/match", params={"top_k": 1}, files=files)
+        
+        rows = served.get("/match/history", params={"compact": True}).json()["matches"]
+        
+        assert rows and all(row["company_name"] == "Acme" for row in rows)
+        assert "job_type" not in rows[0]
+
+
+class TestJobsListing:
+    """Test precomputed, compressed and revalidated /jobs pages"""
+    
+    def test_pages_match_listing_shape(self, served, jobs):
+        """Pages keep the legacy listing fields and pagination counters"""
+        body = served.get("/jobs", params={"skip": 1, "limit": 5}).json()
+        
+        assert (body["total"], body["skip"], body["limit"], body["count"]) == (2, 1, 5, 1)
+        assert body["jobs"][0]["job_title"] == jobs[1].title
+        assert body["jobs"][0]["company"] == "Acme"
+    
+    def test_unchanged_catalog_revalidates(self, served):
+        """If-None-Match with the catalog ETag returns an empty 304"""
+        first = served.get("/jobs")
+        again = served.get("/jobs", headers={"If-None-Match": first.headers["ETag"]})
+        
+        assert first.headers["Cache-Control"].startswith("public")
+        assert again.status_code == 304
+        assert again.content == b""
+    
+    def test_precompressed_page(self, served, jobs):
+        """Pages above the threshold are sent compressed, decoded by the client"""
+        api.set_catalog(jobs * 20)
+        plain = served.get("/jobs", headers={"Accept-Encoding": "identity"})
+        gzipped = served.get("/jobs", headers={"Accept-Encoding": "gzip"})
+        
+        assert "content-encoding" not in plain.headers
+        assert gzipped.headers["Content-Encoding"] == "gzip"
+        assert gzipped.json() == plain.json()
+    
+    def test_version_tracks_content(self, jobs):
+        """The ETag changes with job content, not with catalog identity"""
+        changed = [job.model_copy(update={"title": "Staff Engineer"}) for job in jobs]
+        
+        assert JobCatalog(jobs).etag == JobCatalog(list(jobs)).etag
+        assert JobCatalog(changed).etag != JobCatalog(jobs).etag
+    
+    def test_page_cache_bounded(self, jobs):
+        """Serialized pages are reused and evicted least recently used first"""
+        catalog = JobCatalog(jobs, max_pages=1)
+        page = catalog.page(0, 10)
+        
+        assert catalog.page(0, 10) is page
+        catalog.page(0, 1)
+        assert catalog.page(0, 10) is not page
+    
+    def test_filtered_listing(self, served, jobs):
+        """Filters narrow the listing and total counts the matches"""
+        body = served.get("/jobs", params={"q": "front", "skills": "JS", "remote_type": "remote"}).json()
+        none = served.get("/jobs", params={"skills": "python", "skills_match": "all", "q": "frontend"}).json()
+        
+        assert (body["total"], body["count"]) == (1, 1)
+        assert body["jobs"][0]["job_id"] == "job_js"
+        assert none["total"] == 0 and none["jobs"] == []
+
+class TestCompression:
+    """Test encoding negotiation and the response middleware"""
+    
+    def test_choose_encoding(self):
+        """Client preferences and q=0 exclusions are honoured"""
+        assert choose_encoding("gzip, deflate", available=("br", "gzip")) == "gzip"
+        assert choose_encoding("br;q=0, *", available=("br", "gzip")) == "gzip"
+        assert choose_encoding("identity") is None
+    
+    def test_large_responses_compressed(self, served):
+        """Dynamic responses above the threshold are gzip-encoded"""
+        files = {"file": ("cv.txt", CV_TEXT.encode(), "text/plain")}
+        response = served.post("/match", files=files, headers={"Accept-Encoding": "gzip"})
+        small = served.get("/health", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["matches"]
+        assert "content-encoding" not in small.headers
@@ -0,0 +1,56 @@
+"""
+Unit tests for in-memory, size-limited CV uploads
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api as api
+
+
+CV_TEXT = b"""Jane Roe
+Email: jane.roe@example.com
+SKILLS
+Python, SQL, Docker, Kubernetes
+EXPERIENCE
+Backend Engineer - 4 years of experience
+"""
+
+
+@pytest.fixture
+def client():
+    return TestClient(api.app)
+
+
+@pytest.fixture
+def upload_limit_mb(monkeypatch):
+    monkeypatch.setattr(api.pipeline.config.api, "max_upload_size_mb", 1)
+    return 1
+
+
+class TestUploads:
+    """Test chunked upload reading"""
+    
+    def test_upload_parsed_from_memory(self, client, monkeypatch):
+        """Uploads are parsed without writing a temp file"""
+        def no_tempfile(*args, **kwargs):
+            raise AssertionError("upload should not touch disk")
+        monkeypatch.setattr("tempfile.NamedTemporaryFile", no_tempfile)
+        
+        response = client.post("/upload", files={"file": ("jane.txt", CV_TEXT, "text/plain")})
+        
+        assert response.status_code == 200
+        assert "python" in response.json()["extracted_data"]["skills"]
+    
+    def test_oversized_upload_rejected(self, client, upload_limit_mb):
+        """Files above max_upload_size_mb get 413"""
+        payload = CV_TEXT + b"x" * (upload_limit_mb * 1024 * 1024)
+        response = client.post("/upload", files={"file": ("big.txt", payload, "text/plain")})
+        
+        assert response.status_code == 413
+    
+    def test_upload_at_limit_accepted(self, client, upload_limit_mb):
+        """Files within the limit are read completely"""
+        padding = b"\n" * (upload_limit_mb * 1024 * 1024 - len(CV_TEXT))
+        response = client.post("/upload", files={"file": ("edge.txt", CV_TEXT + padding, "text/plain")})
+        
+        assert response.status_code == 200
@@ -0,0 +1,107 @@
+"""
+Unit tests for the raw-profile artifact sinks
+"""
+import gzip
+import json
+import os
+import time
+
+from src.agents.agent1_parser import RawParser
+from src.core.config import ArtifactsConfig
+from src.core.metrics import FALLBACKS
+from src.storage.artifacts import (
+    ArtifactSink,
+    BackgroundSink,
+    JsonFileSink,
+    JsonlGzipSink,
+    create_artifact_sink,
+    _enforce_retention,
+)
+
+
+CV_TEXT = "Jane Roe\nEXPERIENCE\nData Engineer, 4 years\nSKILLS\nPython, SQL, Spark\n"
+
+
+def read_jsonl_gz(directory):
+    records = []
+    for path in sorted(directory.glob("artifacts-*.jsonl.gz")):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f)
+    return records
+
+
+class TestArtifactSinks:
+    """Test the sink modes"""
+    
+    def test_off_writes_nothing(self, tmp_path):
+        """Mode 'off' parses without touching the output directory"""
+        sink = create_artifact_sink(ArtifactsConfig(mode="off", output_dir=str(tmp_path / "out")))
+        parser = RawParser(artifact_sink=sink)
+        
+        result = parser.parse_bytes(CV_TEXT.encode(), "cv.txt")
+        
+        assert result["profile_id"] == "profile_cv"
+        assert not (tmp_path / "out").exists()
+    
+    def test_jsonl_gz_round_trip(self, tmp_path):
+        """Each write_many appends a readable gzip member"""
+        sink = JsonlGzipSink(tmp_path)
+        sink.write("raw_profile", "p1", {"raw_text": "a"})
+        sink.write_many([("raw_profile", "p2", {"raw_text": "b"}), ("raw_profile", "p3", {})])
+        
+        records = read_jsonl_gz(tmp_path)
+        
+        assert [r["id"] for r in records] == ["p1", "p2", "p3"]
+        assert records[0]["kind"] == "raw_profile"
+        assert records[1]["data"] == {"raw_text": "b"}
+    
+    def test_json_mode_keeps_legacy_layout(self, tmp_path):
+        """Mode 'json' writes <profile_id>.json files"""
+        JsonFileSink(tmp_path).write("raw_profile", "profile_cv", {"profile_id": "profile_cv"})
+        
+        with open(tmp_path / "profile_cv.json", encoding="utf-8") as f:
+            assert json.load(f)["profile_id"] == "profile_cv"
+    
+    def test_background_flush(self, tmp_path):
+        """Queued parser artifacts reach disk after flush()"""
+        sink = BackgroundSink(JsonlGzipSink(tmp_path))
+        parser = RawParser(artifact_sink=sink)
+        
+        for name in ("a.txt", "b.txt"):
+            parser.parse_bytes(CV_TEXT.encode(), name)
+        sink.flush(timeout=5)
+        
+        assert [r["id"] for r in read_jsonl_gz(tmp_path)] == ["profile_a", "profile_b"]
+        sink.close()
+    
+    def test_full_queue_drops(self):
+        """A full queue drops artifacts instead of blocking the caller"""
+        class SlowSink(ArtifactSink):
+            def write_many(self, records):
+                time.sleep(0.2)
+        
+        before = FALLBACKS.get(component="artifacts", reason="queue_full")
+        sink = BackgroundSink(SlowSink(), queue_size=1)
+        for i in range(5):
+            sink.write("raw_profile", str(i), {})
+        
+        assert FALLBACKS.get(component="artifacts", reason="queue_full") > before
+        sink.close()
+    
+    def test_retention(self, tmp_path):
+        """Old and surplus files are pruned, newest kept"""
+        now = time.time()
+        for i in range(5):
+            path = tmp_path / f"artifacts-{i}.jsonl.gz"
+            path.write_bytes(b"")
+            os.utime(path, (now - i * 60, now - i * 60))
+        stale = tmp_path / "artifacts-old.jsonl.gz"
+        stale.write_bytes(b"")
+        os.utime(stale, (now - 30 * 86400, now - 30 * 86400))
+        
+        removed = _enforce_retention(tmp_path, "artifacts-*.jsonl.gz", max_files=3, max_age_days=7)
+        
+        assert removed == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "artifacts-0.jsonl.gz", "artifacts-1.jsonl.gz", "artifacts-2.jsonl.gz"
+        ]
@@ -0,0 +1,75 @@
+"""
+Unit tests for the benchmark harness and synthetic data
+"""
+import json
+
+import pytest
+
+from benchmarks.harness import (
+    Case, BenchmarkResult, measure, build_report, write_report, compare_reports
+)
+from benchmarks.synthetic import SyntheticData
+
+
+@pytest.fixture(scope="module")
+def data():
+    return SyntheticData(seed=7)
+
+
+class TestSyntheticData:
+    """Test deterministic data generation"""
+    
+    def test_jobs_are_valid_and_deterministic(self, data):
+        """Same seed yields the same catalog of valid postings"""
+        jobs = data.jobs(25)
+        again = SyntheticData(seed=7).jobs(25)
+        
+        assert len(jobs) == 25
+        assert len({j.job_id for j in jobs}) == 25
+        assert [j.required_skills for j in jobs] == [j.required_skills for j in again]
+        assert all(j.required_skills for j in jobs)
+    
+    def test_cv_files_written(self, data, tmp_path):
+        """CVs are written as parseable text files"""
+        paths = data.write_cvs(tmp_path, 3)
+        
+        assert len(paths) == 3
+        text = open(paths[0], encoding="utf-8").read()
+        assert "SKILLS" in text and "@example.com" in text
+
+
+class TestHarness:
+    """Test timing, reports and comparison"""
+    
+    def test_measure_reports_throughput(self):
+        """Stats cover every round and setup runs untimed before each call"""
+        calls = []
+        case = Case(lambda: sum(range(1000)), items=10, setup=lambda: calls.append(1))
+        result = measure("sum", case, rounds=4, warmup=1)
+        
+        assert result.rounds == 4
+        assert len(calls) == 5
+        assert result.min_ms <= result.median_ms <= result.max_ms
+        assert result.throughput_per_s > 0
+    
+    def test_report_round_trip(self, tmp_path):
+        """Reports written to a directory get a generated file name"""
+        result = measure("noop", Case(lambda: None), rounds=2)
+        report = build_report([result, BenchmarkResult.skip("ml", "no model")], {"jobs": 1})
+        path = write_report(report, tmp_path)
+        
+        loaded = json.loads(path.read_text())
+        assert path.suffix == ".json"
+        assert loaded["results"]["ml"]["skipped"] == "no model"
+        assert loaded["meta"]["params"] == {"jobs": 1}
+    
+    def test_compare_flags_regressions(self):
+        """Per-item slowdowns beyond the threshold are regressions"""
+        def report(mean_ms, items):
+            return {"results": {"score_all": {"mean_ms": mean_ms, "items_per_call": items}}}
+        
+        same_rate = compare_reports(report(10.0, 100), report(20.0, 200))
+        slower = compare_reports(report(10.0, 100), report(15.0, 100), threshold=0.10)
+        
+        assert same_rate[0]["regression"] is False
+        assert slower[0]["regression"] is True
@@ -0,0 +1,101 @@
+"""
+Unit tests for the circuit breaker and its use around Ollama calls
+"""
+import copy
+
+import pytest
+
+from src.agents.agent4_llm_explainer import LLMExplainerAgent
+from src.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.core.config import get_config
+from src.core.metrics import FALLBACKS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("test", failure_threshold=2, reset_timeout=1.0, max_reset_timeout=3.0, clock=clock)
+
+
+class TestCircuitBreaker:
+    """Test state transitions and backoff"""
+    
+    def test_opens_after_consecutive_failures(self, breaker):
+        """A success resets the count; threshold failures in a row open it"""
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        
+        breaker.record_failure(ValueError("boom"))
+        
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+        assert breaker.snapshot()["last_error"] == "ValueError: boom"
+    
+    def test_half_open_allows_single_trial(self, breaker, clock):
+        """After the timeout one trial goes through; success closes the circuit"""
+        breaker.trip()
+        clock.now = 1.0
+        
+        assert breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CLOSED and breaker.allow_request()
+    
+    def test_failed_trials_back_off(self, breaker, clock):
+        """Each failed trial doubles the wait, up to the cap"""
+        breaker.trip()
+        waits = []
+        for _ in range(3):
+            clock.now += breaker.retry_in()
+            assert breaker.allow_request()
+            breaker.record_failure()
+            waits.append(breaker.retry_in())
+        
+        assert waits == [2.0, 3.0, 3.0]
+    
+    def test_probe_recovery_skips_backoff(self, breaker):
+        """allow_trial() lets the next call through immediately"""
+        breaker.trip("probe failed")
+        breaker.allow_trial()
+        
+        assert breaker.allow_request()
+
+
+class TestExplainerCircuit:
+    """Test fast fallback when Ollama keeps failing"""
+    
+    def test_open_circuit_skips_llm(self, sample_match, monkeypatch):
+        """Once open, explanations fall back without calling Ollama"""
+        config = copy.deepcopy(get_config())
+        config.llm.breaker_failure_threshold = 2
+        agent = LLMExplainerAgent(config)
+        agent.llm_available = True
+        calls = []
+        
+        def failing_call(match_result):
+            calls.append(match_result)
+            raise ConnectionError("ollama down")
+        monkeypatch.setattr(agent, "_generate_llm_explanation", failing_call)
+        before = FALLBACKS.get(component="llm", reason="circuit_open")
+        
+        explanations = [agent.generate_explanation(sample_match) for _ in range(4)]
+        
+        assert len(calls) == 2
+        assert all(len(text) > 50 for text in explanations)
+        assert FALLBACKS.get(component="llm", reason="circuit_open") == before + 2
+        assert agent.health()["circuit"]["state"] == OPEN
@@ -0,0 +1,55 @@
+"""
+Unit tests for rule-based explanation templates
+"""
+import os
+import subprocess
+import sys
+
+from src.agents.agent4_llm_explainer import LLMExplainerAgent
+from src.agents.explanation_templates import Bands, pick_variant
+from src.core.config import get_config
+
+
+class TestBands:
+    """Test score band lookup"""
+    
+    def test_lower_bounds_inclusive(self):
+        """A score on a bound gets that band; below the lowest gets the default"""
+        bands = Bands([(0.85, "high"), (0.70, "mid")], below=None)
+        
+        assert [bands[s] for s in (0.9, 0.85, 0.849, 0.70, 0.69)] == ["high", "high", "mid", "mid", None]
+    
+    def test_variant_stable_across_processes(self):
+        """The phrasing picked for a key does not depend on hash randomization"""
+        choices = ("a", "b", "c")
+        code = (
+            "from src.agents.explanation_templates import pick_variant;"
+            "print(pick_variant(('a', 'b', 'c'), 'Jane Roe'))"
+        )
+        picked = {
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed}
+            ).stdout.strip()
+            for seed in ("1", "2", "3")
+        }
+        
+        assert picked == {pick_variant(choices, "Jane Roe")}
+
+
+class TestRuleBasedExplanation:
+    """Test the fallback explanation built from templates"""
+    
+    def test_explanation_content(self, sample_match):
+        """Score, skill names and the shortlist recommendation are included"""
+        agent = LLMExplainerAgent(get_config())
+        explanation = agent._generate_rule_based_explanation(sample_match)
+        
+        assert "82%" in explanation
+        assert "Excellent technical proficiency demonstrated in Python, Django" in explanation
+        assert explanation.endswith(
+            "Proceed with technical interview focusing on Python, Django, PostgreSQL. "
+            "Verify proficiency in matched skills and assess learning agility for gaps."
+        )
+        assert agent._generate_rule_based_explanation(sample_match) == explanation
+        agent.close()
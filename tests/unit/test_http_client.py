@@ -0,0 +1,38 @@
+"""
+Unit tests for pooled outbound HTTP sessions
+"""
+
+from benchmarks.stub_ollama import DEFAULT_RESPONSE
+from src.agents.agent4_llm_explainer import LLMExplainerAgent
+from src.core.http_client import pooled_session
+from src.core.metrics import HTTP_CONNECTIONS
+
+
+def connections(client):
+    return {result: HTTP_CONNECTIONS.get(client=client, result=result) for result in ("new", "reused")}
+
+
+class TestPooledSession:
+    """Test keep-alive reuse and its metrics"""
+    
+    def test_connection_reused(self, stub):
+        """Sequential calls share one connection, counted as new then reused"""
+        session = pooled_session("test_pool", pool_maxsize=2)
+        before = connections("test_pool")
+        
+        for _ in range(3):
+            assert session.get(f"{stub.base_url}/api/tags", timeout=(1, 5)).status_code == 200
+        
+        after = connections("test_pool")
+        assert stub.connections == 1
+        assert after["new"] - before["new"] == 1
+        assert after["reused"] - before["reused"] == 2
+    
+    def test_explainer_uses_session(self, stub, stub_config, sample_match):
+        """Probe and explanation go over the explainer's pooled connection"""
+        agent = LLMExplainerAgent(stub_config)
+        
+        assert agent.llm_available
+        assert agent.generate_explanation(sample_match) == DEFAULT_RESPONSE
+        assert (stub.connections, stub.requests) == (1, 1)
+        agent.close()
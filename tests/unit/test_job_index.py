@@ -0,0 +1,95 @@
+"""
+Unit tests for the /jobs search index
+"""
+import re
+
+import pytest
+
+from benchmarks.synthetic import SyntheticData
+from src.core.job_index import JobFilter, JobIndex, bitset, positions
+from src.core.skill_registry import get_skill_registry
+
+
+def words(text):
+    return re.findall(r"[a-z0-9+#]+", text.lower())
+
+
+def prefix_match(query, text):
+    return all(any(word.startswith(term) for word in words(text)) for term in words(query))
+
+
+def scan(jobs, query):
+    """Reference: the same filters as a list comprehension"""
+    registry = get_skill_registry()
+    wanted = [registry.id_of(skill) for skill in query.skills.split(",")] if query.skills else []
+    
+    def keep(job):
+        if query.q and not prefix_match(query.q, job.title):
+            return False
+        if query.location and not prefix_match(query.location, f"{job.location_city} {job.location_country}"):
+            return False
+        if wanted:
+            held = registry.intern_all(job.required_skills + job.preferred_skills)
+            check = all if query.skills_match == "all" else any
+            if not check(skill_id in held for skill_id in wanted):
+                return False
+        for field in ("seniority_level", "remote_type", "employment_type"):
+            values = getattr(query, field)
+            if values and getattr(job, field) not in values.split(","):
+                return False
+        if query.max_experience is not None and job.min_experience_years > query.max_experience:
+            return False
+        if query.min_experience is not None and job.max_experience_years < query.min_experience:
+            return False
+        return True
+    
+    return [i for i, job in enumerate(jobs) if keep(job)]
+
+
+@pytest.fixture(scope="module")
+def jobs():
+    return SyntheticData(seed=11).jobs(1500)
+
+
+@pytest.fixture(scope="module")
+def index(jobs):
+    return JobIndex(jobs)
+
+
+QUERIES = [
+    JobFilter(q="senior"),
+    JobFilter(q="Data Sci", remote_type="remote"),
+    JobFilter(skills="Python, JS, k8s"),
+    JobFilter(skills="python,docker", skills_match="all"),
+    JobFilter(seniority_level="mid,senior", min_experience=2, max_experience=5),
+    JobFilter(location="b", remote_type="hybrid,on-site"),
+    JobFilter(q="engineer", skills="aws", min_experience=4.5),
+    JobFilter(skills="no-such-skill"),
+]
+
+
+class TestJobIndex:
+    """Test indexed filtering against a scan of the catalog"""
+    
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_matches_scan(self, index, jobs, query):
+        """Totals and pages equal a linear scan with the same filters"""
+        expected = scan(jobs, query)
+        total, page = index.search(query, skip=5, limit=30)
+        
+        assert total == len(expected)
+        assert page == expected[5:35]
+    
+    def test_unfiltered_query_inactive(self):
+        """Blank parameters do not count as filters"""
+        assert not JobFilter(q="  ", skills=",").active
+        assert JobFilter(min_experience=0).active
+    
+    def test_bitset_roundtrip(self):
+        """Positions survive a bitset round trip, with pagination"""
+        items = [0, 7, 8, 9, 63, 64, 1000]
+        mask = bitset(items, 1001)
+        
+        assert positions(mask) == items
+        assert positions(mask, skip=2, limit=3) == [8, 9, 63]
+        assert positions(0) == []
@@ -0,0 +1,61 @@
+"""
+Unit tests for central logging setup
+"""
+import json
+import logging
+
+import pytest
+
+from src.core.config import (
+    LoggingConfig,
+    JsonLogFormatter,
+    setup_logging,
+    should_log_request_summary,
+    get_config,
+)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestLoggingSetup:
+    """Test formatter, handler installation and sampling"""
+    
+    def test_json_formatter_includes_extra(self):
+        """Extra fields land in the JSON object next to the message"""
+        record = logging.LogRecord("src.test", logging.INFO, __file__, 1, "done in %dms", (12,), None)
+        record.request_id = "req_123"
+        record.timings_ms = {"parse": 1.5}
+        
+        payload = json.loads(JsonLogFormatter().format(record))
+        
+        assert payload["message"] == "done in 12ms"
+        assert payload["level"] == "INFO"
+        assert payload["request_id"] == "req_123"
+        assert payload["timings_ms"] == {"parse": 1.5}
+    
+    def test_setup_is_idempotent(self, restore_root_logger):
+        """Re-applying replaces our handler instead of stacking another"""
+        root = restore_root_logger
+        setup_logging(LoggingConfig(level="DEBUG", format="json"), force=True)
+        setup_logging(LoggingConfig(level="WARNING"), force=True)
+        
+        ours = [h for h in root.handlers if getattr(h, "_recruiter_handler", False)]
+        assert len(ours) == 1
+        assert not isinstance(ours[0].formatter, JsonLogFormatter)
+        assert root.level == logging.WARNING
+    
+    def test_summary_sampling(self, monkeypatch):
+        """Sample rate 0 disables summaries, 1 always logs"""
+        logging_config = get_config().logging
+        monkeypatch.setattr(logging_config, "request_summary_sample_rate", 0.0)
+        assert not any(should_log_request_summary() for _ in range(50))
+        
+        monkeypatch.setattr(logging_config, "request_summary_sample_rate", 1.0)
+        assert all(should_log_request_summary() for _ in range(50))
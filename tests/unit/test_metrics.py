@@ -0,0 +1,86 @@
+"""
+Unit tests for the in-process metrics registry
+"""
+import pytest
+
+from src.core.metrics import MetricsRegistry, REGISTRY, STAGE_LATENCY
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestMetrics:
+    """Test counters, gauges and histograms"""
+    
+    def test_counter_with_labels(self, registry):
+        """Counters accumulate per label set"""
+        counter = registry.counter("test_events_total", "Test events", ["result"])
+        counter.inc(result="hit")
+        counter.inc(2, result="hit")
+        counter.inc(result="miss")
+        
+        assert counter.get(result="hit") == 3
+        assert counter.get(result="miss") == 1
+    
+    def test_counter_rejects_negative(self, registry):
+        """Counters cannot decrease"""
+        counter = registry.counter("test_total", "Test")
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+    
+    def test_wrong_labels_rejected(self, registry):
+        """Label names must match the declaration"""
+        counter = registry.counter("test_labeled_total", "Test", ["stage"])
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+    
+    def test_gauge_tracks_inprogress(self, registry):
+        """In-progress tracking returns the gauge to its prior value"""
+        gauge = registry.gauge("test_in_progress", "Test")
+        with gauge.track_inprogress():
+            assert gauge.get() == 1
+        assert gauge.get() == 0
+    
+    def test_histogram_buckets(self, registry):
+        """Observations land in cumulative buckets"""
+        hist = registry.histogram("test_seconds", "Test", buckets=(0.1, 1.0))
+        hist.observe(0.05)
+        hist.observe(0.5)
+        hist.observe(5.0)
+        
+        text = registry.render()
+        assert 'test_seconds_bucket{le="0.1"} 1' in text
+        assert 'test_seconds_bucket{le="1"} 2' in text
+        assert 'test_seconds_bucket{le="+Inf"} 3' in text
+        assert "test_seconds_count 3" in text
+        assert hist.sum() == pytest.approx(5.55)
+    
+    def test_histogram_timer(self, registry):
+        """time() records one observation per block"""
+        hist = registry.histogram("test_timer_seconds", "Test", ["stage"])
+        with hist.time(stage="parse"):
+            pass
+        assert hist.count(stage="parse") == 1
+    
+    def test_render_format(self, registry):
+        """Rendered text carries HELP/TYPE headers and label sets"""
+        registry.counter("test_fallbacks_total", "Fallbacks", ["component"]).inc(component="llm")
+        text = registry.render()
+        
+        assert "# HELP test_fallbacks_total Fallbacks" in text
+        assert "# TYPE test_fallbacks_total counter" in text
+        assert 'test_fallbacks_total{component="llm"} 1' in text
+    
+    def test_duplicate_registration_returns_existing(self, registry):
+        """Re-registering a name returns the same metric"""
+        first = registry.counter("test_dup_total", "Test")
+        assert registry.counter("test_dup_total", "Test") is first
+        with pytest.raises(ValueError):
+            registry.gauge("test_dup_total", "Test")
+    
+    def test_application_metrics_registered(self):
+        """Pipeline stage histogram is part of the global registry"""
+        assert REGISTRY.get("recruiter_pipeline_stage_seconds") is STAGE_LATENCY
+        assert "recruiter_job_catalog_size" in REGISTRY.render()
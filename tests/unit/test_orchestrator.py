@@ -0,0 +1,228 @@
+"""
+Unit tests for the staged matching orchestrator
+"""
+import pytest
+
+from src.core.orchestrator import (
+    MatchingPipeline,
+    MatchContext,
+    PipelineStage,
+    ScoreStage,
+    CandidateFilterStage,
+)
+from src.storage.models import JobPosting, DecisionType
+
+
+CV_TEXT = """
+John Doe
+Email: john.doe@example.com
+Phone: +1-555-0123
+
+EXPERIENCE
+Senior Python Developer at Tech Corp (2019-2024) - 5 years of experience
+Developed REST APIs using FastAPI and PostgreSQL, deployed with Docker
+
+SKILLS
+Python, FastAPI, PostgreSQL, Docker, Git, Linux
+
+EDUCATION
+Bachelor of Science in Computer Science
+"""
+
+
+def make_job(job_id: str, title: str, skills: list) -> JobPosting:
+    return JobPosting(
+        job_id=job_id,
+        title=title,
+        company_name="Acme",
+        location_city="Cairo",
+        remote_type="remote",
+        employment_type="full-time",
+        seniority_level="mid",
+        min_experience_years=3,
+        max_experience_years=6,
+        description=f"{title} position requiring {', '.join(skills)}",
+        required_skills=skills,
+        posted_date="2026-01-01"
+    )
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return MatchingPipeline(save_to_db=False)
+
+
+@pytest.fixture
+def cv_file(tmp_path):
+    path = tmp_path / "john_doe.txt"
+    path.write_text(CV_TEXT, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def jobs():
+    return [
+        make_job("job_py", "Python Developer", ["python", "fastapi", "docker"]),
+        make_job("job_js", "Frontend Developer", ["react", "javascript", "css"]),
+        make_job("job_data", "Data Engineer", ["python", "spark", "airflow"]),
+    ]
+
+
+class TestMatchingPipeline:
+    """Test the staged pipeline"""
+    
+    def test_default_stage_order(self, pipeline):
+        """Stages run in the documented order"""
+        assert list(pipeline.stages) == [
+            "parse", "extract", "candidate_filter", "score",
+            "decide", "explain", "persist"
+        ]
+    
+    def test_batch_records_stage_timings(self, pipeline, cv_file, jobs):
+        """Every stage plus the total is timed"""
+        pipeline.process_cv_batch(cv_file, jobs, top_k=2, generate_explanations=False)
+        
+        for stage in pipeline.stages:
+            assert pipeline.last_timings[stage] >= 0.0
+        assert pipeline.last_timings["total"] >= pipeline.last_timings["score"]
+    
+    def test_batch_returns_sorted_top_k(self, pipeline, cv_file, jobs):
+        """Batch results are ranked and truncated to top_k"""
+        results = pipeline.process_cv_batch(cv_file, jobs, top_k=2, generate_explanations=False)
+        
+        assert len(results) == 2
+        assert results[0].final_score >= results[1].final_score
+        assert results[0].job_id == "job_py"
+    
+    def test_single_matches_batch_score(self, pipeline, cv_file, jobs):
+        """Single-job and batch paths share the same stages and scores"""
+        single = pipeline.process_cv_for_job(cv_file, jobs[0], generate_explanation=False)
+        batch = pipeline.process_cv_batch(cv_file, jobs, top_k=3, generate_explanations=False)
+        
+        batch_score = next(r.final_score for r in batch if r.job_id == jobs[0].job_id)
+        assert single.final_score == pytest.approx(batch_score)
+        assert single.decision.decision in list(DecisionType)
+    
+    def test_in_memory_upload_matches_file(self, pipeline, cv_file, jobs):
+        """CV bytes parse to the same scores as the file on disk"""
+        from_file = pipeline.process_cv_for_job(cv_file, jobs[0], generate_explanation=False)
+        with open(cv_file, "rb") as f:
+            from_bytes = pipeline.process_cv_for_job(
+                "john_doe.txt", jobs[0], generate_explanation=False, cv_bytes=f.read()
+            )
+        
+        assert from_bytes.final_score == pytest.approx(from_file.final_score)
+        assert from_bytes.candidate_name == from_file.candidate_name
+    
+    def test_explanations_only_above_floor(self, pipeline, cv_file, jobs):
+        """Batch explanations respect the configured score floor"""
+        results = pipeline.process_cv_batch(cv_file, jobs, top_k=3, generate_explanations=True)
+        floor = pipeline.config.pipeline.explain_min_score
+        
+        for result in results:
+            if result.final_score >= floor:
+                assert result.decision.explanation
+            else:
+                assert result.decision.explanation is None
+    
+    def test_explanations_off_when_llm_disabled(self, pipeline, cv_file, jobs, monkeypatch):
+        """llm.enabled: false skips the explain stage"""
+        monkeypatch.setattr(pipeline.config.llm, "enabled", False)
+        results = pipeline.process_cv_batch(cv_file, jobs, top_k=3, generate_explanations=True)
+        
+        assert all(result.decision.explanation is None for result in results)
+    
+    def test_explained_result_built_once(self, pipeline, cv_file, jobs, monkeypatch):
+        """The explain stage fills in the MatchResult that is returned"""
+        monkeypatch.setattr(pipeline.config.pipeline, "explain_min_score", 0.0)
+        explained = []
+        
+        def explain(match_results, use_llm=True):
+            explained.extend(match_results)
+            return [f"explained {result.job_id}" for result in match_results]
+        
+        monkeypatch.setattr(pipeline.agent4, "generate_explanations", explain, raising=False)
+        results = pipeline.process_cv_batch(cv_file, jobs, top_k=3, generate_explanations=True)
+        
+        assert len(results) == 3
+        assert {id(result) for result in results} == {id(result) for result in explained}
+        assert all(result.decision.explanation == f"explained {result.job_id}" for result in results)
+    
+    def test_score_stage_defers_breakdowns(self, pipeline, cv_file, jobs):
+        """Scored jobs hold compact records until a breakdown is needed"""
+        ctx = MatchContext(cv_file_path=cv_file, jobs=jobs)
+        for stage in ("parse", "extract", "candidate_filter", "score"):
+            pipeline.stages[stage].run(pipeline, ctx)
+        
+        assert all(item._score is None for item in ctx.scored)
+        item = ctx.scored[0]
+        expected = pipeline.agent3.score_match(ctx.cv, item.job)
+        assert item.score.model_dump() == expected.model_dump()
+        assert item.score is item._score
+    
+    def test_only_returned_matches_materialized(self, pipeline, cv_file, jobs):
+        """By default (persist_scope top_k) jobs outside top_k get no decision or breakdown"""
+        ctx = pipeline.run(MatchContext(cv_file_path=cv_file, jobs=jobs, top_k=1))
+        unselected = [item for item in ctx.scored if item not in ctx.selected]
+        
+        assert len(ctx.results) == 1 and len(unselected) == 2
+        assert all(item.decision is None and item._score is None for item in unselected)
+    
+    def test_short_text_rejected(self, pipeline, tmp_path, jobs):
+        """Parse stage rejects files without meaningful text"""
+        path = tmp_path / "empty.txt"
+        path.write_text("too short", encoding="utf-8")
+        
+        with pytest.raises(ValueError):
+            pipeline.process_cv_for_job(str(path), jobs[0], generate_explanation=False)
+
+
+class TestStagePlugging:
+    """Test stage replacement and concurrency"""
+    
+    def test_replace_stage(self, cv_file, jobs):
+        """A swapped-in stage is used by subsequent runs"""
+        pipeline = MatchingPipeline(save_to_db=False)
+        calls = []
+        
+        class CountingScoreStage(ScoreStage):
+            def run(self, pipeline, ctx):
+                calls.append(len(ctx.candidates))
+                super().run(pipeline, ctx)
+        
+        pipeline.replace_stage("score", CountingScoreStage())
+        pipeline.process_cv_batch(cv_file, jobs, top_k=1, generate_explanations=False)
+        
+        assert calls == [3]
+    
+    def test_replace_unknown_stage(self, pipeline):
+        """Unknown stage names are rejected"""
+        with pytest.raises(KeyError):
+            pipeline.replace_stage("nonexistent", PipelineStage())
+    
+    def test_concurrent_map_preserves_order(self):
+        """Threaded map keeps input order"""
+        stage = PipelineStage(max_workers=4)
+        assert stage.map(lambda x: x * 2, list(range(20))) == [x * 2 for x in range(20)]
+    
+    def test_candidate_filter(self, pipeline, cv_file, jobs):
+        """Overlap filter drops jobs sharing no required skills with the CV"""
+        ctx = MatchContext(cv_file_path=cv_file, jobs=jobs)
+        pipeline.stages["parse"].run(pipeline, ctx)
+        pipeline.stages["extract"].run(pipeline, ctx)
+        
+        CandidateFilterStage(min_skill_overlap=1).run(pipeline, ctx)
+        
+        assert {job.job_id for job in ctx.candidates} == {"job_py", "job_data"}
+    
+    def test_single_job_bypasses_candidate_filter(self, pipeline, cv_file, jobs):
+        """A single-job request is scored even when the filter would drop it"""
+        original = pipeline.stages["candidate_filter"]
+        pipeline.replace_stage("candidate_filter", CandidateFilterStage(min_skill_overlap=1))
+        try:
+            result = pipeline.process_cv_for_job(cv_file, jobs[1], generate_explanation=False)
+        finally:
+            pipeline.replace_stage("candidate_filter", original)
+        
+        assert result.job_id == "job_js"
+        assert result.decision.decision == DecisionType.REJECT
@@ -0,0 +1,133 @@
+"""
+Unit tests for process-isolated Agent 1 parsing
+"""
+import os
+import time
+
+import pytest
+
+from src.agents.agent1_parser import RawParser
+from src.agents.parse_pool import ParseWorkerPool, ParseTimeoutError, ParseWorkerError
+from src.core.config import ParsingConfig
+from src.storage.artifacts import ArtifactSink
+
+
+CV_TEXT = "Jane Roe\nEXPERIENCE\nData Engineer, 4 years\nSKILLS\nPython, SQL, Spark\n"
+
+
+# Worker tasks must be importable (picklable) by the spawned process
+def hang(parser, source, suffix):
+    time.sleep(30)
+
+
+def crash(parser, source, suffix):
+    os._exit(1)
+
+
+def allocate(parser, source, suffix):
+    return len(bytearray(512 * 1024 * 1024))
+
+
+def worker_pid(parser, source, suffix):
+    return str(os.getpid())
+
+
+def make_pool(**kwargs):
+    kwargs.setdefault("processes", 1)
+    kwargs.setdefault("timeout_seconds", 10)
+    return ParseWorkerPool(ParsingConfig(), **kwargs)
+
+
+class TestParseWorkerPool:
+    """Test isolation, limits and recycling"""
+    
+    def test_parser_uses_pool(self):
+        """RawParser sends PDF/DOCX to the pool and decodes plain text in-process"""
+        pool = make_pool(extract_fn=worker_pid)
+        try:
+            isolated = RawParser(artifact_sink=ArtifactSink(), worker_pool=pool)
+            local = RawParser(artifact_sink=ArtifactSink(), parsing_config=ParsingConfig())
+            
+            data = CV_TEXT.encode()
+            assert isolated.parse_bytes(data, "cv.txt")["raw_text"] == local.parse_bytes(data, "cv.txt")["raw_text"]
+            assert pool.stats["started"] == 0
+            assert isolated.parse_bytes(b"%PDF", "cv.pdf")["raw_text"] not in ("", str(os.getpid()))
+            assert pool.stats["started"] == 1
+            with pytest.raises(ValueError):
+                isolated.parse_bytes(data, "cv.rtf")
+        finally:
+            pool.close()
+    
+    def test_timeout_kills_worker(self):
+        """A hung document raises ParseTimeoutError and the worker is replaced"""
+        pool = make_pool(timeout_seconds=0.5, extract_fn=hang)
+        try:
+            started = time.monotonic()
+            with pytest.raises(ParseTimeoutError):
+                pool.extract_text(b"data", ".pdf")
+            
+            assert time.monotonic() - started < 10
+            assert pool.stats["timeouts"] == 1
+            assert pool._idle.empty()
+        finally:
+            pool.close()
+    
+    def test_crash_is_reported(self):
+        """A worker dying mid-document raises ParseWorkerError"""
+        pool = make_pool(extract_fn=crash)
+        try:
+            with pytest.raises(ParseWorkerError):
+                pool.extract_text(b"data", ".pdf")
+            assert pool.stats["crashes"] == 1
+        finally:
+            pool.close()
+    
+    @pytest.mark.skipif(os.name != "posix", reason="RLIMIT_AS is POSIX only")
+    def test_memory_limit(self):
+        """Allocations beyond the headroom fail with MemoryError"""
+        pool = make_pool(memory_limit_mb=128, extract_fn=allocate)
+        try:
+            with pytest.raises(MemoryError):
+                pool.extract_text(b"data", ".pdf")
+        finally:
+            pool.close()
+    
+    def test_recycle_after_max_documents(self):
+        """Workers are replaced after max_documents documents"""
+        pool = make_pool(max_documents=2, extract_fn=worker_pid)
+        try:
+            pids = [pool.extract_text(b"", ".txt") for _ in range(3)]
+            
+            assert pids[0] == pids[1] != pids[2]
+            assert pool.stats["recycled"] == 1
+        finally:
+            pool.close()
+    
+    def test_start_prestarts_workers(self):
+        """start() fills every slot up front and documents reuse those workers"""
+        pool = make_pool(processes=2, extract_fn=worker_pid)
+        try:
+            assert pool.start() == 2
+            assert pool.start() == 0
+            
+            pool.extract_many([(b"", ".txt"), (b"", ".txt")])
+            assert pool.stats["started"] == 2
+        finally:
+            pool.close()
+    
+    def test_parse_many_reports_failures(self):
+        """Bulk parsing keeps order and flags failed documents"""
+        pool = make_pool(processes=2)
+        try:
+            parser = RawParser(artifact_sink=ArtifactSink(), worker_pool=pool)
+            results = parser.parse_many([
+                (CV_TEXT.encode(), "a.txt"),
+                (b"data", "b.rtf"),
+                (CV_TEXT.encode(), "c.txt"),
+            ])
+            
+            assert [r["profile_id"] for r in results] == ["profile_a", "profile_b", "profile_c"]
+            assert "error" in results[1] and results[1]["raw_text"] == ""
+            assert "Python" in results[2]["raw_text"]
+        finally:
+            pool.close()
@@ -0,0 +1,99 @@
+"""
+Unit tests for Agent 1 streaming PDF extraction and in-memory parsing
+"""
+import io
+
+import pytest
+
+from src.agents.agent1_parser import RawParser
+from src.core.config import ParsingConfig
+
+fitz = pytest.importorskip("fitz")
+
+
+def make_pdf(pages):
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((50, 60), text, fontsize=10)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+CV_PAGE = "Jane Roe\nEXPERIENCE\nData Engineer, 4 years\nSKILLS\nPython, SQL, Spark"
+FILLER_PAGE = "PORTFOLIO\n" + "\n".join(f"Case study line {i}" for i in range(30))
+
+
+def parser_with(tmp_path, **budget):
+    return RawParser(output_dir=str(tmp_path), parsing_config=ParsingConfig(**budget))
+
+
+class TestPdfExtraction:
+    """Test page/char budgets and early stop"""
+    
+    def test_bytes_and_path_agree(self, tmp_path):
+        """In-memory extraction matches reading the same file from disk"""
+        data = make_pdf([CV_PAGE, "page two"])
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(data)
+        parser = parser_with(tmp_path, pdf_early_stop=False)
+        
+        assert parser.extract_text_from_pdf(data) == parser.extract_text_from_pdf(str(path))
+        assert "page two" in parser.extract_text_from_pdf(data)
+    
+    def test_early_stop_after_grace_page(self, tmp_path):
+        """Reading stops one page after experience and skills were seen"""
+        data = make_pdf([CV_PAGE, "References on request", FILLER_PAGE, "LAST PAGE"])
+        text = parser_with(tmp_path, pdf_early_stop_grace_pages=1).extract_text_from_pdf(data)
+        
+        assert "Python, SQL, Spark" in text
+        assert "References on request" in text
+        assert "PORTFOLIO" not in text
+    
+    def test_no_early_stop_without_sections(self, tmp_path):
+        """Documents missing the target sections are read to the budget"""
+        data = make_pdf(["Jane Roe", FILLER_PAGE, "LAST PAGE"])
+        text = parser_with(tmp_path).extract_text_from_pdf(data)
+        
+        assert "LAST PAGE" in text
+    
+    def test_page_budget(self, tmp_path):
+        """No more than pdf_max_pages pages are read"""
+        data = make_pdf([f"page {i}" for i in range(10)])
+        text = parser_with(tmp_path, pdf_max_pages=3, pdf_early_stop=False).extract_text_from_pdf(data)
+        
+        assert "page 2" in text
+        assert "page 3" not in text
+    
+    def test_char_budget(self, tmp_path):
+        """Text is truncated at pdf_max_chars"""
+        data = make_pdf([FILLER_PAGE] * 5)
+        text = parser_with(tmp_path, pdf_max_chars=500, pdf_early_stop=False).extract_text_from_pdf(data)
+        
+        assert len(text) == 500
+
+
+class TestParseBytes:
+    """Test in-memory parsing of uploads"""
+    
+    def test_txt_bytes(self, tmp_path):
+        """TXT uploads decode (with latin-1 fallback) and segment"""
+        parser = parser_with(tmp_path)
+        result = parser.parse_bytes("Café Owner\nSKILLS\nPython".encode("latin-1"), "cv.txt")
+        
+        assert result["profile_id"] == "profile_cv"
+        assert "Python" in result["sections"]["skills_block"]
+    
+    def test_buffer_types(self, tmp_path):
+        """bytes, bytearray, memoryview and BytesIO parse identically"""
+        parser = parser_with(tmp_path)
+        data = make_pdf([CV_PAGE])
+        expected = parser.parse_bytes(data, "cv.pdf")["raw_text"]
+        
+        for source in (bytearray(data), memoryview(data), io.BytesIO(data)):
+            assert parser.parse_bytes(source, "cv.pdf")["raw_text"] == expected
+    
+    def test_unsupported_extension(self, tmp_path):
+        """Unknown formats are rejected"""
+        with pytest.raises(ValueError):
+            parser_with(tmp_path).parse_bytes(b"data", "cv.rtf")
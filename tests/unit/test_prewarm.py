@@ -0,0 +1,150 @@
+"""
+Unit tests for the explanation cache and idle-time pre-generation
+"""
+import pytest
+
+from benchmarks.stub_ollama import DEFAULT_RESPONSE
+from src.agents.agent4_llm_explainer import LLMExplainerAgent
+from src.core.config import PrewarmConfig
+from src.core.explanation_cache import ExplanationCache
+from src.core.orchestrator import MatchingPipeline
+from src.core.prewarm import ExplanationPrewarmer
+
+from .test_orchestrator import CV_TEXT, make_job
+
+
+@pytest.fixture
+def pipeline(stub_config):
+    pipeline = MatchingPipeline(config=stub_config, save_to_db=False)
+    yield pipeline
+    pipeline.agent4.close()
+
+
+@pytest.fixture
+def jobs():
+    return [
+        make_job("job_py", "Python Developer", ["python", "fastapi", "docker"]),
+        make_job("job_js", "Frontend Developer", ["react", "javascript", "css"]),
+        make_job("job_data", "Data Engineer", ["python", "spark", "airflow"]),
+    ]
+
+
+@pytest.fixture
+def cv_file(tmp_path):
+    path = tmp_path / "john_doe.txt"
+    path.write_text(CV_TEXT, encoding="utf-8")
+    return str(path)
+
+
+def make_prewarmer(pipeline, jobs, **overrides):
+    settings = dict(top_n=3, min_score=0.0)
+    settings.update(overrides)
+    busy = settings.pop("busy", lambda: False)
+    version = settings.pop("version", None)
+    return ExplanationPrewarmer(
+        pipeline, lambda: jobs, PrewarmConfig(**settings), version=version, busy=busy, load=lambda: 0.0
+    )
+
+
+class TestExplanationCache:
+    """Test LRU eviction and expiry"""
+    
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = ExplanationCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+        
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("A", None, "C")
+    
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are dropped"""
+        now = [0.0]
+        cache = ExplanationCache(ttl_seconds=10, clock=lambda: now[0])
+        cache.put("a", "A")
+        now[0] = 11.0
+        
+        assert cache.get("a") is None
+        assert len(cache) == 0
+    
+    def test_repeat_explanation_served_from_cache(self, stub_config, stub, sample_match):
+        """The same match is sent to the LLM only once"""
+        agent = LLMExplainerAgent(stub_config)
+        agent.llm_available = True
+        
+        assert agent.generate_explanation(sample_match) == DEFAULT_RESPONSE
+        assert agent.is_cached(sample_match)
+        assert agent.generate_explanation(sample_match) == DEFAULT_RESPONSE
+        assert stub.requests == 1
+        agent.close()
+    
+    def test_rule_based_request_skips_cache(self, stub_config, stub, sample_match):
+        """A use_llm=False call gets rule-based text, not the cached LLM text"""
+        agent = LLMExplainerAgent(stub_config)
+        agent.llm_available = True
+        agent.generate_explanation(sample_match)
+        
+        rule_based = agent._generate_rule_based_explanation(sample_match)
+        assert agent.generate_explanation(sample_match, use_llm=False) == rule_based
+        assert agent.generate_explanations([sample_match], use_llm=False) == [rule_based]
+        assert agent.llm_available
+        assert stub.requests == 1
+        agent.close()
+    
+    def test_rule_based_request_leaves_agent_shared_state(self, pipeline, stub, jobs, cv_file):
+        """use_llm=False is per request: the shared explainer stays available"""
+        pipeline.agent4.llm_available = True
+        pipeline.config.pipeline.explain_min_score = 0.0
+        matches = pipeline.process_cv_batch(cv_file, jobs, top_k=2, use_llm=False)
+        
+        assert matches and all(match.decision.explanation not in (None, DEFAULT_RESPONSE) for match in matches)
+        assert stub.requests == 0
+        assert pipeline.agent4._llm_available is True
+
+
+class TestExplanationPrewarmer:
+    """Test pre-generation and its throttles"""
+    
+    def test_prewarmed_match_needs_no_llm_call(self, pipeline, stub, jobs, cv_file):
+        """After a pass, a single match of a recent CV is answered from the cache"""
+        pipeline.process_cv_for_job(cv_file, jobs[0], generate_explanation=False)
+        assert len(pipeline.recent_cvs) == 1
+        
+        assert make_prewarmer(pipeline, jobs).run_once() == 3
+        assert stub.requests == 1  # One batched prompt
+        
+        stub.reset_counts()
+        match = pipeline.process_cv_for_job(cv_file, jobs[0])
+        assert match.decision.explanation == DEFAULT_RESPONSE
+        assert stub.requests == 0
+    
+    def test_skipped_while_busy(self, pipeline, stub, jobs, cv_file):
+        """Nothing is generated while requests are in flight"""
+        pipeline.process_cv_for_job(cv_file, jobs[0], generate_explanation=False)
+        
+        assert make_prewarmer(pipeline, jobs, busy=lambda: True).run_once() == 0
+        assert stub.requests == 0
+    
+    def test_hourly_budget(self, pipeline, jobs, cv_file):
+        """A pass stops at the hourly budget and resumes the CV later"""
+        pipeline.process_cv_for_job(cv_file, jobs[0], generate_explanation=False)
+        prewarmer = make_prewarmer(pipeline, jobs, budget_per_hour=2)
+        
+        assert prewarmer.run_once() == 2
+        assert prewarmer.run_once() == 0
+        assert prewarmer.stats()["budget_left"] == 0
+        assert prewarmer.stats()["cvs_done"] == 0
+    
+    def test_new_catalog_version_rewarms(self, pipeline, stub, jobs, cv_file):
+        """A catalog replaced in place (same list, same size) is detected by version"""
+        pipeline.process_cv_for_job(cv_file, jobs[0], generate_explanation=False)
+        version = ["v1"]
+        prewarmer = make_prewarmer(pipeline, jobs, version=lambda: version[0])
+        assert prewarmer.run_once() == 3
+        assert prewarmer.stats()["cvs_done"] == 1
+        
+        jobs[:] = [job.model_copy(update={"title": f"Senior {job.title}"}) for job in jobs]
+        version[0] = "v2"
+        assert prewarmer.run_once() == 3
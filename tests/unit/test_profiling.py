@@ -0,0 +1,82 @@
+"""
+Unit tests for request-scoped profiling
+"""
+import os
+import time
+
+import pytest
+
+from src.core.profiling import ProfileStore
+
+
+def busy_work():
+    return sum(i * i for i in range(20000))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(output_dir=str(tmp_path / "profiles"), max_profiles=3)
+
+
+class TestProfileStore:
+    """Test profile capture, retention and lookup"""
+    
+    def test_requested_capture_writes_files(self, store):
+        """An opted-in request produces pstats and text summary"""
+        with store.profile("req_abc123", requested=True) as profile_id:
+            busy_work()
+        
+        assert profile_id == "req_abc123"
+        assert store.get_profile_path("req_abc123", "pstats") is not None
+        summary = store.get_profile_path("req_abc123", "txt").read_text()
+        assert "busy_work" in summary
+    
+    def test_not_requested_skips_capture(self, store):
+        """Without opt-in or admin toggle nothing is captured"""
+        with store.profile("req_plain") as profile_id:
+            busy_work()
+        
+        assert profile_id is None
+        assert store.list_profiles() == []
+    
+    def test_admin_toggle_profiles_every_request(self, store):
+        """Enabled store captures requests that did not opt in"""
+        store.enabled = True
+        with store.profile("req_global") as profile_id:
+            busy_work()
+        
+        assert profile_id == "req_global"
+        assert [p["profile_id"] for p in store.list_profiles()] == ["req_global"]
+    
+    def test_retention_prunes_oldest(self, store):
+        """Only max_profiles captures are kept"""
+        for i in range(5):
+            with store.profile(f"req_{i}", requested=True):
+                busy_work()
+            # Spread mtimes so ordering is deterministic
+            path = store.get_profile_path(f"req_{i}")
+            stamp = time.time() - 100 + i
+            os.utime(path, (stamp, stamp))
+        store._prune()
+        
+        kept = [p["profile_id"] for p in store.list_profiles()]
+        assert kept == ["req_4", "req_3", "req_2"]
+        assert store.get_profile_path("req_0", "txt") is None
+    
+    def test_concurrent_capture_runs_unprofiled(self, store):
+        """A second request while one is profiled is not captured"""
+        with store.profile("req_outer", requested=True) as outer:
+            with store.profile("req_inner", requested=True) as inner:
+                busy_work()
+        
+        assert outer == "req_outer"
+        assert inner is None
+    
+    def test_unsafe_ids_rejected(self, store):
+        """IDs that are not plain file names are never used"""
+        with store.profile("../escape", requested=True) as profile_id:
+            pass
+        
+        assert profile_id is None
+        assert store.get_profile_path("../escape") is None
+        assert store.get_profile_path("req_abc", "html") is None
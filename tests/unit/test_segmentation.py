@@ -0,0 +1,60 @@
+"""
+Unit tests for Agent 1 section spans and their use by Agent 2
+"""
+from src.agents.agent1_parser import RawParser, segment_spans, section_text
+from src.agents.agent2_extractor import CandidateExtractor
+from src.core.config import ParsingConfig
+from src.storage.artifacts import ArtifactSink
+
+
+CV_TEXT = """Jane Roe
+jane@example.com
+Summary
+Data engineer, took BA electives
+EXPERIENCE
+Data Engineer at Acme (2019-2024)
+Skills
+Python, SQL
+Education
+Master of Science in Computer Science
+Work Experience
+Intern at Beta (2018-2019)"""
+
+
+class TestSegmentation:
+    """Test one-pass segmentation"""
+    
+    def test_spans_cover_section_bodies(self):
+        """Spans exclude header lines and point into the original text"""
+        spans = segment_spans(CV_TEXT)
+        
+        assert section_text(CV_TEXT, spans["contact"]) == "Jane Roe\njane@example.com"
+        assert section_text(CV_TEXT, spans["skills"]) == "Python, SQL"
+        assert len(spans["experience"]) == 2
+        assert section_text(CV_TEXT, spans["experience"]).endswith("Intern at Beta (2018-2019)")
+    
+    def test_headers_match_whole_lines_only(self):
+        """Header words inside a sentence do not start a section"""
+        spans = segment_spans("Jane Roe\nMy skills are great\n  SKILLS  \nGo")
+        
+        assert section_text("Jane Roe\nMy skills are great\n  SKILLS  \nGo", spans["contact"]).endswith("great")
+        assert len(spans["skills"]) == 1
+    
+    def test_profile_exposes_spans(self):
+        """Raw profiles carry section_spans alongside the legacy blocks"""
+        parser = RawParser(artifact_sink=ArtifactSink(), parsing_config=ParsingConfig())
+        profile = parser.parse_profile(CV_TEXT, "p1")
+        
+        assert profile["sections"]["skills_block"] == "Python, SQL"
+        assert profile["sections"]["experience_block"].startswith("Data Engineer at Acme")
+        start, end = profile["section_spans"]["education"][0]
+        assert profile["raw_text"][start:end].startswith("Master of Science")
+    
+    def test_extractor_reads_education_section(self):
+        """With spans, degrees come from the education section only"""
+        extractor = CandidateExtractor()
+        spans = segment_spans(CV_TEXT)
+        
+        assert extractor.extract(CV_TEXT)["education"] == ["Bachelor's", "Master's"]
+        assert extractor.extract(CV_TEXT, sections=spans)["education"] == ["Master's"]
+        assert extractor.extract(CV_TEXT, sections=spans)["email"] == "jane@example.com"
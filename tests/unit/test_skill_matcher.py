@@ -0,0 +1,126 @@
+"""
+Unit tests for one-pass skill matching and its parity with the old extractors
+"""
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic import SyntheticData
+from src.agents.agent2_extractor import CandidateExtractor
+from src.utils.skill_extraction import extract_skills
+from src.utils.skill_matcher import SkillMatcher, build_skill_matcher
+from src.core.skill_registry import get_skill_registry
+
+from .test_orchestrator import CV_TEXT
+
+SAMPLE_PROFILES = Path(__file__).parents[2] / "data" / "json" / "sample_profiles.json"
+
+# Canonical skills the automaton finds that the old scan missed although
+# they were in its vocabulary: its trailing \b never matched after "c++" or
+# "c#", and "Next.js", "SQL Server" and "TailwindCSS" are registry aliases
+# of its "nextjs", "sqlserver" and "tailwind"
+NEW_ALIAS_HITS = {"c++", "c#", "next.js", "sql server", "tailwind"}
+
+
+def legacy_agent2_skills(text):
+    """CandidateExtractor._extract_skills before the automaton (reference, raw spellings)"""
+    text_lower = text.lower()
+    found = set()
+    for token in re.findall(r"\b[\w\+\#\./-]+\b", text_lower):
+        if token in CandidateExtractor.SKILLS_DATABASE:
+            found.add(CandidateExtractor.SKILL_SYNONYMS.get(token, token))
+    for skill in CandidateExtractor.SKILLS_DATABASE:
+        if (' ' in skill or '/' in skill) and skill in text_lower:
+            found.add(skill)
+    for pattern, name in [(r'\bnode\.?js\b', 'node.js'), (r'\bc\+\+\b', 'c++'),
+                          (r'\bc#\b', 'c#'), (r'\b\.net\b', 'asp.net')]:
+        if re.search(pattern, text_lower):
+            found.add(name)
+    return found
+
+
+@pytest.fixture(scope="module")
+def fixture_texts():
+    with open(SAMPLE_PROFILES, encoding="utf-8") as f:
+        profiles = [profile["text"] for profile in json.load(f)]
+    return [CV_TEXT] + profiles + SyntheticData(seed=7).cv_texts(100)
+
+
+class TestSkillMatcher:
+    """Test automaton semantics"""
+    
+    def test_word_boundaries(self):
+        """Terms only match as whole words"""
+        matcher = SkillMatcher({"java": "java", "go": "go", "r": "r"})
+        
+        assert matcher.find("JavaScript, Google, Rust") == set()
+        assert matcher.find("Java, Go and R") == {"java", "go", "r"}
+    
+    def test_symbol_terms(self):
+        """Terms starting/ending with symbols keep boundary semantics"""
+        matcher = SkillMatcher({"c++": "c++", "c#": "c#", ".net": "asp.net", "asp.net": "asp.net"})
+        
+        assert matcher.find("C++, C# and .NET") == {"c++", "c#", "asp.net"}
+        assert matcher.find("c++11") == set()
+    
+    def test_no_match_after_dot_in_word(self):
+        """A term does not start inside a dotted token ("js" in "Node.js")"""
+        matcher = SkillMatcher({"js": "javascript", "node.js": "node.js", ".net": "asp.net"})
+        
+        assert matcher.find("Node.js, Next.js and .NET") == {"node.js", "asp.net"}
+        assert matcher.find("JS. JS") == {"javascript"}
+    
+    def test_overlapping_terms(self):
+        """Shorter terms inside longer ones are reported too"""
+        matcher = SkillMatcher({t: t for t in ("react", "react native", "testing", "unit testing")})
+        
+        assert matcher.find("React  Native and unit\ntesting") == {
+            "react", "react native", "testing", "unit testing"
+        }
+    
+    def test_vocabulary_wins_over_aliases(self):
+        """Dictionary spellings take precedence over alias targets"""
+        matcher = build_skill_matcher({"github"}, aliases={"github": "git", "gitlab": "git"})
+        
+        assert matcher.find("GitHub and GitLab") == {"github", "git"}
+
+
+class TestExtractorParity:
+    """Test parity with the previous extractors on fixture CVs"""
+    
+    def test_agent2_matches_legacy(self, fixture_texts):
+        """Same skills as the old Agent 2 scan (by canonical name), apart from registry-only skills and NEW_ALIAS_HITS"""
+        extractor = CandidateExtractor()
+        registry = get_skill_registry()
+        legacy_vocabulary = {
+            registry.canonical(skill)
+            for skill in set(CandidateExtractor.SKILLS_DATABASE) | set(CandidateExtractor.SKILL_SYNONYMS.values())
+        }
+        for text in fixture_texts:
+            legacy = {registry.canonical(skill) for skill in legacy_agent2_skills(text)}
+            found = set(extractor._extract_skills(text))
+            
+            assert legacy <= found
+            assert found - legacy <= (found - legacy_vocabulary) | NEW_ALIAS_HITS
+    
+    def test_agent2_fixture_cv(self):
+        """Skills of the orchestrator fixture CV"""
+        skills = CandidateExtractor()._extract_skills(CV_TEXT)
+        
+        assert {"python", "fastapi", "postgresql", "docker", "git", "linux"} <= set(skills)
+        assert skills == sorted(skills)
+    
+    def test_utils_extract_skills(self):
+        """utils.extract_skills keeps abbreviations and custom skills"""
+        skills = extract_skills("ML engineer: Python, K8s, Flink, C++", custom_skills=["Flink"])
+        
+        assert skills == ["c++", "flink", "kubernetes", "machine learning", "python"]
+    
+    def test_utils_extract_skills_uses_registry(self):
+        """utils.extract_skills and Agent 2 share the registry vocabulary and names"""
+        text = "EDUCATION\nGitHub, NodeJS, Tableau and finance"
+        
+        assert extract_skills(text) == sorted(get_skill_registry().matcher().find(text))
+        assert extract_skills(text) == ["finance", "git", "node.js", "tableau"]
@@ -0,0 +1,147 @@
+"""
+Unit tests for the shared canonical skill registry
+"""
+import pytest
+
+from src.agents.agent3_scorer import HybridScoringAgent
+from src.core.skill_registry import SkillRegistry, get_skill_registry
+from src.storage.models import CVProfile
+from src.utils.skill_extraction import normalize_skill_name
+
+from .test_orchestrator import make_job
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return get_skill_registry()
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    agent = HybridScoringAgent()
+    agent.ml_predictor = None
+    return agent
+
+
+class TestSkillRegistry:
+    """Test IDs, aliases, categories and families"""
+    
+    def test_aliases_share_an_id(self, registry):
+        """Spellings from every source resolve to one canonical skill"""
+        assert registry.id_of("JS") == registry.id_of("javascript") == registry.id_of("ECMAScript")
+        assert registry.canonical("Amazon  Web Services") == "aws"
+        assert registry.canonical("NodeJS") == registry.canonical("node.js") == "node.js"
+        assert registry.canonical("k8s") == "kubernetes"
+    
+    def test_categories(self, registry):
+        """Categories come from skills_canonical.json, then the Agent 2 vocabulary"""
+        assert registry.category("python") == "programming_languages"
+        assert registry.category("figma") == "design"
+        assert registry.category("cobol-85") == "other"
+    
+    def test_families(self, registry):
+        """Related skills share a family root; distinct skills do not"""
+        family = lambda skill: registry.family(registry.intern(skill))
+        
+        assert family("mysql") == family("postgresql") == family("sql")
+        assert family("python") != family("java")
+    
+    def test_intern_unknown_skills(self):
+        """Unknown skills get a stable ID on first sight"""
+        registry = SkillRegistry.build()
+        skill_id = registry.intern("Quantum Basket Weaving")
+        
+        assert registry.intern("quantum basket weaving ") == skill_id
+        assert registry.name(skill_id) == "quantum basket weaving"
+    
+    def test_normalize_skill_name(self):
+        """Aliases map to registry names; unknown skills are normalized without being registered"""
+        registry = get_skill_registry()
+        size = len(registry)
+        
+        assert [normalize_skill_name(s) for s in ("Amazon Web Services", "aws", "GCP", "k8s", "NLP")] == [
+            "aws", "aws", "gcp", "kubernetes", "nlp"
+        ]
+        assert normalize_skill_name("  Underwater  Origami ") == "underwater origami"
+        assert len(registry) == size
+    
+    def test_adhoc_skills_are_capped(self):
+        """Past the cap unknown skills get no ID and the registry stops growing"""
+        registry = SkillRegistry.build(max_adhoc_skills=1)
+        size = len(registry)
+        kept = registry.intern("Quantum Basket Weaving")
+        
+        assert registry.intern("Underwater Origami") is None
+        assert registry.intern_all(["Underwater Origami", "Quantum Basket Weaving", "python"]) == {
+            kept, registry.id_of("python")
+        }
+        assert registry.canonical("Underwater  Origami") == "underwater origami"
+        assert len(registry) == size + 1
+    
+    def test_unknown_skill_keeps_matcher(self):
+        """Interning a skill that is not extractable does not rebuild the automaton"""
+        registry = SkillRegistry.build()
+        matcher = registry.matcher()
+        registry.intern("some unknown skill xyz")
+        
+        assert registry.matcher() is matcher
+    
+    def test_normalizer_memo(self):
+        """Repeated spellings hit the LRU memo and share one interned name"""
+        registry = SkillRegistry.build(cache_size=2)
+        before = registry.cache_stats()
+        
+        first = registry.canonical("Machine " + "Learning")
+        second = registry.canonical("Machine Learning")
+        registry.intern("a")
+        registry.intern("b")  # Evicts "Machine Learning"
+        
+        stats = registry.cache_stats()
+        assert first is second
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 3
+        assert stats["size"] == 2
+    
+    def test_matcher_reports_canonical_names(self, registry):
+        """The extraction automaton reports registry names, not raw spellings"""
+        assert registry.matcher().find("GitHub, Google Cloud and NodeJS") == {"git", "gcp", "node.js"}
+
+
+class TestScorerSkills:
+    """Test Agent 3 skill scoring through the registry"""
+    
+    def test_distinct_skills_do_not_match(self, scorer):
+        """Skills in the same skills_canonical.json category are not interchangeable"""
+        cv = CVProfile(cv_id="cv", file_name="cv.txt", skills=["Python"])
+        job = make_job("job", "Developer", ["java"])
+        
+        assert scorer._score_skills(cv, job).matched_skills == []
+        assert scorer.skill_registry.canonical("Python") == "python"
+    
+    def test_aliases_and_families_match(self, scorer):
+        """Aliases and related skills satisfy requirements"""
+        cv = CVProfile(cv_id="cv", file_name="cv.txt", skills=["JS", "PostgreSQL", "Docker"])
+        job = make_job("job", "Developer", ["javascript", "sql", "rust"])
+        match = scorer._score_skills(cv, job)
+        
+        assert match.matched_skills == ["javascript", "sql"]
+        assert match.missing_skills == ["rust"]
+        assert match.extra_skills == ["docker", "postgresql"]
+    
+    def test_job_and_cv_skills_normalized_once(self, scorer, monkeypatch):
+        """Catalog and CV skill IDs are computed once and reused for every match"""
+        cv = CVProfile(cv_id="cv", file_name="cv.txt", skills=["JS", "Docker"])
+        jobs = [make_job(f"job{i}", "Developer", ["javascript", "docker"]) for i in range(3)]
+        scorer.prepare_jobs(jobs)
+        
+        calls = []
+        intern_all = scorer.skill_registry.intern_all
+        monkeypatch.setattr(
+            scorer.skill_registry, "intern_all",
+            lambda skills: calls.append(skills) or intern_all(skills)
+        )
+        for job in jobs:
+            scorer._score_skills(cv, job)
+        
+        assert calls == [["JS", "Docker"]]
+        assert jobs[0]._skill_ids == (scorer.cv_skill_ids(cv), frozenset())
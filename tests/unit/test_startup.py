@@ -0,0 +1,109 @@
+"""
+Unit tests for lazy imports, pipeline warm-up and the background LLM probe
+"""
+import copy
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.agents.agent4_llm_explainer import LLMExplainerAgent
+from src.agents.parse_pool import close_parse_pools
+from src.core.config import get_config
+from src.core.orchestrator import MatchingPipeline
+
+
+@pytest.fixture
+def config():
+    config = copy.deepcopy(get_config())
+    config.llm.enabled = True
+    config.llm.probe_interval_seconds = 0.01
+    return config
+
+
+class TestColdStart:
+    """Test that importing the API stays cheap"""
+    
+    def test_api_import_defers_heavy_modules(self):
+        """Parsing, ML and NLP libraries are imported on first use"""
+        heavy = ("fitz", "docx", "pdfminer", "pandas", "joblib", "nltk")
+        code = (
+            "import sys, src.api\n"
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+    
+    def test_api_import_builds_no_pipeline(self):
+        """The pipeline and database are created at startup, not on import"""
+        code = (
+            "import src.api, src.storage.database as database\n"
+            "print(src.api._pipeline is None and database._db is None)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=60)
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "True"
+    
+    def test_warm_up_reports_steps(self, config):
+        """Warm-up loads the model, compiles the matcher and marks the pipeline ready"""
+        config.llm.enabled = False
+        pipeline = MatchingPipeline(config=config, save_to_db=False)
+        
+        assert not pipeline.ready
+        timings = pipeline.warm_up()
+        
+        assert pipeline.ready
+        assert {"ml_model", "skill_matcher", "llm_probe"} <= set(timings)
+        assert pipeline.agent3._ml_pending is False
+    
+    def test_warm_up_starts_parse_workers(self, config):
+        """With worker processes enabled, warm-up starts them before the first upload"""
+        config.llm.enabled = False
+        config.parsing.worker_processes = 1
+        pipeline = MatchingPipeline(config=config, save_to_db=False)
+        try:
+            timings = pipeline.warm_up()
+            
+            assert "parse_pool" in timings
+            assert pipeline.agent1.worker_pool.stats["started"] == 1
+            pipeline.agent1.parse_bytes(b"Jane Roe\nSKILLS\nPython\n", "cv.txt")
+            assert pipeline.agent1.worker_pool.stats["started"] == 1
+        finally:
+            close_parse_pools()
+
+
+class TestLLMProbe:
+    """Test Ollama availability checks off the request path"""
+    
+    def test_background_probe_rechecks(self, config, monkeypatch):
+        """The probe thread picks up Ollama coming and going"""
+        state = {"up": True}
+        monkeypatch.setattr(LLMExplainerAgent, "_check_llm_availability", lambda self: state["up"])
+        agent = LLMExplainerAgent(config)
+        agent.start_probe()
+        try:
+            deadline = time.monotonic() + 5
+            while not agent.llm_available and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert agent.llm_available
+            
+            state["up"] = False
+            while agent.llm_available and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert not agent.llm_available
+        finally:
+            agent.stop_probe()
+    
+    def test_probe_runs_once_without_thread(self, config, monkeypatch):
+        """Without a running probe, the first read checks synchronously once"""
+        calls = []
+        monkeypatch.setattr(LLMExplainerAgent, "_check_llm_availability", lambda self: calls.append(1) or True)
+        agent = LLMExplainerAgent(config)
+        
+        assert calls == []
+        assert agent.llm_available and agent.llm_available
+        assert calls == [1]